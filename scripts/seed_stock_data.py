@@ -37,11 +37,11 @@ import time
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, exists, func, select
 from sqlalchemy.orm import Session
 
 from shared.database.models import Stock, StockPrice, FundamentalIndicator
-from shared.database.connection import get_database_url, get_db_session
+from shared.database.connection import get_db_session
 from services.data_collector.stock_code_collector import StockCodeCollector
 from services.data_collector.price_collector import PriceCollector
 from services.data_collector.fundamental_collector import FundamentalCollector
@@ -168,13 +168,14 @@ class DataSeeder:
         Returns:
             Number of price records
         """
-        stock = self.check_stock_exists(ticker, session)
-        if not stock:
-            return 0
-
-        stmt = select(StockPrice).where(StockPrice.stock_id == stock.id)
-        result = session.execute(stmt)
-        return len(result.scalars().all())
+        # Count in the database instead of loading every price row
+        stmt = (
+            select(func.count())
+            .select_from(StockPrice)
+            .join(Stock, Stock.id == StockPrice.stock_id)
+            .where(Stock.ticker == ticker)
+        )
+        return session.execute(stmt).scalar_one()
 
     def check_fundamental_data_exists(self, ticker: str, session: Session) -> bool:
         """
@@ -187,13 +188,12 @@ class DataSeeder:
         Returns:
             True if fundamental data exists, False otherwise
         """
-        stock = self.check_stock_exists(ticker, session)
-        if not stock:
-            return False
-
-        stmt = select(FundamentalIndicator).where(FundamentalIndicator.stock_id == stock.id)
-        result = session.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        stmt = select(
+            exists()
+            .where(FundamentalIndicator.stock_id == Stock.id)
+            .where(Stock.ticker == ticker)
+        )
+        return session.execute(stmt).scalar_one()
 
     def seed_stock_metadata(self, tickers: List[str]) -> Dict[str, bool]:
         """
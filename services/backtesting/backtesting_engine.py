@@ -63,6 +63,9 @@ class BacktestConfig:
     max_sector_concentration: float = 0.30  # Max 30% in one sector
     max_correlation: float = 0.70  # Max correlation between positions
 
+    # Data source
+    parquet_path: Optional[str] = None  # Read prices/indicators from export_to_parquet output
+
     def __post_init__(self):
         """Validate configuration"""
         if self.start_date >= self.end_date:
@@ -142,7 +145,7 @@ class BacktestingEngine:
             db_session: Database session (optional)
         """
         self.config = config
-        self.data_loader = BacktestDataLoader(db_session)
+        self.data_loader = BacktestDataLoader(db_session, parquet_path=config.parquet_path)
         self.commission_calc = CommissionCalculator()
 
         # State tracking
@@ -5,10 +5,14 @@ Efficiently loads historical price data, technical indicators, and fundamental
 indicators from the database for backtesting purposes.
 """
 
-from datetime import datetime, timedelta
+import os
+import shutil
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 from typing import List, Optional, Dict, Tuple
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 from sqlalchemy import select, and_
 from sqlalchemy.orm import Session
 
@@ -22,19 +26,201 @@ from shared.database.models import (
 from shared.database.connection import get_db_session
 
 
+# Indicator columns loaded for backtests when none are requested explicitly
+TECHNICAL_INDICATOR_COLUMNS = (
+    "rsi_14",
+    "macd",
+    "macd_signal",
+    "macd_histogram",
+    "sma_20",
+    "sma_50",
+    "sma_200",
+    "ema_12",
+    "ema_26",
+    "bollinger_upper",
+    "bollinger_middle",
+    "bollinger_lower",
+    "atr",
+    "adx",
+    "obv",
+    "volume_ma_20",
+)
+
+# Price columns kept in the Parquet price dataset
+PRICE_COLUMNS = (
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "adjusted_close",
+    "change_pct",
+)
+
+# Parquet dataset directories written by export_to_parquet
+PRICE_DATASET = "prices"
+TECHNICAL_DATASET = "technical_indicators"
+
+# Rows fetched from the database per Parquet write
+EXPORT_CHUNK_SIZE = 100_000
+
+
+# Arrow types for the Python types of the exported columns
+ARROW_TYPES = {
+    int: pa.int64(),
+    float: pa.float64(),
+    Decimal: pa.float64(),
+    date: pa.timestamp("ns"),
+    datetime: pa.timestamp("ns"),
+    bool: pa.bool_(),
+    str: pa.string(),
+}
+
+
+def _arrow_schema(query) -> pa.Schema:
+    """
+    Arrow schema for the columns selected by an export query
+
+    Every chunk is written with this schema, so a column that happens to be
+    all NULL in one chunk is not stored as the ``null`` type.
+    """
+    fields = []
+    for column in query.selected_columns:
+        # TypeDecorators (TradingDate, WholeWon) report their impl's type
+        column_type = getattr(column.type, "impl_instance", column.type)
+        fields.append(pa.field(column.name, ARROW_TYPES[column_type.python_type]))
+    return pa.schema(fields)
+
+
+def export_to_parquet(session: Session, path: str) -> Dict[str, int]:
+    """
+    Export stock prices and technical indicators to Parquet datasets
+
+    Writes ``<path>/prices`` and ``<path>/technical_indicators``, each
+    partitioned by stock_id (``stock_id=<id>/*.parquet``). The database stays
+    the system of record; re-run the export after new data is collected.
+    Existing datasets under ``path`` are replaced only once the new one has
+    been written completely.
+
+    Args:
+        session: Database session
+        path: Directory to write the datasets to
+
+    Returns:
+        Number of rows written per dataset
+    """
+    # Every indicator column, so any ``indicators`` selection can be served
+    technical_columns = [
+        column
+        for column in TechnicalIndicator.__table__.c
+        if column.name not in ("id", "stock_id", "date", "created_at", "updated_at")
+    ]
+    # Stream each result instead of buffering whole tables client-side
+    exports = {
+        PRICE_DATASET: select(
+            StockPrice.stock_id,
+            StockPrice.date,
+            *(StockPrice.__table__.c[column] for column in PRICE_COLUMNS),
+        )
+        .order_by(StockPrice.stock_id, StockPrice.date)
+        .execution_options(stream_results=True),
+        TECHNICAL_DATASET: select(
+            TechnicalIndicator.stock_id,
+            TechnicalIndicator.date,
+            *technical_columns,
+        )
+        .order_by(TechnicalIndicator.stock_id, TechnicalIndicator.date)
+        .execution_options(stream_results=True),
+    }
+
+    connection = session.connection()
+
+    counts = {}
+    for dataset, query in exports.items():
+        dataset_path = os.path.join(path, dataset)
+        staging_path = f"{dataset_path}.tmp"
+        shutil.rmtree(staging_path, ignore_errors=True)
+        os.makedirs(staging_path)
+        schema = _arrow_schema(query)
+
+        try:
+            counts[dataset] = 0
+            for chunk in pd.read_sql(query, connection, chunksize=EXPORT_CHUNK_SIZE):
+                chunk.to_parquet(
+                    staging_path, partition_cols=["stock_id"], index=False, schema=schema
+                )
+                counts[dataset] += len(chunk)
+        except Exception:
+            shutil.rmtree(staging_path, ignore_errors=True)
+            raise
+
+        # Swap the finished dataset in; readers never see a partial one
+        old_path = f"{dataset_path}.old"
+        shutil.rmtree(old_path, ignore_errors=True)
+        if os.path.exists(dataset_path):
+            os.rename(dataset_path, old_path)
+        os.rename(staging_path, dataset_path)
+        shutil.rmtree(old_path, ignore_errors=True)
+
+    return counts
+
+
 class BacktestDataLoader:
     """Load and prepare historical data for backtesting"""
 
-    def __init__(self, db_session: Optional[Session] = None):
+    def __init__(
+        self, db_session: Optional[Session] = None, parquet_path: Optional[str] = None
+    ):
         """
         Initialize data loader
 
         Args:
             db_session: Database session (optional, will create if not provided)
+            parquet_path: Directory written by export_to_parquet. When set,
+                prices and technical indicators are read from Parquet instead
+                of the database.
         """
         self.db_session = db_session or next(get_db_session())
+        self.parquet_path = parquet_path
         self._cache: Dict[str, pd.DataFrame] = {}
 
+    def _read_parquet(
+        self,
+        dataset: str,
+        stock_ids: List[int],
+        start_date: datetime,
+        end_date: datetime,
+        columns: List[str],
+    ) -> pd.DataFrame:
+        """
+        Read rows for the given stocks and date range from a Parquet dataset
+
+        Only the matching stock_id partitions and the requested columns are
+        read.
+
+        Args:
+            dataset: Dataset directory name under parquet_path
+            stock_ids: Stock IDs to read
+            start_date: Start date
+            end_date: End date
+            columns: Value columns to read
+
+        Returns:
+            DataFrame with date, stock_id and the requested columns
+        """
+        df = pd.read_parquet(
+            os.path.join(self.parquet_path, dataset),
+            columns=["date", "stock_id", *columns],
+            filters=[
+                ("stock_id", "in", list(stock_ids)),
+                ("date", ">=", pd.Timestamp(start_date)),
+                ("date", "<=", pd.Timestamp(end_date)),
+            ],
+        )
+        # Partition values come back as a categorical
+        df["stock_id"] = df["stock_id"].astype(int)
+        return df[["date", "stock_id", *columns]]
+
     def load_stock_universe(
         self, markets: Optional[List[str]] = None, sectors: Optional[List[str]] = None
     ) -> pd.DataFrame:
@@ -61,7 +247,7 @@ class BacktestDataLoader:
         df = pd.DataFrame(
             [
                 {
-                    "stock_id": s.stock_id,
+                    "stock_id": s.id,
                     "ticker": s.ticker,
                     "name": s.name_kr,
                     "market": s.market,
@@ -102,53 +288,46 @@ class BacktestDataLoader:
         # Get stock IDs
         stock_query = select(Stock).where(Stock.ticker.in_(tickers))
         stocks = self.db_session.execute(stock_query).scalars().all()
-        stock_map = {s.ticker: s.stock_id for s in stocks}
+        stock_map = {s.ticker: s.id for s in stocks}
 
         if not stock_map:
             return pd.DataFrame()
 
-        # Load price data
-        price_query = (
-            select(StockPrice)
-            .where(
-                and_(
-                    StockPrice.stock_id.in_(stock_map.values()),
-                    StockPrice.date >= start_date,
-                    StockPrice.date <= end_date,
-                )
+        columns = list(PRICE_COLUMNS)
+        if self.parquet_path:
+            df = self._read_parquet(
+                PRICE_DATASET, list(stock_map.values()), start_date, end_date, columns
             )
-            .order_by(StockPrice.date, StockPrice.stock_id)
-        )
-
-        result = self.db_session.execute(price_query)
-        prices = result.scalars().all()
-
-        # Convert to DataFrame using vectorized operations
-        data = []
-        ticker_reverse_map = {v: k for k, v in stock_map.items()}
-
-        for p in prices:
-            ticker = ticker_reverse_map.get(p.stock_id)
-            if ticker:
-                data.append(
-                    {
-                        "date": p.date,
-                        "ticker": ticker,
-                        "open": p.open,
-                        "high": p.high,
-                        "low": p.low,
-                        "close": p.close,
-                        "volume": p.volume,
-                        "adjusted_close": p.adjusted_close or p.close,
-                        "change_pct": p.change_pct or 0.0,
-                    }
+        else:
+            # Load price data
+            price_query = (
+                select(
+                    StockPrice.date,
+                    StockPrice.stock_id,
+                    *(StockPrice.__table__.c[column] for column in columns),
                 )
+                .where(
+                    and_(
+                        StockPrice.stock_id.in_(stock_map.values()),
+                        StockPrice.date >= start_date,
+                        StockPrice.date <= end_date,
+                    )
+                )
+                .order_by(StockPrice.date, StockPrice.stock_id)
+            )
 
-        df = pd.DataFrame(data)
+            rows = self.db_session.execute(price_query).all()
+            df = pd.DataFrame(rows, columns=["date", "stock_id", *columns])
 
         if df.empty:
             return df
 
+        df["adjusted_close"] = df["adjusted_close"].astype(float).fillna(df["close"])
+        df["change_pct"] = df["change_pct"].astype(float).fillna(0.0)
+
+        ticker_reverse_map = {v: k for k, v in stock_map.items()}
+        df["ticker"] = df.pop("stock_id").map(ticker_reverse_map)
+
         # Set multi-index for efficient lookups
         df = df.set_index(["date", "ticker"]).sort_index()
 
@@ -163,82 +342,74 @@ class BacktestDataLoader:
         start_date: datetime,
         end_date: datetime,
         cache: bool = True,
+        indicators: Optional[List[str]] = None,
     ) -> pd.DataFrame:
         """
         Load technical indicators for multiple tickers
 
+        Only the requested indicator columns are selected, so a strategy that
+        needs e.g. sma_20 and rsi_14 does not pull every indicator per row.
+
         Args:
             tickers: List of stock tickers
             start_date: Start date
             end_date: End date
             cache: Whether to cache the data
+            indicators: technical_indicators columns to load
+                (default: TECHNICAL_INDICATOR_COLUMNS)
 
         Returns:
             DataFrame with multi-index (date, ticker) and technical indicator columns
         """
-        cache_key = f"tech_{','.join(sorted(tickers))}_{start_date}_{end_date}"
+        columns = list(indicators or TECHNICAL_INDICATOR_COLUMNS)
+        for column in columns:
+            if column not in TechnicalIndicator.__table__.c:
+                raise ValueError(f"Unknown technical indicator: {column!r}")
+
+        cache_key = f"tech_{','.join(sorted(tickers))}_{','.join(columns)}_{start_date}_{end_date}"
         if cache and cache_key in self._cache:
             return self._cache[cache_key].copy()
 
         # Get stock IDs
         stock_query = select(Stock).where(Stock.ticker.in_(tickers))
         stocks = self.db_session.execute(stock_query).scalars().all()
-        stock_map = {s.ticker: s.stock_id for s in stocks}
+        stock_map = {s.ticker: s.id for s in stocks}
 
         if not stock_map:
             return pd.DataFrame()
 
-        # Load technical indicators
-        tech_query = (
-            select(TechnicalIndicator)
-            .where(
-                and_(
-                    TechnicalIndicator.stock_id.in_(stock_map.values()),
-                    TechnicalIndicator.date >= start_date,
-                    TechnicalIndicator.date <= end_date,
+        if self.parquet_path:
+            df = self._read_parquet(
+                TECHNICAL_DATASET, list(stock_map.values()), start_date, end_date, columns
+            )
+        else:
+            # Load technical indicators
+            tech_query = (
+                select(
+                    TechnicalIndicator.date,
+                    TechnicalIndicator.stock_id,
+                    *(TechnicalIndicator.__table__.c[column] for column in columns),
+                )
+                .where(
+                    and_(
+                        TechnicalIndicator.stock_id.in_(stock_map.values()),
+                        TechnicalIndicator.date >= start_date,
+                        TechnicalIndicator.date <= end_date,
+                    )
                 )
+                .order_by(TechnicalIndicator.date, TechnicalIndicator.stock_id)
             )
-            .order_by(TechnicalIndicator.date, TechnicalIndicator.stock_id)
-        )
-
-        result = self.db_session.execute(tech_query)
-        indicators = result.scalars().all()
-
-        # Convert to DataFrame
-        data = []
-        ticker_reverse_map = {v: k for k, v in stock_map.items()}
 
-        for ind in indicators:
-            ticker = ticker_reverse_map.get(ind.stock_id)
-            if ticker:
-                data.append(
-                    {
-                        "date": ind.date,
-                        "ticker": ticker,
-                        "rsi_14": ind.rsi_14,
-                        "macd": ind.macd,
-                        "macd_signal": ind.macd_signal,
-                        "macd_histogram": ind.macd_histogram,
-                        "sma_20": ind.sma_20,
-                        "sma_50": ind.sma_50,
-                        "sma_200": ind.sma_200,
-                        "ema_12": ind.ema_12,
-                        "ema_26": ind.ema_26,
-                        "bollinger_upper": ind.bollinger_upper,
-                        "bollinger_middle": ind.bollinger_middle,
-                        "bollinger_lower": ind.bollinger_lower,
-                        "atr": ind.atr,
-                        "adx": ind.adx,
-                        "obv": ind.obv,
-                        "volume_ma_20": ind.volume_ma_20,
-                    }
-                )
+            rows = self.db_session.execute(tech_query).all()
 
-        df = pd.DataFrame(data)
+            # Build the frame straight from the result rows
+            df = pd.DataFrame(rows, columns=["date", "stock_id", *columns])
 
         if df.empty:
             return df
 
+        ticker_reverse_map = {v: k for k, v in stock_map.items()}
+        df["ticker"] = df.pop("stock_id").map(ticker_reverse_map)
         df = df.set_index(["date", "ticker"]).sort_index()
 
         if cache:
@@ -272,7 +443,7 @@ class BacktestDataLoader:
         # Get stock IDs
         stock_query = select(Stock).where(Stock.ticker.in_(tickers))
         stocks = self.db_session.execute(stock_query).scalars().all()
-        stock_map = {s.ticker: s.stock_id for s in stocks}
+        stock_map = {s.ticker: s.id for s in stocks}
 
         if not stock_map:
             return pd.DataFrame()
@@ -361,7 +532,7 @@ class BacktestDataLoader:
         # Get stock IDs
         stock_query = select(Stock).where(Stock.ticker.in_(tickers))
         stocks = self.db_session.execute(stock_query).scalars().all()
-        stock_map = {s.ticker: s.stock_id for s in stocks}
+        stock_map = {s.ticker: s.id for s in stocks}
 
         if not stock_map:
             return pd.DataFrame()
@@ -9,11 +9,11 @@ from typing import Optional, Dict, List
 import logging
 import pandas as pd
 from pykrx import stock as pykrx_stock
-from sqlalchemy import and_
 
 # Add shared directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from shared.database.bulk import bulk_upsert
 from shared.database.models import Stock, FundamentalIndicator
 from services.data_collector.db_session import get_db_session
 from services.data_collector.utils import (
@@ -253,7 +253,6 @@ class FundamentalCollector:
                         # Also update the stock table with market cap and shares
                         stock.market_cap = fund_data.get('market_cap')
                         stock.listed_shares = fund_data.get('listed_shares')
-                        stock.updated_at = datetime.utcnow()
                     else:
                         stats['failed'] += 1
 
@@ -305,38 +304,23 @@ class FundamentalCollector:
                     logger.error(f"Stock {ticker} not found in database")
                     return False
 
-                # Check if fundamental record already exists
-                existing = db.query(FundamentalIndicator).filter(
-                    and_(
-                        FundamentalIndicator.stock_id == stock.id,
-                        FundamentalIndicator.date == fund_date
-                    )
-                ).first()
-
-                if existing:
-                    # Update existing record
-                    existing.per = fund_data.get('per')
-                    existing.pbr = fund_data.get('pbr')
-                    existing.eps = fund_data.get('eps')
-                    existing.bps = fund_data.get('bps')
-                    existing.dividend_yield = fund_data.get('div_yield')
-                    existing.dps = fund_data.get('dps')
-                    existing.updated_at = datetime.utcnow()
-                    logger.debug(f"Updated fundamental data for {ticker}")
-                else:
-                    # Create new record
-                    new_fund = FundamentalIndicator(
-                        stock_id=stock.id,
-                        date=fund_date,
-                        per=fund_data.get('per'),
-                        pbr=fund_data.get('pbr'),
-                        eps=fund_data.get('eps'),
-                        bps=fund_data.get('bps'),
-                        dividend_yield=fund_data.get('div_yield'),
-                        dps=fund_data.get('dps')
-                    )
-                    db.add(new_fund)
-                    logger.debug(f"Added fundamental data for {ticker}")
+                # Insert, or update the existing record for this date, in one statement
+                bulk_upsert(
+                    db,
+                    FundamentalIndicator,
+                    [{
+                        'stock_id': stock.id,
+                        'date': fund_date,
+                        'per': fund_data.get('per'),
+                        'pbr': fund_data.get('pbr'),
+                        'eps': fund_data.get('eps'),
+                        'bps': fund_data.get('bps'),
+                        'dividend_yield': fund_data.get('div_yield'),
+                        'dps': fund_data.get('dps'),
+                    }],
+                    conflict_columns=('stock_id', 'date')
+                )
+                logger.debug(f"Saved fundamental data for {ticker}")
 
                 db.commit()
                 return True
@@ -9,13 +9,13 @@ from typing import Optional, List
 import logging
 import pandas as pd
 from decimal import Decimal
-from sqlalchemy import and_
 import FinanceDataReader as fdr
 from pykrx import stock as pykrx_stock
 
 # Add shared directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from shared.database.bulk import bulk_upsert
 from shared.database.models import Stock, StockPrice
 from services.data_collector.db_session import get_db_session
 from services.data_collector.utils import (
@@ -247,8 +247,6 @@ class PriceCollector:
         Returns:
             Number of records saved
         """
-        count = 0
-
         with get_db_session() as db:
             # Get stock_id
             stock = db.query(Stock).filter(Stock.ticker == ticker).first()
@@ -257,21 +255,15 @@ class PriceCollector:
                 logger.error(f"Stock {ticker} not found in database")
                 return 0
 
+            # Parse all rows first so they can be written in one statement
+            prices = {}
             for _, row in df.iterrows():
                 try:
                     # Parse date
                     if isinstance(row['Date'], str):
                         price_date = datetime.strptime(row['Date'], '%Y-%m-%d')
                     else:
-                        price_date = pd.to_datetime(row['Date'])
-
-                    # Check if price record already exists
-                    existing = db.query(StockPrice).filter(
-                        and_(
-                            StockPrice.stock_id == stock.id,
-                            StockPrice.date == price_date
-                        )
-                    ).first()
+                        price_date = pd.to_datetime(row['Date']).to_pydatetime()
 
                     # Extract price values
                     open_price = safe_float_conversion(row.get('Open', 0))
@@ -290,46 +282,37 @@ class PriceCollector:
                     if change_pct is None and open_price > 0:
                         change_pct = ((close_price - open_price) / open_price) * 100
 
-                    if existing:
-                        # Update existing record
-                        existing.open = Decimal(str(open_price))
-                        existing.high = Decimal(str(high_price))
-                        existing.low = Decimal(str(low_price))
-                        existing.close = Decimal(str(close_price))
-                        existing.volume = volume
-                        existing.trading_value = trading_value
-                        existing.change_pct = safe_float_conversion(change_pct)
-                        existing.adjusted_close = Decimal(str(row.get('Adj Close', close_price)))
-                    else:
-                        # Create new record
-                        new_price = StockPrice(
-                            stock_id=stock.id,
-                            date=price_date,
-                            open=Decimal(str(open_price)),
-                            high=Decimal(str(high_price)),
-                            low=Decimal(str(low_price)),
-                            close=Decimal(str(close_price)),
-                            volume=volume,
-                            trading_value=trading_value,
-                            change_pct=safe_float_conversion(change_pct),
-                            adjusted_close=Decimal(str(row.get('Adj Close', close_price)))
-                        )
-                        db.add(new_price)
-
-                    count += 1
-
-                    # Commit in batches
-                    if count % 100 == 0:
-                        db.commit()
+                    prices[price_date] = {
+                        'open': round(open_price),
+                        'high': round(high_price),
+                        'low': round(low_price),
+                        'close': round(close_price),
+                        'volume': volume,
+                        'trading_value': trading_value,
+                        'change_pct': safe_float_conversion(change_pct),
+                        'adjusted_close': Decimal(str(row.get('Adj Close', close_price))),
+                    }
 
                 except Exception as e:
                     logger.error(f"Error saving price record for {ticker} on {row.get('Date')}: {e}")
                     continue
 
-            # Final commit
+            if not prices:
+                return 0
+
+            # Existing records for the same dates are updated in the same statement
+            bulk_upsert(
+                db,
+                StockPrice,
+                [
+                    {'stock_id': stock.id, 'date': price_date, **values}
+                    for price_date, values in prices.items()
+                ],
+                conflict_columns=('stock_id', 'date')
+            )
             db.commit()
 
-        return count
+        return len(prices)
 
     def get_last_price_date(self, ticker: str) -> Optional[datetime]:
         """
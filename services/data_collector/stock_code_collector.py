@@ -172,7 +172,6 @@ class StockCodeCollector:
                         existing_stock.sector = row.get('Sector', existing_stock.sector)
                         existing_stock.industry = row.get('Industry', existing_stock.industry)
                         existing_stock.is_active = True
-                        existing_stock.updated_at = datetime.utcnow()
 
                         if details:
                             existing_stock.market_cap = details.get('market_cap')
@@ -260,7 +259,6 @@ class StockCodeCollector:
                                 existing_stock.sector = row.get('Sector', existing_stock.sector)
                                 existing_stock.industry = row.get('Industry', existing_stock.industry)
                                 existing_stock.is_active = True
-                                existing_stock.updated_at = datetime.utcnow()
 
                                 if details:
                                     existing_stock.market_cap = details.get('market_cap')
@@ -332,7 +330,6 @@ class StockCodeCollector:
                     if details:
                         stock.market_cap = details.get('market_cap')
                         stock.listed_shares = details.get('listed_shares')
-                        stock.updated_at = datetime.utcnow()
                         count += 1
 
                         # Commit in batches
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import desc, and_
 import logging
 
+from shared.database.bulk import bulk_upsert
 from shared.database.models import (
     Stock,
     StockPrice,
@@ -257,33 +258,10 @@ class FinancialDataRepository:
             if calculation_date is None:
                 calculation_date = datetime.utcnow()
 
-            # Check if indicators already exist for this date
-            existing = (
-                self.db.query(FundamentalIndicator)
-                .filter(
-                    and_(
-                        FundamentalIndicator.stock_id == stock_id,
-                        FundamentalIndicator.date == calculation_date.date()
-                    )
-                )
-                .first()
-            )
-
-            if existing:
-                # Update existing record
-                for key, value in indicators.items():
-                    if hasattr(existing, key):
-                        setattr(existing, key, value)
-                existing.updated_at = datetime.utcnow()
-                self.logger.info(f"Updated existing fundamental indicators for stock {stock_id}")
-            else:
-                # Create new record
-                fundamental = FundamentalIndicator(
-                    stock_id=stock_id,
-                    **indicators
-                )
-                self.db.add(fundamental)
-                self.logger.info(f"Created new fundamental indicators for stock {stock_id}")
+            # Insert, or update the row already stored for this stock and day
+            row = {**indicators, 'stock_id': stock_id, 'date': calculation_date}
+            bulk_upsert(self.db, FundamentalIndicator, [row], conflict_columns=('stock_id', 'date'))
+            self.logger.info(f"Saved fundamental indicators for stock {stock_id}")
 
             self.db.commit()
             return True
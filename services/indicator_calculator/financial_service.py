@@ -8,7 +8,7 @@ from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
 import logging
 
-from shared.database.connection import SessionLocal
+from shared.database.connection import BulkSession
 from shared.database.models import Stock
 from services.indicator_calculator.financial_calculator import (
     FinancialCalculator,
@@ -311,7 +311,7 @@ def run_daily_calculation():
     """
     logger.info("Starting daily financial indicator calculation")
 
-    db = SessionLocal()
+    db = BulkSession()
     try:
         service = FinancialIndicatorService(db_session=db)
         stats = service.calculate_indicators_for_all_stocks(only_missing=False)
@@ -12,7 +12,7 @@ import sys
 import logging
 from datetime import datetime
 
-from shared.database.connection import SessionLocal
+from shared.database.connection import BulkSession
 from services.indicator_calculator.financial_service import FinancialIndicatorService
 
 # Configure logging
@@ -73,7 +73,7 @@ def main():
             sys.exit(1)
 
     # Create database session
-    db = SessionLocal()
+    db = BulkSession()
 
     try:
         # Create service
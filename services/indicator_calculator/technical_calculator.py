@@ -141,15 +141,15 @@ class TechnicalIndicatorCalculator:
 
             # Simple Moving Averages
             if len(df) >= 5:
-                result['sma_5'] = self._safe_round(prices.rolling(window=5).mean().iloc[-1])
+                result['sma_5'] = self._safe_round(self._last_window_mean(prices, 5))
             if len(df) >= 20:
-                result['sma_20'] = self._safe_round(prices.rolling(window=20).mean().iloc[-1])
+                result['sma_20'] = self._safe_round(self._last_window_mean(prices, 20))
             if len(df) >= 50:
-                result['sma_50'] = self._safe_round(prices.rolling(window=50).mean().iloc[-1])
+                result['sma_50'] = self._safe_round(self._last_window_mean(prices, 50))
             if len(df) >= 120:
-                result['sma_120'] = self._safe_round(prices.rolling(window=120).mean().iloc[-1])
+                result['sma_120'] = self._safe_round(self._last_window_mean(prices, 120))
             if len(df) >= 200:
-                result['sma_200'] = self._safe_round(prices.rolling(window=200).mean().iloc[-1])
+                result['sma_200'] = self._safe_round(self._last_window_mean(prices, 200))
 
             # Exponential Moving Averages
             if len(df) >= 12:
@@ -228,14 +228,16 @@ class TechnicalIndicatorCalculator:
             if len(prices) < period + 1:
                 return None
 
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+            # Only the last ``period`` changes contribute to the final value
+            delta = np.diff(prices.to_numpy(dtype=float)[-(period + 1):])
+            gain = np.clip(delta, 0, None).mean()
+            loss = np.clip(-delta, 0, None).mean()
 
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rs = np.divide(gain, loss)
+                rsi = 100 - (100 / (1 + rs))
 
-            return self._safe_round(rsi.iloc[-1])
+            return self._safe_round(rsi)
 
         except Exception as e:
             self.logger.error(f"Error in manual RSI calculation: {e}")
@@ -338,14 +340,15 @@ class TechnicalIndicatorCalculator:
                         result['bollinger_lower'] = self._safe_round(bbands[f'BBL_{period}_{std_dev}'].iloc[-1])
             else:
                 # Manual Bollinger Bands calculation
-                middle = prices.rolling(window=period).mean()
-                std = prices.rolling(window=period).std()
+                window = prices.iloc[-period:]
+                middle = window.mean(skipna=False)
+                std = window.std(skipna=False)
                 upper = middle + (std * std_dev)
                 lower = middle - (std * std_dev)
 
-                result['bollinger_upper'] = self._safe_round(upper.iloc[-1])
-                result['bollinger_middle'] = self._safe_round(middle.iloc[-1])
-                result['bollinger_lower'] = self._safe_round(lower.iloc[-1])
+                result['bollinger_upper'] = self._safe_round(upper)
+                result['bollinger_middle'] = self._safe_round(middle)
+                result['bollinger_lower'] = self._safe_round(lower)
 
             return result
 
@@ -382,20 +385,13 @@ class TechnicalIndicatorCalculator:
                     result['obv'] = self._safe_int(obv.iloc[-1])
             else:
                 # Manual OBV calculation
-                obv = pd.Series(0, index=df.index)
-                for i in range(1, len(df)):
-                    if df['close'].iloc[i] > df['close'].iloc[i-1]:
-                        obv.iloc[i] = obv.iloc[i-1] + df['volume'].iloc[i]
-                    elif df['close'].iloc[i] < df['close'].iloc[i-1]:
-                        obv.iloc[i] = obv.iloc[i-1] - df['volume'].iloc[i]
-                    else:
-                        obv.iloc[i] = obv.iloc[i-1]
-                result['obv'] = self._safe_int(obv.iloc[-1])
+                # Volume signed by the direction of each close-to-close move
+                direction = np.sign(df['close'].diff()).fillna(0)
+                result['obv'] = self._safe_int((direction * df['volume']).sum())
 
             # Volume Moving Average (20-day)
             if len(df) >= 20:
-                volume_ma = df['volume'].rolling(window=20).mean()
-                result['volume_ma_20'] = self._safe_int(volume_ma.iloc[-1])
+                result['volume_ma_20'] = self._safe_int(self._last_window_mean(df['volume'], 20))
 
             return result
 
@@ -613,6 +609,24 @@ class TechnicalIndicatorCalculator:
             indicator.errors.append(str(e))
             return indicator
 
+    @staticmethod
+    def _last_window_mean(values: pd.Series, window: int) -> float:
+        """
+        Mean of the trailing window, i.e. the last value of a rolling mean.
+
+        Only the final window is reduced, so the cost is O(window) rather
+        than a full rolling pass over the history. NaN inside the window
+        yields NaN, as rolling(window).mean() would.
+
+        Args:
+            values: Series to average
+            window: Window length
+
+        Returns:
+            Mean of the last ``window`` values
+        """
+        return values.iloc[-window:].mean(skipna=False)
+
     def _safe_round(self, value: Any, decimals: int = 2) -> Optional[float]:
         """
         Safely round a value to specified decimals.
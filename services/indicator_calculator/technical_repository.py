@@ -10,6 +10,7 @@ from sqlalchemy import desc, and_
 import logging
 import pandas as pd
 
+from shared.database.bulk import bulk_upsert
 from shared.database.models import (
     Stock,
     StockPrice,
@@ -104,8 +105,17 @@ class TechnicalDataRepository:
             start_date = as_of_date - timedelta(days=days)
 
             # Query price data
+            # Only columns covered by ix_stock_prices_stock_date, so the read can be index-only
             prices = (
-                self.db.query(StockPrice)
+                self.db.query(
+                    StockPrice.date,
+                    StockPrice.open,
+                    StockPrice.high,
+                    StockPrice.low,
+                    StockPrice.close,
+                    StockPrice.volume,
+                    StockPrice.adjusted_close
+                )
                 .filter(
                     and_(
                         StockPrice.stock_id == stock_id,
@@ -188,37 +198,15 @@ class TechnicalDataRepository:
             if calculation_date is None:
                 calculation_date = datetime.utcnow()
 
-            # Convert date to date object (no time component)
+            # Convert date to date object (no time component) so it matches the stored row
             calc_date = calculation_date.date() if hasattr(calculation_date, 'date') else calculation_date
 
-            # Check if indicators already exist for this date
-            existing = (
-                self.db.query(TechnicalIndicator)
-                .filter(
-                    and_(
-                        TechnicalIndicator.stock_id == stock_id,
-                        TechnicalIndicator.date == calc_date
-                    )
-                )
-                .first()
-            )
-
-            if existing:
-                # Update existing record
-                for key, value in indicators.items():
-                    if hasattr(existing, key) and key != 'date':
-                        setattr(existing, key, value)
-                self.logger.info(f"Updated existing technical indicators for stock {stock_id}")
-            else:
-                # Create new record
-                technical = TechnicalIndicator(
-                    stock_id=stock_id,
-                    **indicators
-                )
-                self.db.add(technical)
-                self.logger.info(f"Created new technical indicators for stock {stock_id}")
+            row = {'stock_id': stock_id, **indicators, 'date': calc_date}
 
+            # Replaces the stored indicators if this stock and date already exist
+            bulk_upsert(self.db, TechnicalIndicator, [row], conflict_columns=('stock_id', 'date'))
             self.db.commit()
+            self.logger.info(f"Saved technical indicators for stock {stock_id}")
             return True
 
         except Exception as e:
@@ -226,6 +214,33 @@ class TechnicalDataRepository:
             self.db.rollback()
             return False
 
+    def save_technical_indicators_batch(self, rows: List[Dict[str, Any]]) -> bool:
+        """
+        Save technical indicators for many stocks in one transaction.
+
+        Rows for a stock and date that already exist are updated in the same
+        INSERT ... ON CONFLICT statement.
+
+        Args:
+            rows: Indicator dictionaries, each including stock_id and date
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not rows:
+            return True
+
+        try:
+            bulk_upsert(self.db, TechnicalIndicator, rows, conflict_columns=('stock_id', 'date'))
+            self.db.commit()
+            self.logger.info(f"Saved technical indicators for {len(rows)} stocks")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error saving technical indicators for {len(rows)} stocks: {e}")
+            self.db.rollback()
+            return False
+
     def get_stocks_without_recent_indicators(
         self,
         days_threshold: int = 1
@@ -168,6 +168,10 @@ class TechnicalIndicatorService:
             skipped = 0
             errors = []
 
+            # Indicators are collected and written in one bulk insert at the end
+            indicator_rows = []
+            indicator_tickers = []
+
             for i, stock in enumerate(stocks, 1):
                 try:
                     self.logger.info(
@@ -187,10 +191,12 @@ class TechnicalIndicatorService:
                         stock.id,
                         days_history=days_history,
                         calculation_date=calculation_date,
-                        save_to_db=True
+                        save_to_db=False
                     )
 
                     if result:
+                        indicator_rows.append({'stock_id': stock.id, **result.to_dict()})
+                        indicator_tickers.append(stock.ticker)
                         successful += 1
                     else:
                         failed += 1
@@ -208,6 +214,16 @@ class TechnicalIndicatorService:
                         'error': str(e)
                     })
 
+            if not repository.save_technical_indicators_batch(indicator_rows):
+                self.logger.error(f"Failed to save technical indicators for {len(indicator_rows)} stocks")
+                # Nothing was written, so none of the calculated stocks succeeded
+                failed += successful
+                successful = 0
+                errors.extend(
+                    {'ticker': ticker, 'error': 'Failed to save technical indicators'}
+                    for ticker in indicator_tickers
+                )
+
             # Summary
             summary = {
                 'total_stocks': len(stocks),
@@ -2,11 +2,12 @@
 Configuration for the Orchestrator Service.
 """
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
+from pydantic_settings import BaseSettings
 
 
-class OrchestratorConfig(BaseModel):
-    """Configuration for orchestrator scheduling."""
+class OrchestratorConfig(BaseSettings):
+    """Configuration for orchestrator scheduling, overridable via ORCHESTRATOR_* env vars."""
 
     # Timezone
     timezone: str = Field(
@@ -87,6 +88,12 @@ class OrchestratorConfig(BaseModel):
         description="Maximum number of positions"
     )
 
+    # Backtest Parquet datasets (refreshed after indicator calculation)
+    parquet_export_path: Optional[str] = Field(
+        default=None,
+        description="Directory for export_to_parquet output; export is skipped when unset"
+    )
+
     # Enable/disable specific jobs
     enable_data_collection: bool = Field(
         default=True,
@@ -122,6 +129,7 @@ class OrchestratorConfig(BaseModel):
         env_prefix = "ORCHESTRATOR_"
         env_file = ".env"
         env_file_encoding = "utf-8"
+        extra = "ignore"  # .env also holds settings for other services
 
 
 # Global config instance
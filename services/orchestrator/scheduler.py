@@ -221,16 +221,32 @@ class TradingOrchestrator:
 
         try:
             from services.data_collector.main import DataCollectorService
+            from shared.database.partitions import ensure_future_partitions
 
             service = DataCollectorService(enable_scheduler=False)
 
+            # Make sure upcoming years have a partition before loading rows.
+            # Rows still land in the DEFAULT partition without one, so a
+            # failure here must not stop the collection.
+            logger.info("Step 1/4: Checking time-series partitions...")
+            db = SessionLocal()
+            try:
+                created = ensure_future_partitions(db)
+                db.commit()
+                logger.info(f"Created {len(created)} partitions")
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Error creating future partitions: {e}", exc_info=True)
+            finally:
+                db.close()
+
             # Collect stock codes
-            logger.info("Step 1/3: Collecting stock codes...")
+            logger.info("Step 2/4: Collecting stock codes...")
             stock_count = service.collect_all_stock_codes()
             logger.info(f"Collected {stock_count} stock codes")
 
             # Collect price data for today
-            logger.info("Step 2/3: Collecting price data...")
+            logger.info("Step 3/4: Collecting price data...")
             price_stats = service.collect_prices_for_all_stocks()
             logger.info(
                 f"Collected prices: {price_stats['successful']}/{price_stats['total_stocks']} stocks, "
@@ -238,7 +254,7 @@ class TradingOrchestrator:
             )
 
             # Collect fundamental data
-            logger.info("Step 3/3: Collecting fundamental data...")
+            logger.info("Step 4/4: Collecting fundamental data...")
             fund_stats = service.collect_fundamentals_for_all_stocks()
             logger.info(
                 f"Collected fundamentals: {fund_stats['successful']}/{fund_stats['total_stocks']} stocks"
@@ -260,17 +276,31 @@ class TradingOrchestrator:
         try:
             from services.indicator_calculator.run_technical_calculation import main as run_technical
             from services.indicator_calculator.run_financial_calculation import main as run_financial
+            from shared.database.latest_metrics import refresh_latest_metrics
 
             # Calculate technical indicators
-            logger.info("Step 1/2: Calculating technical indicators...")
+            logger.info("Step 1/3: Calculating technical indicators...")
             run_technical()
             logger.info("Technical indicators calculated")
 
             # Calculate financial indicators
-            logger.info("Step 2/2: Calculating financial indicators...")
+            logger.info("Step 2/3: Calculating financial indicators...")
             run_financial()
             logger.info("Financial indicators calculated")
 
+            # Refresh the latest metrics read by the screener
+            logger.info("Step 3/3: Refreshing latest stock metrics...")
+            db = SessionLocal()
+            try:
+                refreshed = refresh_latest_metrics(db)
+                db.commit()
+            finally:
+                db.close()
+            logger.info(f"Latest metrics refreshed for {refreshed} stocks")
+
+            # Refresh the Parquet datasets read by backtests
+            self._export_backtest_datasets()
+
             logger.info("Indicator Calculation Job completed successfully")
 
         except Exception as e:
@@ -278,6 +308,26 @@ class TradingOrchestrator:
 
         logger.info("=" * 80)
 
+    def _export_backtest_datasets(self):
+        """Re-export the backtest Parquet datasets when an export path is configured."""
+        if not self.config.parquet_export_path:
+            return
+
+        # The indicators are already saved, so a failed export must not fail the job
+        try:
+            from services.backtesting.data_loader import export_to_parquet
+
+            logger.info(f"Exporting backtest datasets to {self.config.parquet_export_path}...")
+            db = SessionLocal()
+            try:
+                counts = export_to_parquet(db, self.config.parquet_export_path)
+            finally:
+                db.close()
+            logger.info(f"Exported {counts}")
+
+        except Exception as e:
+            logger.error(f"Error exporting backtest datasets: {e}", exc_info=True)
+
     def _run_watchlist_update(self):
         """Execute daily watchlist update."""
         logger.info("=" * 80)
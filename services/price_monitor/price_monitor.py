@@ -6,10 +6,10 @@ Monitors stock prices, detects changes, and updates the database.
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from decimal import Decimal
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
+from shared.database.bulk import bulk_upsert
 from shared.database.models import Stock, StockPrice
 from shared.database.connection import get_db_session
 from .event_publisher import PriceEventPublisher
@@ -149,39 +149,35 @@ class PriceMonitor:
         db: Session,
         stock_id: int,
         price_data: Dict[str, Any]
-    ) -> StockPrice:
+    ) -> None:
         """
-        Update stock price in database.
+        Write the latest quote as today's daily bar.
+
+        The first quote of the day inserts the bar and later quotes update
+        it in place, through one INSERT ... ON CONFLICT (stock_id, date).
 
         Args:
             db: Database session
             stock_id: Stock ID
             price_data: Price data dictionary
-
-        Returns:
-            Created StockPrice record
         """
-        stock_price = StockPrice(
-            stock_id=stock_id,
-            date=price_data.get("timestamp", datetime.utcnow()),
-            open=Decimal(str(price_data["open"])),
-            high=Decimal(str(price_data["high"])),
-            low=Decimal(str(price_data["low"])),
-            close=Decimal(str(price_data["current_price"])),
-            volume=price_data["volume"],
-            trading_value=price_data.get("trading_value"),
-            change_pct=price_data.get("change_pct")
-        )
-
-        db.add(stock_price)
+        bulk_upsert(db, StockPrice, [{
+            'stock_id': stock_id,
+            'date': price_data.get("timestamp", datetime.utcnow()),
+            'open': round(price_data["open"]),
+            'high': round(price_data["high"]),
+            'low': round(price_data["low"]),
+            'close': round(price_data["current_price"]),
+            'volume': price_data["volume"],
+            'trading_value': price_data.get("trading_value"),
+            'change_pct': price_data.get("change_pct"),
+        }], conflict_columns=('stock_id', 'date'))
         db.commit()
-        db.refresh(stock_price)
 
         logger.info(
             f"Updated price for stock_id={stock_id}, "
             f"price={price_data['current_price']}"
         )
-        return stock_price
 
     def process_stock_price(self, stock: Stock, db: Session) -> bool:
         """
@@ -576,7 +576,6 @@ async def update_position_limits(
     if limits.take_profit_use_technical is not None:
         position.take_profit_use_technical = limits.take_profit_use_technical
 
-    position.updated_at = datetime.utcnow()
     db.commit()
     db.refresh(position)
 
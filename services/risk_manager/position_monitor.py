@@ -6,7 +6,6 @@ Implements trailing stop-loss that moves up as profit increases.
 import logging
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime
 from decimal import Decimal
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
@@ -236,7 +235,6 @@ class PositionMonitor:
             old_trailing_stop = float(position.trailing_stop_price or 0)
             if new_trailing_stop > old_trailing_stop:
                 position.trailing_stop_price = Decimal(str(new_trailing_stop))
-                position.updated_at = datetime.utcnow()
 
                 logger.info(f"Trailing stop updated for {position.ticker}: "
                            f"Highest: {current_price:,.0f}, "
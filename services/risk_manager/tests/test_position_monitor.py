@@ -37,10 +37,6 @@ def sample_position(db_session):
         quantity=10,
         avg_price=Decimal("70000"),
         current_price=Decimal("70000"),
-        current_value=700000,
-        invested_amount=700000,
-        unrealized_pnl=0,
-        unrealized_pnl_pct=0.0,
         realized_pnl=0,
         stop_loss_price=Decimal("63000"),  # -10%
         stop_loss_pct=10.0,
@@ -74,8 +70,6 @@ def test_stop_loss_trigger(db_session, sample_position, position_monitor):
     """Test that stop-loss is triggered when price falls below threshold."""
     # Price falls to 62,000 (below stop-loss of 63,000)
     sample_position.current_price = Decimal("62000")
-    sample_position.unrealized_pnl = (62000 - 70000) * 10
-    sample_position.unrealized_pnl_pct = ((62000 - 70000) / 70000) * 100
     db_session.commit()
 
     result = position_monitor.monitor_positions("test_user", db_session)
@@ -116,8 +110,6 @@ def test_trailing_stop_trigger(db_session, sample_position, position_monitor):
 
     # Then price falls to 71,000 (below trailing stop of 72,000)
     sample_position.current_price = Decimal("71000")
-    sample_position.unrealized_pnl = (71000 - 70000) * 10
-    sample_position.unrealized_pnl_pct = ((71000 - 70000) / 70000) * 100
     db_session.commit()
 
     result = position_monitor.monitor_positions("test_user", db_session)
@@ -132,8 +124,6 @@ def test_take_profit_trigger(db_session, sample_position, position_monitor):
     """Test that take-profit triggers when price reaches target."""
     # Price rises to 85,000 (above take-profit of 84,000)
     sample_position.current_price = Decimal("85000")
-    sample_position.unrealized_pnl = (85000 - 70000) * 10
-    sample_position.unrealized_pnl_pct = ((85000 - 70000) / 70000) * 100
     db_session.commit()
 
     result = position_monitor.monitor_positions("test_user", db_session)
@@ -186,10 +176,6 @@ def test_initialize_position_limits(db_session, position_monitor):
         quantity=10,
         avg_price=Decimal("50000"),
         current_price=Decimal("50000"),
-        current_value=500000,
-        invested_amount=500000,
-        unrealized_pnl=0,
-        unrealized_pnl_pct=0.0,
         first_purchase_date=datetime.utcnow()
     )
     db_session.add(position)
@@ -216,8 +202,6 @@ def test_no_exit_signals_normal_price(db_session, sample_position, position_moni
     """Test that no exit signals are generated when price is within limits."""
     # Price at 75,000 (between stop-loss and take-profit)
     sample_position.current_price = Decimal("75000")
-    sample_position.unrealized_pnl = (75000 - 70000) * 10
-    sample_position.unrealized_pnl_pct = ((75000 - 70000) / 70000) * 100
     db_session.commit()
 
     result = position_monitor.monitor_positions("test_user", db_session)
@@ -297,5 +281,18 @@ def test_multiple_positions_monitoring(db_session, position_monitor):
     assert "take_profit" in signal_types
 
 
+def test_derived_pnl_follows_current_price(db_session, sample_position):
+    """Test that value and PnL columns are recomputed by the database."""
+    assert sample_position.invested_amount == 700000
+    assert sample_position.unrealized_pnl == 0
+
+    sample_position.current_price = Decimal("63000")
+    db_session.commit()
+
+    assert sample_position.current_value == 630000
+    assert sample_position.unrealized_pnl == -70000
+    assert sample_position.unrealized_pnl_pct == pytest.approx(-10.0)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import desc, and_, func
 import logging
 
+from shared.database.bulk import bulk_upsert
 from shared.database.models import (
     Stock,
     StockPrice,
@@ -86,8 +87,14 @@ class StabilityDataRepository:
 
             start_date = end_date - timedelta(days=lookback_days)
 
+            # Only columns covered by ix_stock_prices_stock_date, so the read can be index-only
             prices = (
-                self.db.query(StockPrice)
+                self.db.query(
+                    StockPrice.date,
+                    StockPrice.close,
+                    StockPrice.volume,
+                    StockPrice.adjusted_close
+                )
                 .filter(
                     and_(
                         StockPrice.stock_id == stock_id,
@@ -323,34 +330,9 @@ class StabilityDataRepository:
             if calculation_date is None:
                 calculation_date = datetime.utcnow()
 
-            # Check if stability score already exists for this date
-            existing = (
-                self.db.query(StabilityScore)
-                .filter(
-                    and_(
-                        StabilityScore.stock_id == stock_id,
-                        StabilityScore.date == calculation_date.date()
-                    )
-                )
-                .first()
-            )
-
-            if existing:
-                # Update existing record
-                for key, value in metrics.items():
-                    if hasattr(existing, key):
-                        setattr(existing, key, value)
-                existing.updated_at = datetime.utcnow()
-                self.logger.info(f"Updated existing stability score for stock {stock_id}")
-            else:
-                # Create new record
-                stability_score = StabilityScore(
-                    stock_id=stock_id,
-                    **metrics
-                )
-                self.db.add(stability_score)
-                self.logger.info(f"Created new stability score for stock {stock_id}")
-
+            row = StabilityScore.pack_details({'stock_id': stock_id, 'date': calculation_date, **metrics})
+            bulk_upsert(self.db, StabilityScore, [row], conflict_columns=('stock_id', 'date'))
+            self.logger.info(f"Saved stability score for stock {stock_id}")
             self.db.commit()
             return True
 
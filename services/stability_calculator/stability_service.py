@@ -10,6 +10,7 @@ import logging
 
 from services.stability_calculator.stability_calculator import StabilityCalculator, StabilityMetrics
 from services.stability_calculator.stability_repository import StabilityDataRepository
+from shared.database.latest_metrics import refresh_latest_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -175,6 +176,12 @@ class StabilityService:
             # Final commit
             self.db.commit()
 
+            # Keep the screener's latest metrics snapshot in step with the new scores
+            if stats['successful'] > 0:
+                refreshed = refresh_latest_metrics(self.db)
+                self.db.commit()
+                self.logger.info(f"Latest metrics refreshed for {refreshed} stocks")
+
             self.logger.info(
                 f"Stability calculation completed: {stats['successful']} successful, "
                 f"{stats['failed']} failed, {stats['skipped']} skipped"
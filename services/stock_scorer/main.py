@@ -34,7 +34,9 @@ def get_db_session():
     """Create and return a database session."""
     from shared.configs.config import settings
     engine = create_engine(settings.database_url)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    SessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+    )
     return SessionLocal()
 
 
@@ -6,9 +6,10 @@ Handles data retrieval and storage for composite score calculations.
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, func
+from sqlalchemy import Numeric, and_, cast, desc, func, insert, select, update
 import logging
 
+from shared.database.bulk import bulk_upsert
 from shared.database.models import (
     Stock,
     StockPrice,
@@ -219,8 +220,17 @@ class ScoreDataRepository:
 
             start_date = end_date - timedelta(days=lookback_days * 2)  # Get extra for weekends/holidays
 
+            # Only columns covered by ix_stock_prices_stock_date, so the read can be index-only
             prices = (
-                self.db.query(StockPrice)
+                self.db.query(
+                    StockPrice.date,
+                    StockPrice.open,
+                    StockPrice.high,
+                    StockPrice.low,
+                    StockPrice.close,
+                    StockPrice.volume,
+                    StockPrice.adjusted_close
+                )
                 .filter(
                     and_(
                         StockPrice.stock_id == stock_id,
@@ -263,39 +273,46 @@ class ScoreDataRepository:
             True if successful, False otherwise
         """
         try:
-            # Check if score already exists for this stock and date
-            existing = (
-                self.db.query(CompositeScore)
-                .filter(
-                    and_(
-                        CompositeScore.stock_id == stock_id,
-                        CompositeScore.date == score_data['date']
-                    )
-                )
-                .first()
+            bulk_upsert(
+                self.db,
+                CompositeScore,
+                [CompositeScore.pack_details({'stock_id': stock_id, **score_data})],
+                conflict_columns=('stock_id', 'date')
             )
+            self.logger.debug(f"Saved composite score for stock {stock_id}")
+            self.db.commit()
+            return True
 
-            if existing:
-                # Update existing score
-                for key, value in score_data.items():
-                    if hasattr(existing, key):
-                        setattr(existing, key, value)
-                existing.updated_at = datetime.utcnow()
-                self.logger.debug(f"Updated composite score for stock {stock_id}")
-            else:
-                # Create new score
-                score = CompositeScore(
-                    stock_id=stock_id,
-                    **score_data
-                )
-                self.db.add(score)
-                self.logger.debug(f"Created new composite score for stock {stock_id}")
+        except Exception as e:
+            self.logger.error(f"Error saving composite score for stock {stock_id}: {e}")
+            self.db.rollback()
+            return False
+
+    def save_composite_scores(self, scores: List[Dict[str, Any]]) -> bool:
+        """
+        Save a batch of composite scores in one transaction.
+
+        Scores for a stock and date that already exist are updated in place
+        through a single upsert.
 
+        Args:
+            scores: Score dictionaries, each including stock_id and date
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not scores:
+            return True
+
+        try:
+            rows = [CompositeScore.pack_details(score) for score in scores]
+            bulk_upsert(self.db, CompositeScore, rows, conflict_columns=('stock_id', 'date'))
             self.db.commit()
+            self.logger.debug(f"Saved {len(scores)} composite scores")
             return True
 
         except Exception as e:
-            self.logger.error(f"Error saving composite score for stock {stock_id}: {e}")
+            self.logger.error(f"Error saving {len(scores)} composite scores: {e}")
             self.db.rollback()
             return False
 
@@ -391,7 +408,7 @@ class ScoreDataRepository:
             True if successful, False otherwise
         """
         try:
-            # Get all scores for the given date
+            # Rank the latest scoring date unless one is given
             if date is None:
                 # Get latest date
                 latest_date = (
@@ -403,23 +420,29 @@ class ScoreDataRepository:
                     return False
                 date = latest_date
 
-            scores = (
-                self.db.query(CompositeScore)
-                .filter(CompositeScore.date == date)
-                .order_by(CompositeScore.composite_score)
-                .all()
+            # Rank every stock for the date in one UPDATE ... FROM using
+            # CUME_DIST(), i.e. the share of stocks scoring at or below it
+            ranks = (
+                select(
+                    CompositeScore.id,
+                    func.cume_dist().over(order_by=CompositeScore.composite_score).label('rank')
+                )
+                .where(CompositeScore.date == date)
+                .subquery()
+            )
+            result = self.db.execute(
+                update(CompositeScore)
+                .where(CompositeScore.date == date, CompositeScore.id == ranks.c.id)
+                .values(percentile_rank=func.round(cast(ranks.c.rank * 100, Numeric), 2))
+                .execution_options(synchronize_session=False, query_tag='score_refresh')
             )
+            total_count = result.rowcount
 
-            if not scores:
+            if not total_count:
                 self.logger.warning(f"No scores found for date {date}")
+                self.db.rollback()
                 return False
 
-            # Calculate percentile for each score
-            total_count = len(scores)
-            for idx, score in enumerate(scores):
-                percentile = ((idx + 1) / total_count) * 100
-                score.percentile_rank = round(percentile, 2)
-
             self.db.commit()
             self.logger.info(f"Updated percentile ranks for {total_count} stocks")
             return True
@@ -473,7 +496,6 @@ class ScoreDataRepository:
                     existing.reason = reason
                 if tags:
                     existing.tags = tags
-                existing.updated_at = datetime.utcnow()
                 self.logger.debug(f"Updated watchlist entry for stock {ticker}")
             else:
                 # Create new entry
@@ -484,8 +506,7 @@ class ScoreDataRepository:
                     score=score,
                     reason=reason or "Top-scoring stock",
                     tags=tags or "composite-score,auto-added",
-                    is_active=True,
-                    added_date=datetime.utcnow()
+                    is_active=True
                 )
                 self.db.add(watchlist_entry)
                 self.logger.debug(f"Added stock {ticker} to watchlist")
@@ -498,6 +519,76 @@ class ScoreDataRepository:
             self.db.rollback()
             return False
 
+    def add_to_watchlist_batch(self, user_id: str, entries: List[Dict[str, Any]]) -> bool:
+        """
+        Add several stocks to the watchlist in one transaction.
+
+        Looks up the user's active entries with a single query, then updates
+        them by primary key and inserts the rest with one executemany each,
+        instead of a SELECT/INSERT/COMMIT round trip per stock.
+
+        Args:
+            user_id: User identifier
+            entries: Dicts with stock_id, ticker, score and optional reason/tags
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not entries:
+            return True
+
+        try:
+            existing_ids = dict(
+                self.db.query(Watchlist.stock_id, Watchlist.id)
+                .filter(
+                    and_(
+                        Watchlist.user_id == user_id,
+                        Watchlist.stock_id.in_([entry['stock_id'] for entry in entries]),
+                        Watchlist.is_active == True
+                    )
+                )
+                .all()
+            )
+
+            updates = []
+            inserts = []
+            for entry in entries:
+                watchlist_id = existing_ids.get(entry['stock_id'])
+                if watchlist_id is not None:
+                    # updated_at is set by the database on UPDATE
+                    row = {'id': watchlist_id, 'score': entry['score']}
+                    if entry.get('reason'):
+                        row['reason'] = entry['reason']
+                    if entry.get('tags'):
+                        row['tags'] = entry['tags']
+                    updates.append(row)
+                else:
+                    inserts.append({
+                        'stock_id': entry['stock_id'],
+                        'user_id': user_id,
+                        'ticker': entry['ticker'],
+                        'score': entry['score'],
+                        'reason': entry.get('reason') or "Top-scoring stock",
+                        'tags': entry.get('tags') or "composite-score,auto-added",
+                        'is_active': True,
+                    })
+
+            if updates:
+                self.db.execute(update(Watchlist), updates)
+            if inserts:
+                self.db.execute(insert(Watchlist), inserts)
+
+            self.db.commit()
+            self.logger.debug(
+                f"Watchlist batch for user {user_id}: {len(inserts)} added, {len(updates)} updated"
+            )
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error adding stocks to watchlist: {e}")
+            self.db.rollback()
+            return False
+
     def get_watchlist(self, user_id: str, active_only: bool = True) -> List[Tuple[Stock, Watchlist]]:
         """
         Get user's watchlist.
@@ -10,6 +10,7 @@ import logging
 
 from services.stock_scorer.stock_scorer import StockScorer, ScoreMetrics
 from services.stock_scorer.score_repository import ScoreDataRepository
+from shared.database.latest_metrics import refresh_latest_metrics
 from shared.database.models import Stock, CompositeScore
 
 logger = logging.getLogger(__name__)
@@ -46,12 +47,13 @@ class ScoreService:
         )
         self.logger = logging.getLogger(__name__)
 
-    def calculate_score_for_stock(self, stock_id: int) -> Optional[ScoreMetrics]:
+    def calculate_score_for_stock(self, stock_id: int, save: bool = True) -> Optional[ScoreMetrics]:
         """
         Calculate composite score for a single stock.
 
         Args:
             stock_id: Stock ID
+            save: Whether to save the score immediately
 
         Returns:
             ScoreMetrics object or None if calculation fails
@@ -91,6 +93,9 @@ class ScoreService:
                 price_data=price_data
             )
 
+            if not save:
+                return metrics
+
             # Save to database
             score_dict = metrics.to_dict()
             success = self.repository.save_composite_score(stock_id, score_dict)
@@ -142,10 +147,14 @@ class ScoreService:
                 'errors': []
             }
 
+            # Scores are collected and written in one bulk insert at the end
+            score_rows = []
+
             for stock in stocks:
                 try:
-                    metrics = self.calculate_score_for_stock(stock.id)
+                    metrics = self.calculate_score_for_stock(stock.id, save=False)
                     if metrics:
+                        score_rows.append({'stock_id': stock.id, **metrics.to_dict()})
                         results['successful'] += 1
                         results['scores'].append({
                             'stock_id': stock.id,
@@ -168,11 +177,32 @@ class ScoreService:
                         'error': str(e)
                     })
 
+            if not self.repository.save_composite_scores(score_rows):
+                self.logger.error(f"Failed to save {len(score_rows)} composite scores")
+                # Nothing was written, so none of the calculated stocks succeeded
+                results['failed'] += results['successful']
+                results['successful'] = 0
+                results['errors'].extend(
+                    {
+                        'stock_id': score['stock_id'],
+                        'ticker': score['ticker'],
+                        'error': 'Failed to save composite score'
+                    }
+                    for score in results['scores']
+                )
+                results['scores'] = []
+
             # Update percentile ranks
             if update_percentiles and results['successful'] > 0:
                 self.logger.info("Updating percentile ranks")
                 self.repository.calculate_percentile_ranks()
 
+            # Keep the screener's latest metrics snapshot in step with the new scores
+            if results['successful'] > 0:
+                refreshed = refresh_latest_metrics(self.db)
+                self.db.commit()
+                self.logger.info(f"Latest metrics refreshed for {refreshed} stocks")
+
             self.logger.info(
                 f"Score calculation complete: "
                 f"{results['successful']} successful, "
@@ -281,37 +311,37 @@ class ScoreService:
 
             default_tags = tags or "top-scored,auto-added"
 
+            entries = []
             for stock_data in top_stocks:
-                try:
-                    reason = (
+                # Ranks are only filled in once calculate_percentile_ranks has run
+                percentile = stock_data['percentile_rank']
+                percentile_text = f"{percentile:.0f}%" if percentile is not None else "n/a"
+                entries.append({
+                    'stock_id': stock_data['stock_id'],
+                    'ticker': stock_data['ticker'],
+                    'score': stock_data['composite_score'],
+                    'reason': (
                         f"Top {limit} stock by composite score "
                         f"(Score: {stock_data['composite_score']:.1f}, "
-                        f"Percentile: {stock_data['percentile_rank']:.0f}%)"
-                    )
-
-                    success = self.repository.add_to_watchlist(
-                        user_id=user_id,
-                        stock_id=stock_data['stock_id'],
-                        ticker=stock_data['ticker'],
-                        score=stock_data['composite_score'],
-                        reason=reason,
-                        tags=default_tags
-                    )
-
-                    if success:
-                        results['added'] += 1
-                        results['stocks'].append({
-                            'ticker': stock_data['ticker'],
-                            'name': stock_data['name_kr'],
-                            'score': stock_data['composite_score'],
-                            'percentile': stock_data['percentile_rank']
-                        })
-                    else:
-                        results['failed'] += 1
+                        f"Percentile: {percentile_text})"
+                    ),
+                    'tags': default_tags
+                })
 
-                except Exception as e:
-                    self.logger.error(f"Error adding {stock_data['ticker']} to watchlist: {e}")
-                    results['failed'] += 1
+            # One transaction for the whole batch: either all are added or none
+            if self.repository.add_to_watchlist_batch(user_id, entries):
+                results['added'] = len(top_stocks)
+                results['stocks'] = [
+                    {
+                        'ticker': stock_data['ticker'],
+                        'name': stock_data['name_kr'],
+                        'score': stock_data['composite_score'],
+                        'percentile': stock_data['percentile_rank']
+                    }
+                    for stock_data in top_stocks
+                ]
+            else:
+                results['failed'] = len(top_stocks)
 
             self.logger.info(
                 f"Added {results['added']} stocks to watchlist for user {user_id}"
@@ -7,11 +7,11 @@ from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func
 
-from shared.database.models import (
-    Stock, StockPrice, TechnicalIndicator, FundamentalIndicator, StabilityScore
-)
+from shared.configs.config import Settings
+from shared.database.latest_metrics import refresh_if_stale
+from shared.database.models import Stock, StockLatestMetrics, StockPrice
 
 logger = logging.getLogger(__name__)
 
@@ -134,11 +134,11 @@ class StockScreeningEngine:
 
         # Get all active stocks
         stocks = self._get_active_stocks(criteria)
-        logger.info(f"Found {len(stocks)} active stocks matching market/sector filters")
+        logger.info(f"Found {len(stocks)} active stocks matching market/metric filters")
 
         results = []
-        for stock in stocks:
-            result = self._screen_single_stock(stock, criteria)
+        for stock, metrics in stocks:
+            result = self._screen_single_stock(stock, metrics, criteria)
             if result:
                 results.append(result)
 
@@ -184,9 +184,27 @@ class StockScreeningEngine:
             min_volume_history_days=self.settings.min_volume_history_days
         )
 
-    def _get_active_stocks(self, criteria: ScreeningCriteria) -> List[Stock]:
-        """Get active stocks matching market/sector filters."""
-        query = self.db.query(Stock).filter(Stock.is_active == True)
+    def _get_active_stocks(
+        self,
+        criteria: ScreeningCriteria
+    ) -> List[Tuple[Stock, StockLatestMetrics]]:
+        """
+        Get active stocks with their latest metrics that pass the SQL filters.
+
+        Price, volatility, valuation, financial health and stability filters
+        are applied to stock_latest_metrics here, so only candidates reach the
+        per-stock history checks. The snapshot is refreshed first if it is
+        empty or older than the newest price data.
+        """
+        refreshed = refresh_if_stale(self.db)
+        if refreshed:
+            logger.info(f"Refreshed stale latest metrics for {refreshed} stocks")
+
+        query = (
+            self.db.query(Stock, StockLatestMetrics)
+            .join(StockLatestMetrics, StockLatestMetrics.stock_id == Stock.id)
+            .filter(Stock.is_active == True)
+        )
 
         # Market filter
         if criteria.markets:
@@ -206,41 +224,58 @@ class StockScreeningEngine:
         if criteria.max_market_cap is not None:
             query = query.filter(Stock.market_cap <= criteria.max_market_cap)
 
-        return query.all()
+        return self._apply_metric_filters(query, criteria).all()
+
+    def _apply_metric_filters(self, query, criteria: ScreeningCriteria):
+        """
+        Filter on the latest price, volatility, valuation, debt and stability.
+
+        Stocks without fundamental data are always filtered out, and a stock
+        missing a metric that has a bound is filtered out as well (comparisons
+        with NULL are false).
+        """
+        metrics = StockLatestMetrics
+        query = query.filter(metrics.fundamental_date.isnot(None))
+
+        bounds = [
+            (metrics.close, criteria.min_price, criteria.max_price),
+            (metrics.per, criteria.min_per, criteria.max_per),
+            (metrics.pbr, criteria.min_pbr, criteria.max_pbr),
+            (metrics.debt_ratio, criteria.min_debt_ratio_pct, criteria.max_debt_ratio_pct),
+            (metrics.stability_score, criteria.min_stability_score, criteria.max_stability_score),
+        ]
+        for column, minimum, maximum in bounds:
+            if minimum is not None:
+                query = query.filter(column >= minimum)
+            if maximum is not None:
+                query = query.filter(column <= maximum)
+
+        if criteria.max_volatility_pct is not None:
+            query = query.filter(metrics.price_volatility * 100 <= criteria.max_volatility_pct)
+
+        return query
 
     def _screen_single_stock(
         self,
         stock: Stock,
+        metrics: StockLatestMetrics,
         criteria: ScreeningCriteria
     ) -> Optional[ScreeningResult]:
         """
-        Screen a single stock against all criteria.
+        Screen a single stock against the history and liquidity criteria.
 
         Args:
             stock: Stock to screen
+            metrics: Latest metrics of the stock, already past the SQL filters
             criteria: Screening criteria
 
         Returns:
             ScreeningResult if stock passes all filters, None otherwise
         """
-        # Get latest data
-        latest_price = self._get_latest_price(stock.id)
-        if not latest_price:
-            logger.debug(f"No price data for {stock.ticker}")
-            return None
-
-        # Check price filters
-        if not self._check_price_filters(latest_price.close, criteria):
-            return None
-
         # Check data quality
         if not self._check_data_quality(stock.id, criteria):
             return None
 
-        # Get latest indicators
-        fundamental = self._get_latest_fundamental(stock.id)
-        stability = self._get_latest_stability(stock.id)
-
         # Calculate liquidity metrics
         liquidity_metrics = self._calculate_liquidity_metrics(stock.id, criteria)
         if liquidity_metrics is None:
@@ -248,25 +283,12 @@ class StockScreeningEngine:
 
         avg_volume, avg_trading_value = liquidity_metrics
 
-        # Apply filters
-        if not self._check_volatility_filter(stability, criteria):
-            return None
-
-        if not self._check_valuation_filters(fundamental, criteria):
-            return None
-
-        if not self._check_financial_health_filters(fundamental, criteria):
-            return None
-
         if not self._check_liquidity_filters(avg_volume, avg_trading_value, criteria):
             return None
 
-        if not self._check_stability_filters(stability, criteria):
-            return None
-
         # Check if undervalued
         is_undervalued, reasons = self._check_undervalued(
-            stock, fundamental, criteria
+            stock, metrics, criteria
         )
 
         # Build result
@@ -276,49 +298,22 @@ class StockScreeningEngine:
             market=stock.market,
             sector=stock.sector,
             industry=stock.industry,
-            current_price=latest_price.close,
+            current_price=metrics.close,
             market_cap=stock.market_cap,
-            per=fundamental.per if fundamental else None,
-            pbr=fundamental.pbr if fundamental else None,
-            debt_ratio=fundamental.debt_ratio if fundamental else None,
-            roe=fundamental.roe if fundamental else None,
+            per=metrics.per,
+            pbr=metrics.pbr,
+            debt_ratio=metrics.debt_ratio,
+            roe=metrics.roe,
             avg_volume=avg_volume,
             avg_trading_value=avg_trading_value,
-            volatility_pct=stability.price_volatility * 100 if stability and stability.price_volatility else None,
-            stability_score=stability.stability_score if stability else None,
+            volatility_pct=metrics.price_volatility * 100 if metrics.price_volatility else None,
+            stability_score=metrics.stability_score,
             is_undervalued=is_undervalued,
             undervalued_reasons=reasons
         )
 
         return result
 
-    def _get_latest_price(self, stock_id: int) -> Optional[StockPrice]:
-        """Get the latest price for a stock."""
-        return (
-            self.db.query(StockPrice)
-            .filter(StockPrice.stock_id == stock_id)
-            .order_by(StockPrice.date.desc())
-            .first()
-        )
-
-    def _get_latest_fundamental(self, stock_id: int) -> Optional[FundamentalIndicator]:
-        """Get the latest fundamental indicators for a stock."""
-        return (
-            self.db.query(FundamentalIndicator)
-            .filter(FundamentalIndicator.stock_id == stock_id)
-            .order_by(FundamentalIndicator.date.desc())
-            .first()
-        )
-
-    def _get_latest_stability(self, stock_id: int) -> Optional[StabilityScore]:
-        """Get the latest stability score for a stock."""
-        return (
-            self.db.query(StabilityScore)
-            .filter(StabilityScore.stock_id == stock_id)
-            .order_by(StabilityScore.date.desc())
-            .first()
-        )
-
     def _check_data_quality(self, stock_id: int, criteria: ScreeningCriteria) -> bool:
         """Check if stock has sufficient historical data."""
         # Check price history
@@ -381,84 +376,6 @@ class StockScreeningEngine:
             return (float(result.avg_volume), float(result.avg_trading_value or 0))
         return None
 
-    def _check_price_filters(self, price: float, criteria: ScreeningCriteria) -> bool:
-        """Check if price is within specified range."""
-        if criteria.min_price is not None and price < criteria.min_price:
-            return False
-        if criteria.max_price is not None and price > criteria.max_price:
-            return False
-        return True
-
-    def _check_volatility_filter(
-        self,
-        stability: Optional[StabilityScore],
-        criteria: ScreeningCriteria
-    ) -> bool:
-        """Filter out high volatility stocks."""
-        if criteria.max_volatility_pct is None:
-            return True
-
-        if not stability or stability.price_volatility is None:
-            # If no stability data, be conservative and filter out
-            return False
-
-        volatility_pct = stability.price_volatility * 100
-        return volatility_pct <= criteria.max_volatility_pct
-
-    def _check_valuation_filters(
-        self,
-        fundamental: Optional[FundamentalIndicator],
-        criteria: ScreeningCriteria
-    ) -> bool:
-        """Filter out overvalued stocks."""
-        if not fundamental:
-            # If no fundamental data, filter out for safety
-            return False
-
-        # PER filter
-        if criteria.max_per is not None:
-            if fundamental.per is None or fundamental.per > criteria.max_per:
-                return False
-
-        if criteria.min_per is not None:
-            if fundamental.per is None or fundamental.per < criteria.min_per:
-                return False
-
-        # PBR filter
-        if criteria.max_pbr is not None:
-            if fundamental.pbr is None or fundamental.pbr > criteria.max_pbr:
-                return False
-
-        if criteria.min_pbr is not None:
-            if fundamental.pbr is None or fundamental.pbr < criteria.min_pbr:
-                return False
-
-        return True
-
-    def _check_financial_health_filters(
-        self,
-        fundamental: Optional[FundamentalIndicator],
-        criteria: ScreeningCriteria
-    ) -> bool:
-        """Filter out financially unstable companies."""
-        if not fundamental:
-            return False
-
-        # Debt ratio filter
-        if criteria.max_debt_ratio_pct is not None:
-            if fundamental.debt_ratio is None:
-                return False
-            if fundamental.debt_ratio > criteria.max_debt_ratio_pct:
-                return False
-
-        if criteria.min_debt_ratio_pct is not None:
-            if fundamental.debt_ratio is None:
-                return False
-            if fundamental.debt_ratio < criteria.min_debt_ratio_pct:
-                return False
-
-        return True
-
     def _check_liquidity_filters(
         self,
         avg_volume: float,
@@ -478,30 +395,10 @@ class StockScreeningEngine:
 
         return True
 
-    def _check_stability_filters(
-        self,
-        stability: Optional[StabilityScore],
-        criteria: ScreeningCriteria
-    ) -> bool:
-        """Filter by stability score range."""
-        if criteria.min_stability_score is not None:
-            if not stability or stability.stability_score is None:
-                return False
-            if stability.stability_score < criteria.min_stability_score:
-                return False
-
-        if criteria.max_stability_score is not None:
-            if not stability or stability.stability_score is None:
-                return False
-            if stability.stability_score > criteria.max_stability_score:
-                return False
-
-        return True
-
     def _check_undervalued(
         self,
         stock: Stock,
-        fundamental: Optional[FundamentalIndicator],
+        metrics: StockLatestMetrics,
         criteria: ScreeningCriteria
     ) -> Tuple[bool, List[str]]:
         """
@@ -512,20 +409,17 @@ class StockScreeningEngine:
         """
         reasons = []
 
-        if not fundamental:
-            return False, reasons
-
         # Check PBR threshold
         if criteria.undervalued_pbr_threshold is not None:
-            if fundamental.pbr is not None and fundamental.pbr < criteria.undervalued_pbr_threshold:
-                reasons.append(f"PBR {fundamental.pbr:.2f} < {criteria.undervalued_pbr_threshold}")
+            if metrics.pbr is not None and metrics.pbr < criteria.undervalued_pbr_threshold:
+                reasons.append(f"PBR {metrics.pbr:.2f} < {criteria.undervalued_pbr_threshold}")
 
         # Check PER vs industry average
-        if criteria.per_below_industry_avg and fundamental.per is not None:
+        if criteria.per_below_industry_avg and metrics.per is not None:
             industry_avg_per = self._get_industry_average_per(stock.industry)
-            if industry_avg_per and fundamental.per < industry_avg_per * self.settings.per_industry_avg_multiplier:
+            if industry_avg_per and metrics.per < industry_avg_per * self.settings.per_industry_avg_multiplier:
                 reasons.append(
-                    f"PER {fundamental.per:.2f} < Industry Avg {industry_avg_per:.2f}"
+                    f"PER {metrics.per:.2f} < Industry Avg {industry_avg_per:.2f}"
                 )
 
         return len(reasons) > 0, reasons
@@ -536,14 +430,14 @@ class StockScreeningEngine:
             return None
 
         result = (
-            self.db.query(func.avg(FundamentalIndicator.per))
-            .join(Stock, FundamentalIndicator.stock_id == Stock.id)
+            self.db.query(func.avg(StockLatestMetrics.per))
+            .join(Stock, StockLatestMetrics.stock_id == Stock.id)
             .filter(
                 Stock.industry == industry,
                 Stock.is_active == True,
-                FundamentalIndicator.per.isnot(None),
-                FundamentalIndicator.per > 0,
-                FundamentalIndicator.per < 100  # Exclude outliers
+                StockLatestMetrics.per.isnot(None),
+                StockLatestMetrics.per > 0,
+                StockLatestMetrics.per < 100  # Exclude outliers
             )
             .scalar()
         )
@@ -125,8 +125,7 @@ class OrderExecutor:
             tax=tax,
             status="PENDING" if self.dry_run else "EXECUTED",
             reason="; ".join(signal.reasons),
-            strategy="signal_generator",
-            created_at=datetime.now()
+            strategy="signal_generator"
         )
 
         if not self.dry_run:
@@ -188,8 +187,7 @@ class OrderExecutor:
             tax=tax,
             status="PENDING" if self.dry_run else "EXECUTED",
             reason="; ".join(signal.reasons),
-            strategy="signal_generator",
-            created_at=datetime.now()
+            strategy="signal_generator"
         )
 
         if not self.dry_run:
@@ -231,11 +229,9 @@ class OrderExecutor:
             position.quantity = total_quantity
             position.avg_price = Decimal(str(new_avg_price))
             position.current_price = trade.executed_price
-            position.invested_amount = int(total_quantity * new_avg_price)
             position.total_commission += trade.commission
             position.total_tax += trade.tax
             position.last_transaction_date = datetime.now()
-            position.updated_at = datetime.now()
 
         else:
             # Create new position
@@ -245,9 +241,6 @@ class OrderExecutor:
                 quantity=trade.executed_quantity,
                 avg_price=trade.executed_price,
                 current_price=trade.executed_price,
-                invested_amount=trade.total_amount,
-                unrealized_pnl=0,
-                unrealized_pnl_pct=0.0,
                 realized_pnl=0,
                 total_commission=trade.commission,
                 total_tax=trade.tax,
@@ -290,7 +283,6 @@ class OrderExecutor:
             position.total_commission += trade.commission
             position.total_tax += trade.tax
             position.last_transaction_date = datetime.now()
-            position.updated_at = datetime.now()
 
             logger.info(f"Partial exit: {signal.ticker} position now {remaining_quantity} shares")
 
@@ -323,7 +315,6 @@ class OrderExecutor:
         trade.status = "CANCELLED"
         trade.reason = f"{trade.reason}; Cancelled: {reason}"
         trade.cancelled_at = datetime.now()
-        trade.updated_at = datetime.now()
 
         self.db.commit()
 
@@ -505,11 +505,9 @@ class PaperTradingExecutor(BrokerInterface):
             position.quantity = total_quantity
             position.avg_price = Decimal(str(new_avg_price))
             position.current_price = Decimal(str(execution.price))
-            position.invested_amount = int(total_quantity * new_avg_price)
             position.total_commission += int(execution.commission)
             position.total_tax += int(execution.tax)
             position.last_transaction_date = datetime.now()
-            position.updated_at = datetime.now()
 
         else:
             # Create new position
@@ -519,9 +517,6 @@ class PaperTradingExecutor(BrokerInterface):
                 quantity=execution.quantity,
                 avg_price=Decimal(str(execution.price)),
                 current_price=Decimal(str(execution.price)),
-                invested_amount=int(execution.quantity * execution.price),
-                unrealized_pnl=0,
-                unrealized_pnl_pct=0.0,
                 realized_pnl=0,
                 total_commission=int(execution.commission),
                 total_tax=int(execution.tax),
@@ -562,7 +557,6 @@ class PaperTradingExecutor(BrokerInterface):
             position.total_commission += int(execution.commission)
             position.total_tax += int(execution.tax)
             position.last_transaction_date = datetime.now()
-            position.updated_at = datetime.now()
 
         self.db.commit()
 
@@ -623,8 +617,8 @@ class PaperTradingExecutor(BrokerInterface):
             # Use default slippage
             return self.slippage_model.calculate_slippage(price, quantity, side)
 
-        # Get recent volume data
-        recent_prices = self.db.query(StockPrice).filter(
+        # Get recent volume data (columns only, no StockPrice instances)
+        recent_prices = self.db.query(StockPrice.volume, StockPrice.close).filter(
             StockPrice.stock_id == stock.id
         ).order_by(StockPrice.date.desc()).limit(20).all()
 
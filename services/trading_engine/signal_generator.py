@@ -509,7 +509,8 @@ class TradingSignalGenerator:
         """
         lookback_date = datetime.now() - timedelta(days=lookback_days)
 
-        prices = self.db.query(StockPrice).filter(
+        # Only volume is needed; plain rows avoid building full StockPrice instances
+        prices = self.db.query(StockPrice.volume).filter(
             StockPrice.stock_id == stock_id,
             StockPrice.date >= lookback_date
         ).order_by(StockPrice.date).all()
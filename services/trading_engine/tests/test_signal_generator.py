@@ -307,9 +307,7 @@ class TestSignalGenerator:
             avg_price=Decimal('70000'),
             current_price=Decimal('60000'),  # Below stop-loss
             stop_loss_price=Decimal('63000'),
-            take_profit_price=Decimal('84000'),
-            unrealized_pnl=-1_000_000,
-            unrealized_pnl_pct=-14.3
+            take_profit_price=Decimal('84000')
         )
         db_session.add(position)
         db_session.commit()
@@ -12,7 +12,7 @@ import csv
 from typing import List, Optional, Dict
 from datetime import datetime, timedelta
 from pathlib import Path
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from sqlalchemy import desc
 
 import sys
@@ -290,8 +290,8 @@ class TradeLogger:
             end_date: End date filter (optional)
             ticker: Ticker filter (optional)
         """
-        # Query trades
-        query = self.db.query(Trade)
+        # Query trades (reason is deferred on the model)
+        query = self.db.query(Trade).options(undefer(Trade.reason))
 
         if start_date:
             query = query.filter(Trade.executed_at >= start_date)
@@ -12,7 +12,7 @@ This module provides comprehensive watchlist management functionality including:
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Dict, List, Optional, Any, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from sqlalchemy import and_, or_, desc, func
 import json
 import csv
@@ -132,8 +132,7 @@ class WatchlistManager:
             alert_enabled=alert_enabled,
             alert_price_upper=Decimal(str(alert_price_upper)) if alert_price_upper else None,
             alert_price_lower=Decimal(str(alert_price_lower)) if alert_price_lower else None,
-            is_active=True,
-            added_date=datetime.utcnow()
+            is_active=True
         )
 
         self.db.add(watchlist_entry)
@@ -263,7 +262,6 @@ class WatchlistManager:
                 # Update score
                 if latest_score:
                     entry.score = latest_score.composite_score
-                    entry.updated_at = datetime.utcnow()
 
                 # Create history snapshot
                 self._create_history_snapshot(
@@ -325,7 +323,6 @@ class WatchlistManager:
                     # Mark as inactive instead of deleting
                     entry.is_active = False
                     entry.notes = (entry.notes or "") + f"\n[Auto-removed {datetime.utcnow().date()}]: " + "; ".join(violations)
-                    entry.updated_at = datetime.utcnow()
 
                     stats['removed'] += 1
                     stats['details'].append({
@@ -841,7 +838,6 @@ class WatchlistManager:
             logger.info(f"Permanently deleted {ticker} from watchlist")
         else:
             entry.is_active = False
-            entry.updated_at = datetime.utcnow()
             logger.info(f"Marked {ticker} as inactive in watchlist")
 
         self.db.commit()
@@ -872,7 +868,9 @@ class WatchlistManager:
         if not entry:
             return []
 
-        query = self.db.query(WatchlistHistory).filter(
+        query = self.db.query(WatchlistHistory).options(
+            undefer(WatchlistHistory.criteria_violations)
+        ).filter(
             WatchlistHistory.watchlist_id == entry.id
         ).order_by(desc(WatchlistHistory.date))
 
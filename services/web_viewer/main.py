@@ -178,7 +178,18 @@ async def get_stock_prices(
 
         # Get price data - sorted by date ascending (oldest first)
         # This ensures the latest data appears at the bottom when displayed
-        prices = db.query(StockPrice).filter(
+        # Plain rows of the displayed columns rather than full StockPrice instances
+        prices = db.query(
+            StockPrice.id,
+            StockPrice.date,
+            StockPrice.open,
+            StockPrice.high,
+            StockPrice.low,
+            StockPrice.close,
+            StockPrice.volume,
+            StockPrice.adjusted_close,
+            StockPrice.change_pct,
+        ).filter(
             StockPrice.stock_id == stock.id
         ).order_by(
             StockPrice.date.asc()
@@ -0,0 +1,103 @@
+"""
+Shared engine and seed-data helpers for web_viewer tests.
+
+Used by the fixtures in conftest.py and by test classes that override
+them with a wider scope.
+"""
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from shared.database.models import Base, Stock, StockPrice
+
+
+# Test database URL (in-memory SQLite for testing)
+TEST_DATABASE_URL = "sqlite:///:memory:"
+
+
+def create_test_engine():
+    """Create an in-memory test database engine with all tables."""
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        pool_pre_ping=False
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def seed_sample_stocks(db):
+    """Insert the sample stocks and return them with IDs populated."""
+    stocks = [
+        Stock(
+            ticker="005930",
+            name_kr="삼성전자",
+            name_en="Samsung Electronics",
+            market="KOSPI",
+            sector="전기전자",
+            is_active=True
+        ),
+        Stock(
+            ticker="000660",
+            name_kr="SK하이닉스",
+            name_en="SK Hynix",
+            market="KOSPI",
+            sector="반도체",
+            is_active=True
+        ),
+        Stock(
+            ticker="035420",
+            name_kr="NAVER",
+            name_en="NAVER Corporation",
+            market="KOSPI",
+            sector="인터넷",
+            is_active=True
+        ),
+        Stock(
+            ticker="999999",
+            name_kr="비활성종목",
+            name_en="Inactive Stock",
+            market="KOSDAQ",
+            sector="기타",
+            is_active=False
+        ),
+    ]
+
+    for stock in stocks:
+        db.add(stock)
+    db.commit()
+
+    # Refresh to get IDs
+    for stock in stocks:
+        db.refresh(stock)
+
+    return stocks
+
+
+def seed_sample_prices(db, stock):
+    """Insert 150 days of price data for the given stock and return it."""
+    base_date = datetime(2024, 1, 1)
+    prices = []
+
+    # Create 150 days of price data for pagination testing
+    for i in range(150):
+        date = base_date + timedelta(days=i)
+        price = StockPrice(
+            stock_id=stock.id,
+            date=date,
+            open=70000 + i * 100,
+            high=71000 + i * 100,
+            low=69000 + i * 100,
+            close=70500 + i * 100,
+            volume=15000000 + (i * 10000),
+            adjusted_close=Decimal("70500") + Decimal(i * 100),
+            change_pct=0.5 + (i * 0.01)
+        )
+        prices.append(price)
+        db.add(price)
+
+    db.commit()
+    return prices
@@ -1,10 +1,34 @@
 """
 Tests for edge cases and error handling in Web Viewer.
 """
+import math
+
 import pytest
 from fastapi import status
 from unittest.mock import patch, MagicMock
 from sqlalchemy.exc import OperationalError, DatabaseError
+from sqlalchemy.orm import sessionmaker
+
+from shared.database.models import Base, Stock
+from services.web_viewer.main import app, get_db
+from services.web_viewer.tests.helpers import (
+    create_test_engine, seed_sample_stocks, seed_sample_prices
+)
+
+
+# Built once per module; the large dataset tests only assert on counts,
+# so these never need to be persisted.
+LARGE_STOCK_LIST = [
+    Stock(
+        ticker=f"{i:06d}",
+        name_kr=f"종목{i}",
+        name_en=f"Stock {i}",
+        market="KOSPI" if i % 2 == 0 else "KOSDAQ",
+        sector="테스트",
+        is_active=True
+    )
+    for i in range(1000)
+]
 
 
 class TestDatabaseConnectionErrors:
@@ -29,35 +53,28 @@ class TestDatabaseConnectionErrors:
 class TestInvalidInputs:
     """Tests for invalid input handling."""
 
-    def test_get_prices_with_negative_page(self, client, sample_stocks):
-        """Test getting prices with negative page number."""
-        # FastAPI validation should prevent this, returning 422
-        response = client.get("/api/stocks/005930/prices?page=-1")
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    def test_get_prices_with_zero_page(self, client, sample_stocks):
-        """Test getting prices with page 0."""
-        response = client.get("/api/stocks/005930/prices?page=0")
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    def test_get_prices_with_invalid_page_size_too_small(self, client, sample_stocks):
-        """Test getting prices with page size below minimum."""
-        response = client.get("/api/stocks/005930/prices?page_size=5")
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    def test_get_prices_with_invalid_page_size_too_large(self, client, sample_stocks):
-        """Test getting prices with page size above maximum."""
-        response = client.get("/api/stocks/005930/prices?page_size=1000")
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    def test_get_prices_with_non_numeric_page(self, client, sample_stocks):
-        """Test getting prices with non-numeric page parameter."""
-        response = client.get("/api/stocks/005930/prices?page=abc")
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    def test_get_stocks_with_excessive_limit(self, client, sample_stocks):
-        """Test getting stocks with limit exceeding maximum."""
-        response = client.get("/api/stocks?limit=10000")
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/api/stocks/005930/prices?page=-1",
+            "/api/stocks/005930/prices?page=0",
+            "/api/stocks/005930/prices?page_size=5",
+            "/api/stocks/005930/prices?page_size=1000",
+            "/api/stocks/005930/prices?page=abc",
+            "/api/stocks?limit=10000",
+        ],
+        ids=[
+            "negative_page",
+            "zero_page",
+            "page_size_too_small",
+            "page_size_too_large",
+            "non_numeric_page",
+            "excessive_limit",
+        ]
+    )
+    def test_invalid_query_params_return_422(self, client, sample_stocks, path):
+        """Test out-of-range or malformed query parameters are rejected by FastAPI validation."""
+        response = client.get(path)
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
@@ -107,7 +124,37 @@ class TestEmptyDatabaseScenarios:
 
 
 class TestDataIntegrity:
-    """Tests for data integrity and consistency."""
+    """Tests for data integrity and consistency.
+
+    These tests only read, so the engine and seed data are built once per
+    class instead of once per test.
+    """
+
+    @pytest.fixture(scope="class")
+    def test_engine(self):
+        """Create a test database engine shared by the whole class."""
+        engine = create_test_engine()
+        yield engine
+        Base.metadata.drop_all(bind=engine)
+
+    @pytest.fixture(scope="class")
+    def seed_db(self, test_engine):
+        """Create a session for seeding that outlives individual tests."""
+        db = sessionmaker(bind=test_engine, expire_on_commit=False)()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @pytest.fixture(scope="class")
+    def sample_stocks(self, seed_db):
+        """Create sample stock data once for the class."""
+        return seed_sample_stocks(seed_db)
+
+    @pytest.fixture(scope="class")
+    def sample_prices(self, seed_db, sample_stocks):
+        """Create sample price data once for the class."""
+        return seed_sample_prices(seed_db, sample_stocks[0])
 
     def test_prices_total_records_matches_actual_count(self, client, sample_stocks, sample_prices):
         """Test that total_records matches actual database count."""
@@ -116,15 +163,15 @@ class TestDataIntegrity:
 
         data = response.json()
         total_records = data["total_records"]
+        total_pages = data["total_pages"]
 
-        # Get all pages and count total records
-        actual_count = 0
-        for page in range(1, data["total_pages"] + 1):
-            page_response = client.get(f"/api/stocks/005930/prices?page={page}&page_size=10")
-            page_data = page_response.json()
-            actual_count += len(page_data["data"])
+        assert total_records == len(sample_prices)
+        assert total_pages == math.ceil(total_records / 10)
 
-        assert actual_count == total_records
+        # Only the last page can be short; every earlier page is full
+        last_response = client.get(f"/api/stocks/005930/prices?page={total_pages}&page_size=10")
+        expected_last_len = total_records - 10 * (total_pages - 1)
+        assert len(last_response.json()["data"]) == expected_last_len
 
     def test_pagination_no_duplicate_records(self, client, sample_stocks, sample_prices):
         """Test that pagination doesn't return duplicate records."""
@@ -186,25 +233,16 @@ class TestLargeDatasets:
     """Tests for handling large datasets."""
 
     @pytest.fixture
-    def large_stock_list(self, test_db):
-        """Create a large number of stocks for testing."""
-        from shared.database.models import Stock
-
-        stocks = []
-        for i in range(1000):
-            stock = Stock(
-                ticker=f"{i:06d}",
-                name_kr=f"종목{i}",
-                name_en=f"Stock {i}",
-                market="KOSPI" if i % 2 == 0 else "KOSDAQ",
-                sector="테스트",
-                is_active=True
-            )
-            stocks.append(stock)
-            test_db.add(stock)
+    def large_stock_list(self, client):
+        """Serve a large stock list from a mocked session instead of the database."""
+        mock_session = MagicMock()
+        stocks_query = mock_session.query.return_value.filter.return_value.order_by.return_value
+        stocks_query.limit.side_effect = lambda n: MagicMock(
+            all=MagicMock(return_value=LARGE_STOCK_LIST[:n])
+        )
 
-        test_db.commit()
-        return stocks
+        app.dependency_overrides[get_db] = lambda: mock_session
+        return LARGE_STOCK_LIST
 
     def test_get_stocks_with_large_dataset(self, client, large_stock_list):
         """Test getting stocks works with large dataset."""
@@ -239,7 +277,8 @@ class TestConcurrentAccess:
                 for _ in range(10)
             ]
 
-            results = [f.result() for f in concurrent.futures.as_completed(futures)]
+            # Results are only checked collectively, so completion order is irrelevant
+            results = [f.result() for f in futures]
 
         # All requests should succeed
         assert all(r.status_code == status.HTTP_200_OK for r in results)
@@ -4,7 +4,7 @@ Configuration loader that combines YAML files with environment variables.
 import os
 import yaml
 from pathlib import Path
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
 from functools import lru_cache
 from pydantic import BaseModel, ValidationError
 
@@ -70,8 +70,7 @@ class ConfigLoader:
     def merge_with_env(
         self,
         config: Dict[str, Any],
-        env_prefix: str = "",
-        current_path: str = ""
+        env_prefix: str = ""
     ) -> Dict[str, Any]:
         """
         Merge configuration with environment variables.
@@ -82,27 +81,45 @@ class ConfigLoader:
         Args:
             config: Configuration dictionary from YAML
             env_prefix: Prefix for environment variables
-            current_path: Current path in nested config (internal use)
 
         Returns:
             Merged configuration dictionary
         """
+        # The prefix is fixed for a whole load, so sanitize it once here
+        # instead of on every key of every nesting level.
+        return self._merge_env_level(config, env_prefix.replace(".", "_"), ())
+
+    def _merge_env_level(
+        self,
+        config: Dict[str, Any],
+        sanitized_prefix: str,
+        path_parts: Tuple[str, ...]
+    ) -> Dict[str, Any]:
+        """
+        Merge one nesting level of the configuration with environment variables.
+
+        Args:
+            config: Configuration dictionary for this level
+            sanitized_prefix: Environment variable prefix with dots replaced
+            path_parts: Upper-cased keys leading to this level
+
+        Returns:
+            Merged configuration dictionary for this level
+        """
         result = config.copy()
 
         for key, value in config.items():
-            # Build environment variable name
-            env_path = f"{current_path}_{key}".upper() if current_path else key.upper()
-            full_env_name = f"{env_prefix}{env_path}".replace(".", "_")
+            key_parts = path_parts + (str(key).upper().replace(".", "_"),)
 
             # Check if environment variable exists
-            env_value = os.getenv(full_env_name)
+            env_value = os.getenv(sanitized_prefix + "_".join(key_parts))
 
             if env_value is not None:
                 # Parse environment variable value
                 result[key] = self._parse_env_value(env_value)
             elif isinstance(value, dict):
                 # Recursively merge nested dictionaries
-                result[key] = self.merge_with_env(value, env_prefix, env_path)
+                result[key] = self._merge_env_level(value, sanitized_prefix, key_parts)
 
         return result
 
@@ -163,7 +180,7 @@ class ConfigLoader:
             merged_config = self.merge_with_env(yaml_config, env_prefix)
 
             # Validate with Pydantic model
-            validated_config = model_class(**merged_config)
+            validated_config = model_class.model_validate(merged_config)
 
             # Run any additional validation methods
             if hasattr(validated_config, 'validate_weights_sum'):
@@ -2,8 +2,18 @@
 Configuration models using Pydantic for validation.
 """
 from enum import Enum
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from functools import cached_property
+from typing import Optional, Dict, Any, Literal
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from apscheduler.triggers.cron import CronTrigger
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Build validators on first use rather than at import; most services load only
+# one or two of these configs.
+DEFERRED_CONFIG = ConfigDict(defer_build=True)
+
+# Leaf config sections are read-only once loaded
+FROZEN_CONFIG = ConfigDict(frozen=True, extra='ignore', defer_build=True)
 
 
 class PositionSizingMethod(str, Enum):
@@ -28,6 +38,8 @@ class MarketType(str, Enum):
 
 class DatabaseConfig(BaseModel):
     """Database connection configuration."""
+    model_config = DEFERRED_CONFIG
+
     url: str = Field(description="Database connection URL")
     pool_size: int = Field(default=5, ge=1, le=100, description="Connection pool size")
     max_overflow: int = Field(default=10, ge=0, le=100, description="Max overflow connections")
@@ -37,6 +49,8 @@ class DatabaseConfig(BaseModel):
 
 class RedisConfig(BaseModel):
     """Redis connection configuration."""
+    model_config = DEFERRED_CONFIG
+
     host: str = Field(default="localhost", description="Redis host")
     port: int = Field(default=6379, ge=1, le=65535, description="Redis port")
     db: int = Field(default=0, ge=0, le=15, description="Redis database number")
@@ -50,6 +64,8 @@ class RedisConfig(BaseModel):
 
 class ConvictionWeights(BaseModel):
     """Weights for conviction score calculation."""
+    model_config = DEFERRED_CONFIG
+
     weight_value: float = Field(default=0.30, ge=0.0, le=1.0, description="Value score weight")
     weight_momentum: float = Field(default=0.30, ge=0.0, le=1.0, description="Momentum score weight")
     weight_volume: float = Field(default=0.20, ge=0.0, le=1.0, description="Volume score weight")
@@ -71,6 +87,8 @@ class ConvictionWeights(BaseModel):
 
 class SignalGeneratorConfig(BaseModel):
     """Signal generator configuration."""
+    model_config = DEFERRED_CONFIG
+
     risk_tolerance: float = Field(default=2.0, ge=0.1, le=10.0, description="Portfolio risk tolerance (%)")
     max_position_size_pct: float = Field(default=10.0, ge=1.0, le=50.0, description="Max position size (%)")
     min_conviction_score: float = Field(default=60.0, ge=0.0, le=100.0, description="Min conviction score")
@@ -81,6 +99,8 @@ class SignalGeneratorConfig(BaseModel):
 
 class SignalValidatorConfig(BaseModel):
     """Signal validator configuration."""
+    model_config = DEFERRED_CONFIG
+
     max_positions: int = Field(default=20, ge=1, le=100, description="Max concurrent positions")
     max_concentration_pct: float = Field(default=30.0, ge=5.0, le=100.0, description="Max position concentration (%)")
     max_sector_concentration_pct: float = Field(default=40.0, ge=10.0, le=100.0, description="Max sector concentration (%)")
@@ -90,6 +110,8 @@ class SignalValidatorConfig(BaseModel):
 
 class CommissionConfig(BaseModel):
     """Commission and fee configuration."""
+    model_config = DEFERRED_CONFIG
+
     commission_rate: float = Field(default=0.00015, ge=0.0, le=0.01, description="Commission rate (0.015%)")
     transaction_tax_rate: float = Field(default=0.0023, ge=0.0, le=0.01, description="Transaction tax (0.23%)")
     agri_fish_tax_rate: float = Field(default=0.0015, ge=0.0, le=0.01, description="Agriculture/Fishery tax (0.15%)")
@@ -98,6 +120,8 @@ class CommissionConfig(BaseModel):
 
 class TradingEngineConfig(BaseModel):
     """Trading engine configuration."""
+    model_config = DEFERRED_CONFIG
+
     signal_generator: SignalGeneratorConfig = Field(default_factory=SignalGeneratorConfig)
     signal_validator: SignalValidatorConfig = Field(default_factory=SignalValidatorConfig)
     commission: CommissionConfig = Field(default_factory=CommissionConfig)
@@ -111,6 +135,8 @@ class TradingEngineConfig(BaseModel):
 
 class RiskParameters(BaseModel):
     """Risk management parameters."""
+    model_config = FROZEN_CONFIG
+
     max_position_size_pct: float = Field(default=10.0, ge=1.0, le=50.0, description="Max position size (%)")
     max_portfolio_risk_pct: float = Field(default=2.0, ge=0.1, le=10.0, description="Max portfolio risk (%)")
     max_drawdown_pct: float = Field(default=20.0, ge=5.0, le=50.0, description="Max drawdown (%)")
@@ -124,6 +150,8 @@ class RiskParameters(BaseModel):
 
 class PositionSizingConfig(BaseModel):
     """Position sizing configuration."""
+    model_config = FROZEN_CONFIG
+
     method: PositionSizingMethod = Field(default=PositionSizingMethod.KELLY_HALF)
     fixed_percentage: float = Field(default=5.0, ge=1.0, le=20.0, description="Fixed position size (%)")
     kelly_fraction: float = Field(default=0.5, ge=0.1, le=1.0, description="Kelly criterion fraction")
@@ -133,6 +161,8 @@ class PositionSizingConfig(BaseModel):
 
 class RiskManagerConfig(BaseModel):
     """Risk manager configuration."""
+    model_config = DEFERRED_CONFIG
+
     risk_parameters: RiskParameters = Field(default_factory=RiskParameters)
     position_sizing: PositionSizingConfig = Field(default_factory=PositionSizingConfig)
     enable_circuit_breaker: bool = Field(default=True, description="Enable circuit breaker")
@@ -145,6 +175,8 @@ class RiskManagerConfig(BaseModel):
 
 class ScreeningThresholds(BaseModel):
     """Stock screening threshold parameters."""
+    model_config = FROZEN_CONFIG
+
     # Volatility
     max_volatility_pct: float = Field(default=40.0, ge=0.0, le=200.0, description="Max annualized volatility (%)")
 
@@ -169,6 +201,8 @@ class ScreeningThresholds(BaseModel):
 
 class StockScreenerConfig(BaseModel):
     """Stock screener configuration."""
+    model_config = DEFERRED_CONFIG
+
     thresholds: ScreeningThresholds = Field(default_factory=ScreeningThresholds)
     enable_sector_filter: bool = Field(default=True, description="Enable sector filtering")
     excluded_sectors: list[str] = Field(default_factory=list, description="Excluded sector codes")
@@ -181,6 +215,8 @@ class StockScreenerConfig(BaseModel):
 
 class TechnicalIndicatorConfig(BaseModel):
     """Technical indicator calculation parameters."""
+    model_config = FROZEN_CONFIG
+
     # RSI
     rsi_period: int = Field(default=14, ge=2, le=100, description="RSI period")
     rsi_overbought: float = Field(default=70.0, ge=50.0, le=90.0, description="RSI overbought threshold")
@@ -209,6 +245,8 @@ class TechnicalIndicatorConfig(BaseModel):
 
 class IndicatorCalculatorConfig(BaseModel):
     """Indicator calculator configuration."""
+    model_config = DEFERRED_CONFIG
+
     indicators: TechnicalIndicatorConfig = Field(default_factory=TechnicalIndicatorConfig)
     enable_caching: bool = Field(default=True, description="Enable result caching")
     cache_ttl_seconds: int = Field(default=3600, ge=60, le=86400, description="Cache TTL in seconds")
@@ -220,6 +258,8 @@ class IndicatorCalculatorConfig(BaseModel):
 
 class SchedulerConfig(BaseModel):
     """Data collection scheduler configuration."""
+    model_config = FROZEN_CONFIG
+
     # Cron expressions for different jobs
     market_data_cron: str = Field(default="0 9-15 * * 1-5", description="Market data collection cron (weekdays 9am-3pm)")
     financial_data_cron: str = Field(default="0 18 * * 1-5", description="Financial data collection cron (weekdays 6pm)")
@@ -232,9 +272,33 @@ class SchedulerConfig(BaseModel):
     # Timezone
     timezone: str = Field(default="Asia/Seoul", description="Scheduler timezone")
 
+    @field_validator('market_data_cron', 'financial_data_cron', 'fundamental_data_cron')
+    @classmethod
+    def validate_cron(cls, v):
+        """Reject malformed cron expressions when the config is loaded."""
+        CronTrigger.from_crontab(v)
+        return v
+
+    @field_validator('timezone')
+    @classmethod
+    def validate_timezone(cls, v):
+        """Reject unknown IANA timezone names when the config is loaded."""
+        try:
+            ZoneInfo(v)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown timezone: {v!r}")
+        return v
+
+    @cached_property
+    def tz(self) -> ZoneInfo:
+        """Scheduler timezone, resolved once per config instance."""
+        return ZoneInfo(self.timezone)
+
 
 class DataCollectorConfig(BaseModel):
     """Data collector configuration."""
+    model_config = DEFERRED_CONFIG
+
     scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig)
     enable_scheduler: bool = Field(default=True, description="Enable scheduled collection")
     batch_size: int = Field(default=100, ge=10, le=1000, description="Batch size for bulk operations")
@@ -247,6 +311,8 @@ class DataCollectorConfig(BaseModel):
 
 class PriceMonitorConfig(BaseModel):
     """Price monitor configuration."""
+    model_config = FROZEN_CONFIG
+
     poll_interval_seconds: int = Field(default=60, ge=10, le=300, description="Polling interval")
     significant_change_threshold_pct: float = Field(default=5.0, ge=0.1, le=20.0, description="Significant price change (%)")
     market_open_hour: int = Field(default=9, ge=0, le=23, description="Market open hour")
@@ -261,17 +327,16 @@ class PriceMonitorConfig(BaseModel):
 
 class LoggingConfig(BaseModel):
     """Logging configuration."""
-    level: str = Field(default="INFO", description="Log level")
+    model_config = FROZEN_CONFIG
+
+    level: Literal['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'] = Field(default="INFO", description="Log level")
     format: str = Field(default="json", description="Log format (json or text)")
     file_path: Optional[str] = Field(default=None, description="Log file path")
     max_file_size_mb: int = Field(default=100, ge=1, le=1000, description="Max log file size (MB)")
     backup_count: int = Field(default=5, ge=1, le=30, description="Number of backup log files")
 
-    @field_validator('level')
+    @field_validator('level', mode='before')
     @classmethod
-    def validate_log_level(cls, v):
-        """Validate log level."""
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if v.upper() not in valid_levels:
-            raise ValueError(f"Log level must be one of {valid_levels}")
-        return v.upper()
+    def normalize_log_level(cls, v):
+        """Accept log levels case-insensitively; the Literal type does the check."""
+        return v.upper() if isinstance(v, str) else v
@@ -6,6 +6,7 @@ import os
 import sys
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy import text
 
 from alembic import context
 
@@ -87,6 +88,13 @@ def run_migrations_online() -> None:
         )
 
         with context.begin_transaction():
+            if connection.dialect.name == 'postgresql' and settings.db_migration_maintenance_work_mem:
+                # Index builds on populated tables (covering indexes, partition
+                # rebuilds) sort in memory instead of spilling to temp files
+                connection.execute(
+                    text("SELECT set_config('maintenance_work_mem', :value, false)"),
+                    {'value': settings.db_migration_maintenance_work_mem},
+                )
             context.run_migrations()
 
 
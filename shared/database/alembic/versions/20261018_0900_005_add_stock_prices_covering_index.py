@@ -0,0 +1,39 @@
+"""add covering index for screener scans on stock_prices
+
+Revision ID: 20261018_0900_005
+Revises: 20251028_1100_004
+Create Date: 2026-10-18 09:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_0900_005'
+down_revision = '20251028_1100_004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Replace the (date, volume) index with a covering index for screening.
+
+    Volume/trading value filters over a date window can then be answered with an
+    index-only scan. The old index is a strict prefix of the new one, so it is
+    dropped rather than maintained alongside it.
+    """
+    op.create_index(
+        'ix_stock_prices_date_vol_tv',
+        'stock_prices',
+        ['date', 'volume', 'trading_value'],
+        unique=False,
+        postgresql_include=['close', 'stock_id'],
+    )
+    op.drop_index('ix_stock_prices_date_volume', 'stock_prices')
+
+
+def downgrade():
+    """Restore the plain (date, volume) index."""
+    op.create_index('ix_stock_prices_date_volume', 'stock_prices', ['date', 'volume'], unique=False)
+    op.drop_index('ix_stock_prices_date_vol_tv', 'stock_prices')
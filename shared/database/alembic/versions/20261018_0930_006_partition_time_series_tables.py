@@ -0,0 +1,109 @@
+"""partition stock_prices and technical_indicators by date
+
+Revision ID: 20261018_0930_006
+Revises: 20261018_0900_005
+Create Date: 2026-10-18 09:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_0930_006'
+down_revision = '20261018_0900_005'
+branch_labels = None
+depends_on = None
+
+
+# Time-series tables converted to RANGE (date) partitioning
+PARTITIONED_TABLES = ['stock_prices', 'technical_indicators']
+
+# Yearly partitions for this span; rows outside it land in the DEFAULT
+# partition. Fixed bounds keep the schema independent of when the revision
+# runs; shared/database/partitions.py adds later years as they come up.
+FIRST_PARTITION_YEAR = 2000
+LAST_PARTITION_YEAR = 2031
+
+# Secondary indexes as of revision 005, recreated on the rebuilt tables.
+# Listed rather than read from the catalog so `alembic upgrade --sql` works.
+SECONDARY_INDEXES = {
+    'stock_prices': [
+        ('ix_stock_prices_id', ['id'], {}),
+        ('ix_stock_prices_stock_id', ['stock_id'], {}),
+        ('ix_stock_prices_date', ['date'], {}),
+        ('ix_stock_prices_stock_date', ['stock_id', 'date'], {}),
+        (
+            'ix_stock_prices_date_vol_tv',
+            ['date', 'volume', 'trading_value'],
+            {'postgresql_include': ['close', 'stock_id']},
+        ),
+    ],
+    'technical_indicators': [
+        ('ix_technical_indicators_id', ['id'], {}),
+        ('ix_technical_indicators_stock_id', ['stock_id'], {}),
+        ('ix_technical_indicators_date', ['date'], {}),
+        ('ix_tech_indicators_stock_date', ['stock_id', 'date'], {}),
+    ],
+}
+
+
+def _swap_table(table, partitioned):
+    """Rebuild a table as partitioned (or plain) and move its rows across.
+
+    Column definitions, defaults, NOT NULL constraints and comments are copied
+    with LIKE, the id sequence is handed over to the new table, and secondary
+    indexes are recreated once the old table (and its index names) is gone.
+    """
+    old_table = f'{table}_old'
+
+    op.execute(f'ALTER TABLE {table} RENAME TO {old_table}')
+
+    like = f'LIKE {old_table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS'
+    if partitioned:
+        op.execute(f'CREATE TABLE {table} ({like}) PARTITION BY RANGE (date)')
+        for year in range(FIRST_PARTITION_YEAR, LAST_PARTITION_YEAR + 1):
+            op.execute(
+                f"CREATE TABLE {table}_y{year} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+            )
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+    else:
+        op.execute(f'CREATE TABLE {table} ({like})')
+
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old_table}')
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+    op.execute(f'DROP TABLE {old_table} CASCADE')
+
+    # The partition key must be part of every unique constraint on a partitioned table
+    primary_key = 'id, date' if partitioned else 'id'
+    op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({primary_key})')
+    op.execute(
+        f'ALTER TABLE {table} ADD CONSTRAINT {table}_stock_id_fkey '
+        f'FOREIGN KEY (stock_id) REFERENCES stocks (id) ON DELETE CASCADE'
+    )
+    for name, columns, options in SECONDARY_INDEXES[table]:
+        op.create_index(name, table, columns, unique=False, **options)
+
+
+def upgrade():
+    """Convert time-series tables to yearly RANGE (date) partitions.
+
+    Indexes created on the parent are propagated to every partition, and
+    date-bounded queries only touch the partitions they need. SQLite and other
+    backends keep plain tables.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in PARTITIONED_TABLES:
+        _swap_table(table, partitioned=True)
+
+
+def downgrade():
+    """Convert partitioned time-series tables back to plain tables."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in reversed(PARTITIONED_TABLES):
+        _swap_table(table, partitioned=False)
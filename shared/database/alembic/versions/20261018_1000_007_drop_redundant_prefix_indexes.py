@@ -0,0 +1,38 @@
+"""drop single-column indexes already covered by composite indexes
+
+Revision ID: 20261018_1000_007
+Revises: 20261018_0930_006
+Create Date: 2026-10-18 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1000_007'
+down_revision = '20261018_0930_006'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, column) -> covered by a composite index leading with the same column
+REDUNDANT_INDEXES = [
+    ('ix_stock_prices_stock_id', 'stock_prices', 'stock_id'),              # ix_stock_prices_stock_date
+    ('ix_technical_indicators_stock_id', 'technical_indicators', 'stock_id'),  # ix_tech_indicators_stock_date
+    ('ix_fundamental_indicators_stock_id', 'fundamental_indicators', 'stock_id'),  # ix_fund_indicators_stock_date
+    ('ix_watchlist_user_id', 'watchlist', 'user_id'),                      # ix_watchlist_user_ticker
+    ('ix_portfolios_user_id', 'portfolios', 'user_id'),                    # ix_portfolios_user_ticker
+]
+
+
+def upgrade():
+    """Drop indexes whose column is the leading column of a composite index."""
+    for index_name, table, _column in REDUNDANT_INDEXES:
+        op.drop_index(index_name, table)
+
+
+def downgrade():
+    """Recreate the single-column indexes."""
+    for index_name, table, column in reversed(REDUNDANT_INDEXES):
+        op.create_index(index_name, table, [column], unique=False)
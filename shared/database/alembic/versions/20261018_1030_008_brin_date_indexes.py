@@ -0,0 +1,47 @@
+"""replace btree date indexes on time-series tables with BRIN
+
+Revision ID: 20261018_1030_008
+Revises: 20261018_1000_007
+Create Date: 2026-10-18 10:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1030_008'
+down_revision = '20261018_1000_007'
+branch_labels = None
+depends_on = None
+
+
+# Append-mostly tables whose physical row order follows date.
+# Per-stock lookups keep using the (stock_id, date) btree indexes.
+BRIN_TABLES = ['stock_prices', 'technical_indicators', 'fundamental_indicators']
+
+
+def upgrade():
+    """Swap the single-column btree on date for a BRIN index."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in BRIN_TABLES:
+        op.drop_index(f'ix_{table}_date', table)
+        op.create_index(
+            f'ix_{table}_date_brin',
+            table,
+            ['date'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        )
+
+
+def downgrade():
+    """Restore the btree date indexes."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in reversed(BRIN_TABLES):
+        op.drop_index(f'ix_{table}_date_brin', table)
+        op.create_index(f'ix_{table}_date', table, ['date'], unique=False)
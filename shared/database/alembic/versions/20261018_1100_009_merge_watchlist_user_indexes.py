@@ -0,0 +1,42 @@
+"""merge watchlist per-user sort indexes into one partial covering index
+
+Revision ID: 20261018_1100_009
+Revises: 20261018_1030_008
+Create Date: 2026-10-18 11:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1100_009'
+down_revision = '20261018_1030_008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Replace (user_id, score) and (user_id, added_date) with one index on active rows.
+
+    Ranked watchlist reads filter on user_id and is_active and order by score, so
+    the partial index serves them and carries ticker/added_date for the tie-break.
+    Ticker lookups and queries over inactive entries keep ix_watchlist_user_ticker.
+    """
+    op.create_index(
+        'ix_watchlist_user_active',
+        'watchlist',
+        ['user_id', 'score'],
+        unique=False,
+        postgresql_include=['ticker', 'added_date'],
+        postgresql_where=sa.text('is_active'),
+    )
+    op.drop_index('ix_watchlist_user_added', 'watchlist')
+    op.drop_index('ix_watchlist_user_score', 'watchlist')
+
+
+def downgrade():
+    """Restore the separate per-user sort indexes."""
+    op.create_index('ix_watchlist_user_score', 'watchlist', ['user_id', 'score'], unique=False)
+    op.create_index('ix_watchlist_user_added', 'watchlist', ['user_id', 'added_date'], unique=False)
+    op.drop_index('ix_watchlist_user_active', 'watchlist')
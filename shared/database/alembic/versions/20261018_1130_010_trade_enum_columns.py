@@ -0,0 +1,58 @@
+"""store trade action, order type and status as native enums
+
+Revision ID: 20261018_1130_010
+Revises: 20261018_1100_009
+Create Date: 2026-10-18 11:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1130_010'
+down_revision = '20261018_1100_009'
+branch_labels = None
+depends_on = None
+
+
+# column -> (enum type name, allowed values, previous VARCHAR length)
+TRADE_ENUM_COLUMNS = {
+    'action': ('trade_action', ('BUY', 'SELL'), 10),
+    'order_type': ('trade_order_type', ('MARKET', 'LIMIT', 'STOP_LOSS', 'STOP_LIMIT'), 20),
+    'status': ('trade_status', ('PENDING', 'EXECUTED', 'PARTIALLY_FILLED', 'CANCELLED', 'FAILED'), 20),
+}
+
+
+def upgrade():
+    """Convert trades.action/order_type/status from VARCHAR to ENUM types."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column, (type_name, values, _length) in TRADE_ENUM_COLUMNS.items():
+        enum_type = postgresql.ENUM(*values, name=type_name)
+        enum_type.create(op.get_bind(), checkfirst=True)
+        op.alter_column(
+            'trades',
+            column,
+            type_=enum_type,
+            existing_nullable=False,
+            postgresql_using=f'upper({column})::{type_name}',
+        )
+
+
+def downgrade():
+    """Convert the enum columns back to VARCHAR and drop the types."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column, (type_name, values, length) in TRADE_ENUM_COLUMNS.items():
+        op.alter_column(
+            'trades',
+            column,
+            type_=sa.String(length),
+            existing_nullable=False,
+            postgresql_using=f'{column}::text',
+        )
+        postgresql.ENUM(name=type_name).drop(op.get_bind(), checkfirst=True)
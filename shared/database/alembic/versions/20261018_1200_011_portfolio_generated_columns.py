@@ -0,0 +1,53 @@
+"""generate portfolio value and pnl columns in the database
+
+Revision ID: 20261018_1200_011
+Revises: 20261018_1130_010
+Create Date: 2026-10-18 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1200_011'
+down_revision = '20261018_1130_010'
+branch_labels = None
+depends_on = None
+
+
+# column -> (type, generation expression, comment)
+DERIVED_COLUMNS = {
+    'current_value': (sa.BigInteger(), 'quantity * current_price', 'Current total value (quantity * current_price)'),
+    'invested_amount': (sa.BigInteger(), 'quantity * avg_price', 'Total invested amount (quantity * avg_price)'),
+    'unrealized_pnl': (sa.BigInteger(), 'quantity * (current_price - avg_price)', 'Unrealized profit/loss in KRW'),
+    'unrealized_pnl_pct': (sa.Float(), '(current_price - avg_price) * 100.0 / NULLIF(avg_price, 0)', 'Unrealized profit/loss percentage'),
+}
+
+
+def upgrade():
+    """Replace app-maintained derived columns with STORED generated columns.
+
+    PostgreSQL cannot turn an existing column into a generated one, so each
+    column is dropped and re-added; values are recomputed from quantity,
+    avg_price and current_price.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column, (column_type, expression, comment) in DERIVED_COLUMNS.items():
+        op.drop_column('portfolios', column)
+        op.add_column('portfolios', sa.Column(
+            column, column_type, sa.Computed(expression, persisted=True), comment=comment
+        ))
+
+
+def downgrade():
+    """Turn the generated columns back into plain columns, keeping their values."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column, (column_type, expression, comment) in DERIVED_COLUMNS.items():
+        op.drop_column('portfolios', column)
+        op.add_column('portfolios', sa.Column(column, column_type, nullable=True, comment=comment))
+        op.execute(f'UPDATE portfolios SET {column} = {expression}')
@@ -0,0 +1,130 @@
+"""set created_at/updated_at in the database
+
+Revision ID: 20261018_1230_012
+Revises: 20261018_1200_011
+Create Date: 2026-10-18 12:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1230_012'
+down_revision = '20261018_1200_011'
+branch_labels = None
+depends_on = None
+
+
+# Timestamp columns of the Alembic-managed tables at revision 011
+TIMESTAMP_COLUMNS = {
+    'stocks': ('created_at', 'updated_at'),
+    'stock_prices': ('created_at',),
+    'technical_indicators': ('created_at',),
+    'fundamental_indicators': ('created_at', 'updated_at'),
+    'stability_scores': ('created_at', 'updated_at'),
+    'trades': ('created_at', 'updated_at'),
+    'portfolios': ('created_at', 'updated_at'),
+    'composite_scores': ('created_at', 'updated_at'),
+    'watchlist': ('created_at', 'updated_at'),
+    'watchlist_history': ('created_at',),
+}
+
+# Naive UTC, matching the datetime.utcnow() values already stored
+UTC_NOW = "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+# portfolio_risk_metrics is created outside Alembic (by create_all), so it is
+# only altered when present. The check runs in SQL to keep --sql rendering working.
+UPGRADE_PORTFOLIO_RISK_METRICS = f"""
+    DO $$
+    BEGIN
+        IF to_regclass('portfolio_risk_metrics') IS NOT NULL THEN
+            UPDATE portfolio_risk_metrics SET created_at = {UTC_NOW} WHERE created_at IS NULL;
+            UPDATE portfolio_risk_metrics SET updated_at = created_at WHERE updated_at IS NULL;
+            ALTER TABLE portfolio_risk_metrics
+                ALTER COLUMN created_at SET DEFAULT {UTC_NOW},
+                ALTER COLUMN created_at SET NOT NULL,
+                ALTER COLUMN updated_at SET DEFAULT {UTC_NOW},
+                ALTER COLUMN updated_at SET NOT NULL;
+            CREATE TRIGGER trg_portfolio_risk_metrics_updated_at BEFORE UPDATE ON portfolio_risk_metrics
+                FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+        END IF;
+    END
+    $$
+"""
+
+DOWNGRADE_PORTFOLIO_RISK_METRICS = """
+    DO $$
+    BEGIN
+        IF to_regclass('portfolio_risk_metrics') IS NOT NULL THEN
+            DROP TRIGGER IF EXISTS trg_portfolio_risk_metrics_updated_at ON portfolio_risk_metrics;
+            ALTER TABLE portfolio_risk_metrics
+                ALTER COLUMN created_at DROP NOT NULL,
+                ALTER COLUMN created_at DROP DEFAULT,
+                ALTER COLUMN updated_at DROP NOT NULL,
+                ALTER COLUMN updated_at DROP DEFAULT;
+        END IF;
+    END
+    $$
+"""
+
+
+def _timestamp_columns():
+    """Yield (table, column) for the Alembic-managed timestamp columns."""
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            yield table, column
+
+
+def upgrade():
+    """Default timestamps to now() and maintain updated_at with a trigger."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := {UTC_NOW};
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table, column in _timestamp_columns():
+        fallback = 'created_at' if column == 'updated_at' else UTC_NOW
+        op.execute(f'UPDATE {table} SET {column} = COALESCE({fallback}, {UTC_NOW}) WHERE {column} IS NULL')
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            nullable=False,
+            server_default=sa.text(UTC_NOW),
+        )
+        if column == 'updated_at':
+            op.execute(
+                f'CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} '
+                f'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+            )
+
+    op.execute(UPGRADE_PORTFOLIO_RISK_METRICS)
+
+
+def downgrade():
+    """Drop the triggers and database defaults."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(DOWNGRADE_PORTFOLIO_RISK_METRICS)
+
+    for table, column in _timestamp_columns():
+        if column == 'updated_at':
+            op.execute(f'DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}')
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            nullable=True,
+            server_default=None,
+        )
+
+    op.execute('DROP FUNCTION IF EXISTS set_updated_at()')
@@ -0,0 +1,60 @@
+"""store bounded counters as SMALLINT
+
+Revision ID: 20261018_1300_013
+Revises: 20261018_1230_012
+Create Date: 2026-10-18 13:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1300_013'
+down_revision = '20261018_1230_012'
+branch_labels = None
+depends_on = None
+
+
+# Counts bounded by trading days or metric counts; all fit in SMALLINT (max 32767)
+SMALLINT_COLUMNS = {
+    'stability_scores': ['data_points_price', 'data_points_earnings', 'data_points_debt', 'calculation_period_days'],
+    'composite_scores': ['missing_value_count', 'total_metric_count'],
+    'watchlist_history': ['days_on_watchlist'],
+}
+
+# portfolio_risk_metrics is created outside Alembic and may not exist yet; the
+# check runs in SQL so alembic upgrade --sql still renders
+OPTIONAL_TABLE = 'portfolio_risk_metrics'
+OPTIONAL_COLUMNS = ['drawdown_duration_days', 'position_count', 'position_size_violations']
+
+
+def _alter_counters(new_type, old_type):
+    for table, columns in SMALLINT_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, type_=new_type, existing_type=old_type)
+
+    alters = ', '.join(f'ALTER COLUMN {column} TYPE {new_type.compile()}' for column in OPTIONAL_COLUMNS)
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF to_regclass('{OPTIONAL_TABLE}') IS NOT NULL THEN
+                ALTER TABLE {OPTIONAL_TABLE} {alters};
+            END IF;
+        END
+        $$
+    """)
+
+
+def upgrade():
+    """Narrow bounded counters from INTEGER to SMALLINT."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _alter_counters(sa.SmallInteger(), sa.Integer())
+
+
+def downgrade():
+    """Widen the counters back to INTEGER."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _alter_counters(sa.Integer(), sa.SmallInteger())
@@ -0,0 +1,65 @@
+"""move sparse fundamental ratios into a metrics jsonb column
+
+Revision ID: 20261018_1330_014
+Revises: 20261018_1300_013
+Create Date: 2026-10-18 13:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1330_014'
+down_revision = '20261018_1300_013'
+branch_labels = None
+depends_on = None
+
+
+# Ratios that are only ever read per row; filtered ratios (per, pbr, roe,
+# debt_ratio, current_ratio, ...) stay as native columns.
+JSON_METRICS = {
+    'pcr': 'Price to Cashflow Ratio',
+    'roa': 'Return on Assets (%)',
+    'roic': 'Return on Invested Capital (%)',
+    'debt_to_equity': 'Debt to Equity Ratio',
+    'quick_ratio': 'Quick Ratio (Acid Test)',
+    'interest_coverage': 'Interest Coverage Ratio',
+    'dividend_payout_ratio': 'Dividend Payout Ratio (%)',
+    'cps': 'Cashflow Per Share',
+    'sps': 'Sales Per Share',
+}
+
+
+def upgrade():
+    """Pack the sparse ratio columns into fundamental_indicators.metrics."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.add_column('fundamental_indicators', sa.Column(
+        'metrics', postgresql.JSONB(), nullable=True, comment='Rarely queried ratios keyed by name'
+    ))
+
+    pairs = ', '.join(f"'{name}', {name}" for name in JSON_METRICS)
+    op.execute(
+        "UPDATE fundamental_indicators "
+        f"SET metrics = NULLIF(jsonb_strip_nulls(jsonb_build_object({pairs})), '{{}}'::jsonb)"
+    )
+
+    for name in JSON_METRICS:
+        op.drop_column('fundamental_indicators', name)
+
+
+def downgrade():
+    """Restore the ratio columns from metrics and drop it."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for name, comment in JSON_METRICS.items():
+        op.add_column('fundamental_indicators', sa.Column(name, sa.Float(), nullable=True, comment=comment))
+
+    assignments = ', '.join(f"{name} = (metrics ->> '{name}')::double precision" for name in JSON_METRICS)
+    op.execute(f"UPDATE fundamental_indicators SET {assignments} WHERE metrics IS NOT NULL")
+
+    op.drop_column('fundamental_indicators', 'metrics')
@@ -0,0 +1,45 @@
+"""store technical indicator values as real (float4)
+
+Revision ID: 20261018_1400_015
+Revises: 20261018_1330_014
+Create Date: 2026-10-18 14:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1400_015'
+down_revision = '20261018_1330_014'
+branch_labels = None
+depends_on = None
+
+
+# obv and volume_ma_20 stay BIGINT
+REAL_COLUMNS = [
+    'rsi_14', 'rsi_9', 'stochastic_k', 'stochastic_d',
+    'macd', 'macd_signal', 'macd_histogram', 'adx',
+    'sma_5', 'sma_20', 'sma_50', 'sma_120', 'sma_200', 'ema_12', 'ema_26',
+    'bollinger_upper', 'bollinger_middle', 'bollinger_lower', 'atr',
+]
+
+
+def _alter_columns(sql_type):
+    # A single ALTER TABLE so the (partitioned) table is rewritten only once
+    alterations = ', '.join(f'ALTER COLUMN {column} TYPE {sql_type}' for column in REAL_COLUMNS)
+    op.execute(f'ALTER TABLE technical_indicators {alterations}')
+
+
+def upgrade():
+    """Narrow indicator columns from double precision to real."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _alter_columns('real')
+
+
+def downgrade():
+    """Widen indicator columns back to double precision."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _alter_columns('double precision')
@@ -0,0 +1,37 @@
+"""drop score-table indexes already covered by composite indexes
+
+Revision ID: 20261018_1430_016
+Revises: 20261018_1400_015
+Create Date: 2026-10-18 14:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1430_016'
+down_revision = '20261018_1400_015'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, column) -> covered by a composite index leading with the same column
+REDUNDANT_INDEXES = [
+    ('ix_stability_scores_stock_id', 'stability_scores', 'stock_id'),            # ix_stability_scores_stock_date
+    ('ix_composite_scores_stock_id', 'composite_scores', 'stock_id'),            # ix_composite_scores_stock_date
+    ('ix_watchlist_history_watchlist_id', 'watchlist_history', 'watchlist_id'),  # ix_watchlist_history_watchlist_date
+    ('ix_watchlist_history_stock_id', 'watchlist_history', 'stock_id'),          # ix_watchlist_history_stock_date
+]
+
+
+def upgrade():
+    """Drop indexes whose column is the leading column of a composite index."""
+    for index_name, table, _column in REDUNDANT_INDEXES:
+        op.drop_index(index_name, table)
+
+
+def downgrade():
+    """Recreate the single-column indexes."""
+    for index_name, table, column in reversed(REDUNDANT_INDEXES):
+        op.create_index(index_name, table, [column], unique=False)
@@ -0,0 +1,51 @@
+"""store watchlist_history.criteria_violations as jsonb
+
+Revision ID: 20261018_1500_017
+Revises: 20261018_1430_016
+Create Date: 2026-10-18 15:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1500_017'
+down_revision = '20261018_1430_016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Convert criteria_violations from free text to a JSON list."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Existing free-text values are kept as a single-element list
+    op.alter_column(
+        'watchlist_history',
+        'criteria_violations',
+        existing_type=sa.Text(),
+        type_=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using=(
+            'CASE WHEN criteria_violations IS NULL THEN NULL '
+            'ELSE jsonb_build_array(criteria_violations) END'
+        ),
+    )
+
+
+def downgrade():
+    """Convert criteria_violations back to text."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.alter_column(
+        'watchlist_history',
+        'criteria_violations',
+        existing_type=postgresql.JSONB(),
+        type_=sa.Text(),
+        existing_nullable=True,
+        postgresql_using='criteria_violations::text',
+    )
@@ -0,0 +1,43 @@
+"""make the per-date score indexes unique
+
+Revision ID: 20261018_1530_018
+Revises: 20261018_1500_017
+Create Date: 2026-10-18 15:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1530_018'
+down_revision = '20261018_1500_017'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, key columns) -> one row per key, usable as an ON CONFLICT target
+UNIQUE_INDEXES = [
+    ('ix_stability_scores_stock_date', 'stability_scores', ['stock_id', 'date']),
+    ('ix_composite_scores_stock_date', 'composite_scores', ['stock_id', 'date']),
+    ('ix_watchlist_history_watchlist_date', 'watchlist_history', ['watchlist_id', 'date']),
+]
+
+
+def upgrade():
+    """Remove duplicate rows per key, keeping the newest, and rebuild the indexes as unique."""
+    for index_name, table, columns in UNIQUE_INDEXES:
+        key = ', '.join(columns)
+        op.execute(
+            f'DELETE FROM {table} WHERE id NOT IN '
+            f'(SELECT MAX(id) FROM {table} GROUP BY {key})'
+        )
+        op.drop_index(index_name, table)
+        op.create_index(index_name, table, columns, unique=True)
+
+
+def downgrade():
+    """Rebuild the indexes as non-unique."""
+    for index_name, table, columns in reversed(UNIQUE_INDEXES):
+        op.drop_index(index_name, table)
+        op.create_index(index_name, table, columns, unique=False)
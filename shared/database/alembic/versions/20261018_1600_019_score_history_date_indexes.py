@@ -0,0 +1,44 @@
+"""slim the date indexes on composite_scores and watchlist_history
+
+Revision ID: 20261018_1600_019
+Revises: 20261018_1530_018
+Create Date: 2026-10-18 16:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1600_019'
+down_revision = '20261018_1530_018'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Drop the covered composite_scores date index and use BRIN for watchlist_history."""
+    # Date ranges on composite_scores are served by ix_composite_scores_date_score
+    op.drop_index('ix_composite_scores_date', 'composite_scores')
+
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Snapshots are appended in date order, so a BRIN summary is enough
+    op.drop_index('ix_watchlist_history_date', 'watchlist_history')
+    op.create_index(
+        'ix_watchlist_history_date_brin',
+        'watchlist_history',
+        ['date'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def downgrade():
+    """Restore the btree date indexes."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_watchlist_history_date_brin', 'watchlist_history')
+        op.create_index('ix_watchlist_history_date', 'watchlist_history', ['date'], unique=False)
+
+    op.create_index('ix_composite_scores_date', 'composite_scores', ['date'], unique=False)
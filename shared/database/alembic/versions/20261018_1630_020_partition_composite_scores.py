@@ -0,0 +1,96 @@
+"""partition composite_scores by date
+
+Revision ID: 20261018_1630_020
+Revises: 20261018_1600_019
+Create Date: 2026-10-18 16:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1630_020'
+down_revision = '20261018_1600_019'
+branch_labels = None
+depends_on = None
+
+
+TABLE = 'composite_scores'
+
+# Same layout as stock_prices/technical_indicators (revision 006): yearly
+# partitions over a fixed span plus a DEFAULT partition for anything outside
+# it. shared/database/partitions.py adds later years as they come up.
+FIRST_PARTITION_YEAR = 2000
+LAST_PARTITION_YEAR = 2031
+
+# Secondary indexes as of revision 019, recreated on the rebuilt table.
+# Listed rather than read from the catalog so `alembic upgrade --sql` works.
+SECONDARY_INDEXES = [
+    ('ix_composite_scores_score', ['composite_score'], False),
+    ('ix_composite_scores_date_score', ['date', 'composite_score'], False),
+    ('ix_composite_scores_stock_date', ['stock_id', 'date'], True),
+]
+
+
+def _swap_table(table, partitioned):
+    """Rebuild a table as partitioned (or plain) and move its rows across.
+
+    LIKE copies columns, defaults, NOT NULL constraints and comments. The
+    foreign key, secondary indexes and the updated_at trigger (revision 012)
+    are dropped with the old table, so they are recreated afterwards.
+    """
+    old_table = f'{table}_old'
+
+    op.execute(f'ALTER TABLE {table} RENAME TO {old_table}')
+
+    like = f'LIKE {old_table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS'
+    if partitioned:
+        op.execute(f'CREATE TABLE {table} ({like}) PARTITION BY RANGE (date)')
+        for year in range(FIRST_PARTITION_YEAR, LAST_PARTITION_YEAR + 1):
+            op.execute(
+                f"CREATE TABLE {table}_y{year} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+            )
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+    else:
+        op.execute(f'CREATE TABLE {table} ({like})')
+
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old_table}')
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+    op.execute(f'DROP TABLE {old_table} CASCADE')
+
+    # The partition key must be part of every unique constraint on a partitioned table
+    primary_key = 'id, date' if partitioned else 'id'
+    op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({primary_key})')
+    op.execute(
+        f'ALTER TABLE {table} ADD CONSTRAINT {table}_stock_id_fkey '
+        f'FOREIGN KEY (stock_id) REFERENCES stocks (id) ON DELETE CASCADE'
+    )
+    for name, columns, unique in SECONDARY_INDEXES:
+        op.create_index(name, table, columns, unique=unique)
+    # set_updated_at() is defined in revision 012
+    op.execute(
+        f'CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} '
+        f'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+    )
+
+
+def upgrade():
+    """Convert composite_scores to yearly RANGE (date) partitions.
+
+    The (stock_id, date) unique index already includes the partition key, so
+    it carries over unchanged and keeps serving as the upsert conflict target.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _swap_table(TABLE, partitioned=True)
+
+
+def downgrade():
+    """Convert composite_scores back to a plain table."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _swap_table(TABLE, partitioned=False)
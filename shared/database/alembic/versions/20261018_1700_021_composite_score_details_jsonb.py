@@ -0,0 +1,72 @@
+"""move composite score breakdowns into a details jsonb column
+
+Revision ID: 20261018_1700_021
+Revises: 20261018_1630_020
+Create Date: 2026-10-18 17:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1700_021'
+down_revision = '20261018_1630_020'
+branch_labels = None
+depends_on = None
+
+
+# Breakdown scores that are only read per row; the value/growth/quality/
+# momentum and composite scores stay as native columns.
+DETAIL_SCORES = {
+    'per_score': 'PER score component (0-100)',
+    'pbr_score': 'PBR score component (0-100)',
+    'dividend_yield_score': 'Dividend yield score component (0-100)',
+    'psr_score': 'PSR score component (0-100)',
+    'revenue_growth_score': 'Revenue growth score component (0-100)',
+    'earnings_growth_score': 'Earnings growth score component (0-100)',
+    'equity_growth_score': 'Equity growth score component (0-100)',
+    'roe_score': 'ROE score component (0-100)',
+    'operating_margin_score': 'Operating margin score component (0-100)',
+    'net_margin_score': 'Net margin score component (0-100)',
+    'debt_ratio_score': 'Debt ratio score component (0-100)',
+    'current_ratio_score': 'Current ratio score component (0-100)',
+    'rsi_score': 'RSI score component (0-100)',
+    'price_trend_score': 'Price trend score component (0-100)',
+    'macd_score': 'MACD score component (0-100)',
+    'volume_trend_score': 'Volume trend score component (0-100)',
+}
+
+
+def upgrade():
+    """Pack the breakdown score columns into composite_scores.details."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.add_column('composite_scores', sa.Column(
+        'details', postgresql.JSONB(), nullable=True, comment='Component score breakdown keyed by name'
+    ))
+
+    pairs = ', '.join(f"'{name}', {name}" for name in DETAIL_SCORES)
+    op.execute(
+        "UPDATE composite_scores "
+        f"SET details = NULLIF(jsonb_strip_nulls(jsonb_build_object({pairs})), '{{}}'::jsonb)"
+    )
+
+    for name in DETAIL_SCORES:
+        op.drop_column('composite_scores', name)
+
+
+def downgrade():
+    """Restore the breakdown score columns from details and drop it."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for name, comment in DETAIL_SCORES.items():
+        op.add_column('composite_scores', sa.Column(name, sa.Float(), nullable=True, comment=comment))
+
+    assignments = ', '.join(f"{name} = (details ->> '{name}')::double precision" for name in DETAIL_SCORES)
+    op.execute(f"UPDATE composite_scores SET {assignments} WHERE details IS NOT NULL")
+
+    op.drop_column('composite_scores', 'details')
@@ -0,0 +1,46 @@
+"""enable pg_stat_statements
+
+Revision ID: 20261018_1730_022
+Revises: 20261018_1700_021
+Create Date: 2026-10-18 17:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1730_022'
+down_revision = '20261018_1700_021'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the pg_stat_statements extension for per-query statistics.
+
+    The view only returns data when the server is started with
+    shared_preload_libraries=pg_stat_statements (see docker-compose.yml).
+    Servers built without the contrib modules are left unchanged.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Checked in SQL rather than on the bind so `alembic upgrade --sql` works
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_stat_statements') THEN
+                CREATE EXTENSION IF NOT EXISTS pg_stat_statements;
+            END IF;
+        END
+        $$
+    """)
+
+
+def downgrade():
+    """Drop the pg_stat_statements extension."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP EXTENSION IF EXISTS pg_stat_statements')
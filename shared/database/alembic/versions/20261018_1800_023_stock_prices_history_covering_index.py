@@ -0,0 +1,51 @@
+"""cover per-stock price history reads with ix_stock_prices_stock_date
+
+Revision ID: 20261018_1800_023
+Revises: 20261018_1730_022
+Create Date: 2026-10-18 18:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1800_023'
+down_revision = '20261018_1730_022'
+branch_labels = None
+depends_on = None
+
+
+# Columns read by the "last N days for one stock" history queries
+HISTORY_COLUMNS = ['open', 'high', 'low', 'close', 'volume', 'adjusted_close']
+
+
+def upgrade():
+    """Rebuild ix_stock_prices_stock_date as a covering index.
+
+    Price history reads for a single stock can then be served by an
+    index-only scan. stock_prices is partitioned, which rules out
+    CREATE INDEX CONCURRENTLY, so the index is rebuilt in place.
+    """
+    op.drop_index('ix_stock_prices_stock_date', 'stock_prices')
+    op.create_index(
+        'ix_stock_prices_stock_date',
+        'stock_prices',
+        ['stock_id', 'date'],
+        unique=False,
+        postgresql_include=HISTORY_COLUMNS,
+    )
+
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Index-only scans need an up-to-date visibility map, and VACUUM cannot
+    # run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.execute('VACUUM ANALYZE stock_prices')
+
+
+def downgrade():
+    """Restore the plain (stock_id, date) index."""
+    op.drop_index('ix_stock_prices_stock_date', 'stock_prices')
+    op.create_index('ix_stock_prices_stock_date', 'stock_prices', ['stock_id', 'date'], unique=False)
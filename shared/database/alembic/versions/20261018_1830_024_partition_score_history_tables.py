@@ -0,0 +1,123 @@
+"""partition stability_scores and watchlist_history by date
+
+Revision ID: 20261018_1830_024
+Revises: 20261018_1800_023
+Create Date: 2026-10-18 18:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1830_024'
+down_revision = '20261018_1800_023'
+branch_labels = None
+depends_on = None
+
+
+# Append-only daily history tables. Both unique indexes ((stock_id, date) and
+# (watchlist_id, date)) already include the partition key.
+#
+# Revision 020 left watchlist_history unpartitioned because it grows with the
+# watchlist rather than the stock universe. It is still one row per entry per
+# day, kept indefinitely and scanned by date range for performance reports, so
+# it gets the same layout here. The BRIN date index (revision 019) stays small
+# on every partition.
+PARTITIONED_TABLES = ['stability_scores', 'watchlist_history']
+
+# Same layout as revisions 006 and 020: yearly partitions over a fixed span
+# plus a DEFAULT partition for anything outside it.
+FIRST_PARTITION_YEAR = 2000
+LAST_PARTITION_YEAR = 2031
+
+# Secondary indexes, foreign keys and triggers as of revision 023. Listed
+# rather than read from the catalog so `alembic upgrade --sql` works.
+SECONDARY_INDEXES = {
+    'stability_scores': [
+        ('ix_stability_scores_date', ['date'], {}),
+        ('ix_stability_scores_score', ['stability_score'], {}),
+        ('ix_stability_scores_stock_date', ['stock_id', 'date'], {'unique': True}),
+    ],
+    'watchlist_history': [
+        (
+            'ix_watchlist_history_date_brin',
+            ['date'],
+            {'postgresql_using': 'brin', 'postgresql_with': {'pages_per_range': 32}},
+        ),
+        ('ix_watchlist_history_performance', ['total_return_pct', 'annualized_return_pct'], {}),
+        ('ix_watchlist_history_stock_date', ['stock_id', 'date'], {}),
+        ('ix_watchlist_history_watchlist_date', ['watchlist_id', 'date'], {'unique': True}),
+    ],
+}
+
+FOREIGN_KEYS = {
+    'stability_scores': [('stock_id', 'stocks')],
+    'watchlist_history': [('stock_id', 'stocks'), ('watchlist_id', 'watchlist')],
+}
+
+# Tables with an updated_at trigger from revision 012
+UPDATED_AT_TRIGGER_TABLES = ['stability_scores']
+
+
+def _swap_table(table, partitioned):
+    """Rebuild a table as partitioned (or plain) and move its rows across.
+
+    LIKE copies columns, defaults, NOT NULL constraints and comments. Foreign
+    keys, secondary indexes and triggers are dropped with the old table, so
+    they are recreated afterwards.
+    """
+    old_table = f'{table}_old'
+
+    op.execute(f'ALTER TABLE {table} RENAME TO {old_table}')
+
+    like = f'LIKE {old_table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS'
+    if partitioned:
+        op.execute(f'CREATE TABLE {table} ({like}) PARTITION BY RANGE (date)')
+        for year in range(FIRST_PARTITION_YEAR, LAST_PARTITION_YEAR + 1):
+            op.execute(
+                f"CREATE TABLE {table}_y{year} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+            )
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+    else:
+        op.execute(f'CREATE TABLE {table} ({like})')
+
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old_table}')
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+    op.execute(f'DROP TABLE {old_table} CASCADE')
+
+    # The partition key must be part of every unique constraint on a partitioned table
+    primary_key = 'id, date' if partitioned else 'id'
+    op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({primary_key})')
+    for column, referred_table in FOREIGN_KEYS[table]:
+        op.execute(
+            f'ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey '
+            f'FOREIGN KEY ({column}) REFERENCES {referred_table} (id) ON DELETE CASCADE'
+        )
+    for name, columns, options in SECONDARY_INDEXES[table]:
+        op.create_index(name, table, columns, **options)
+    if table in UPDATED_AT_TRIGGER_TABLES:
+        # set_updated_at() is defined in revision 012
+        op.execute(
+            f'CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} '
+            f'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+        )
+
+
+def upgrade():
+    """Convert stability_scores and watchlist_history to yearly RANGE (date) partitions."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in PARTITIONED_TABLES:
+        _swap_table(table, partitioned=True)
+
+
+def downgrade():
+    """Convert stability_scores and watchlist_history back to plain tables."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in reversed(PARTITIONED_TABLES):
+        _swap_table(table, partitioned=False)
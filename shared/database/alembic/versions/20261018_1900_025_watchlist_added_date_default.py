@@ -0,0 +1,47 @@
+"""set watchlist.added_date in the database
+
+Revision ID: 20261018_1900_025
+Revises: 20261018_1830_024
+Create Date: 2026-10-18 19:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1900_025'
+down_revision = '20261018_1830_024'
+branch_labels = None
+depends_on = None
+
+
+# Naive UTC, matching the server defaults from revision 012
+UTC_NOW = "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+def upgrade():
+    """Default watchlist.added_date to now() instead of a Python-side value."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('UPDATE watchlist SET added_date = created_at WHERE added_date IS NULL')
+    op.alter_column(
+        'watchlist',
+        'added_date',
+        existing_type=sa.DateTime(),
+        server_default=sa.text(UTC_NOW),
+    )
+
+
+def downgrade():
+    """Drop the database default for watchlist.added_date."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.alter_column(
+        'watchlist',
+        'added_date',
+        existing_type=sa.DateTime(),
+        server_default=None,
+    )
@@ -0,0 +1,68 @@
+"""store stock_prices OHLC as integer KRW
+
+Revision ID: 20261018_1930_026
+Revises: 20261018_1900_025
+Create Date: 2026-10-18 19:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1930_026'
+down_revision = '20261018_1900_025'
+branch_labels = None
+depends_on = None
+
+
+# KRX quotes are whole won, so unlike a scaled BIGINT (hundredths) layout no
+# read or write site needs a scale factor. INTEGER is 4 bytes against 8-10
+# for a NUMERIC(15,2) KRW price, in the heap and in the covering indexes
+# that INCLUDE these columns. adjusted_close stays NUMERIC because split and
+# rights-offering adjustments produce fractional values.
+PRICE_COLUMNS = {
+    'open': 'Opening price',
+    'high': 'Highest price',
+    'low': 'Lowest price',
+    'close': 'Closing price',
+}
+
+
+def upgrade():
+    """Convert open/high/low/close from NUMERIC(15,2) to INTEGER.
+
+    ALTER on the partitioned parent rewrites every partition and rebuilds
+    the indexes that include these columns.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column, comment in PRICE_COLUMNS.items():
+        op.alter_column(
+            'stock_prices',
+            column,
+            existing_type=sa.Numeric(15, 2),
+            type_=sa.Integer(),
+            existing_nullable=False,
+            comment=f'{comment} (KRW)',
+            existing_comment=comment,
+            postgresql_using=f'round({column})::integer',
+        )
+
+
+def downgrade():
+    """Convert open/high/low/close back to NUMERIC(15,2)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column, comment in PRICE_COLUMNS.items():
+        op.alter_column(
+            'stock_prices',
+            column,
+            existing_type=sa.Integer(),
+            type_=sa.Numeric(15, 2),
+            existing_nullable=False,
+            comment=comment,
+            existing_comment=f'{comment} (KRW)',
+        )
@@ -0,0 +1,76 @@
+"""BRIN date indexes on stability_scores and portfolio_risk_metrics
+
+Revision ID: 20261018_2000_027
+Revises: 20261018_1930_026
+Create Date: 2026-10-18 20:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_2000_027'
+down_revision = '20261018_1930_026'
+branch_labels = None
+depends_on = None
+
+
+# Daily snapshot tables appended in date order. Per-stock/per-user lookups
+# keep using their (stock_id, date) and (user_id, date) btree indexes.
+TABLE = 'stability_scores'
+
+# portfolio_risk_metrics is created outside Alembic, so it may be missing. The
+# check runs in SQL so `alembic upgrade --sql` still renders.
+OPTIONAL_TABLE = 'portfolio_risk_metrics'
+
+
+def _if_table_exists(table, *statements):
+    """DO block running the statements only when the table exists."""
+    body = '\n'.join(f'                {statement};' for statement in statements)
+    return f"""
+        DO $$
+        BEGIN
+            IF to_regclass('{table}') IS NOT NULL THEN
+{body}
+            END IF;
+        END
+        $$
+    """
+
+
+def upgrade():
+    """Swap the single-column btree on date for a BRIN index."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(f'DROP INDEX IF EXISTS ix_{TABLE}_date')
+    op.create_index(
+        f'ix_{TABLE}_date_brin',
+        TABLE,
+        ['date'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+    op.execute(_if_table_exists(
+        OPTIONAL_TABLE,
+        f'DROP INDEX IF EXISTS ix_{OPTIONAL_TABLE}_date',
+        f'CREATE INDEX ix_{OPTIONAL_TABLE}_date_brin ON {OPTIONAL_TABLE} '
+        f'USING brin (date) WITH (pages_per_range = 32)',
+    ))
+
+
+def downgrade():
+    """Restore the btree date indexes."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(_if_table_exists(
+        OPTIONAL_TABLE,
+        f'DROP INDEX IF EXISTS ix_{OPTIONAL_TABLE}_date_brin',
+        f'CREATE INDEX ix_{OPTIONAL_TABLE}_date ON {OPTIONAL_TABLE} (date)',
+    ))
+
+    op.drop_index(f'ix_{TABLE}_date_brin', TABLE)
+    op.create_index(f'ix_{TABLE}_date', TABLE, ['date'], unique=False)
@@ -0,0 +1,56 @@
+"""make the per-date price and indicator indexes unique
+
+Revision ID: 20261018_2030_028
+Revises: 20261018_2000_027
+Create Date: 2026-10-18 20:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_2030_028'
+down_revision = '20261018_2000_027'
+branch_labels = None
+depends_on = None
+
+
+# Columns carried by the covering ix_stock_prices_stock_date (migration 023)
+HISTORY_COLUMNS = ['open', 'high', 'low', 'close', 'volume', 'adjusted_close']
+
+# (index name, table, INCLUDE columns) -> one row per (stock_id, date),
+# usable as an ON CONFLICT target
+UNIQUE_INDEXES = [
+    ('ix_stock_prices_stock_date', 'stock_prices', HISTORY_COLUMNS),
+    ('ix_tech_indicators_stock_date', 'technical_indicators', None),
+    ('ix_fund_indicators_stock_date', 'fundamental_indicators', None),
+]
+
+
+def _rebuild(index_name, table, include, unique):
+    """Recreate a (stock_id, date) index with the given uniqueness."""
+    op.drop_index(index_name, table)
+    op.create_index(
+        index_name,
+        table,
+        ['stock_id', 'date'],
+        unique=unique,
+        postgresql_include=include or [],
+    )
+
+
+def upgrade():
+    """Remove duplicate rows per (stock_id, date), keeping the newest, and rebuild the indexes as unique."""
+    for index_name, table, include in UNIQUE_INDEXES:
+        op.execute(
+            f'DELETE FROM {table} WHERE id NOT IN '
+            f'(SELECT MAX(id) FROM {table} GROUP BY stock_id, date)'
+        )
+        _rebuild(index_name, table, include, unique=True)
+
+
+def downgrade():
+    """Rebuild the indexes as non-unique."""
+    for index_name, table, include in reversed(UNIQUE_INDEXES):
+        _rebuild(index_name, table, include, unique=False)
@@ -0,0 +1,72 @@
+"""partial indexes for halted and deep-drawdown portfolios
+
+Revision ID: 20261018_2100_029
+Revises: 20261018_2030_028
+Create Date: 2026-10-18 21:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_2100_029'
+down_revision = '20261018_2030_028'
+branch_labels = None
+depends_on = None
+
+
+# Drawdown (%) above which a portfolio shows up on the risk dashboard
+DEEP_DRAWDOWN_PCT = 10
+
+
+def _if_risk_metrics_exist(*statements):
+    """DO block running the statements only when portfolio_risk_metrics exists.
+
+    The table is created outside Alembic, so it may be missing. The check runs
+    in SQL so `alembic upgrade --sql` still renders.
+    """
+    body = '\n'.join(f'                {statement};' for statement in statements)
+    return f"""
+        DO $$
+        BEGIN
+            IF to_regclass('portfolio_risk_metrics') IS NOT NULL THEN
+{body}
+            END IF;
+        END
+        $$
+    """
+
+
+def upgrade():
+    """Index only the halted and deep-drawdown rows, and drop the is_active btree.
+
+    Every watchlist read filters on user_id as well as is_active, which
+    ix_watchlist_user_active (partial on is_active) already serves.
+    """
+    op.drop_index('ix_watchlist_is_active', 'watchlist')
+
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(_if_risk_metrics_exist(
+        'DROP INDEX IF EXISTS ix_portfolio_risk_halted',
+        'DROP INDEX IF EXISTS ix_portfolio_risk_metrics_is_trading_halted',
+        'CREATE INDEX ix_portfolio_risk_halted ON portfolio_risk_metrics (user_id) '
+        'WHERE is_trading_halted',
+        'CREATE INDEX ix_portfolio_risk_deep_drawdown ON portfolio_risk_metrics (user_id, date) '
+        f'WHERE current_drawdown > {DEEP_DRAWDOWN_PCT}',
+    ))
+
+
+def downgrade():
+    """Restore the full halted and is_active indexes."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(_if_risk_metrics_exist(
+            'DROP INDEX IF EXISTS ix_portfolio_risk_deep_drawdown',
+            'DROP INDEX IF EXISTS ix_portfolio_risk_halted',
+            'CREATE INDEX ix_portfolio_risk_metrics_is_trading_halted ON portfolio_risk_metrics (is_trading_halted)',
+            'CREATE INDEX ix_portfolio_risk_halted ON portfolio_risk_metrics (is_trading_halted, user_id)',
+        ))
+
+    op.create_index('ix_watchlist_is_active', 'watchlist', ['is_active'], unique=False)
@@ -0,0 +1,72 @@
+"""add stock_latest_metrics sidecar table
+
+Revision ID: 20261018_2130_030
+Revises: 20261018_2100_029
+Create Date: 2026-10-18 21:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_2130_030'
+down_revision = '20261018_2100_029'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create stock_latest_metrics, one row of screening metrics per stock."""
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    utc_now = "TIMEZONE('utc', CURRENT_TIMESTAMP)" if is_postgresql else 'CURRENT_TIMESTAMP'
+
+    op.create_table(
+        'stock_latest_metrics',
+        sa.Column('stock_id', sa.Integer(), nullable=False),
+
+        # Latest price
+        sa.Column('price_date', sa.DateTime(), nullable=True, comment='Date of the latest stock_prices row'),
+        sa.Column('close', sa.Integer(), nullable=True, comment='Latest closing price (KRW)'),
+
+        # Latest fundamentals
+        sa.Column('fundamental_date', sa.DateTime(), nullable=True, comment='Date of the latest fundamental_indicators row'),
+        sa.Column('per', sa.Float(), nullable=True, comment='Price to Earnings Ratio'),
+        sa.Column('pbr', sa.Float(), nullable=True, comment='Price to Book Ratio'),
+        sa.Column('roe', sa.Float(), nullable=True, comment='Return on Equity (%)'),
+        sa.Column('debt_ratio', sa.Float(), nullable=True, comment='Total Debt to Total Assets (%)'),
+        sa.Column('dividend_yield', sa.Float(), nullable=True, comment='Dividend Yield (%)'),
+
+        # Latest technicals
+        sa.Column('rsi_14', sa.REAL(), nullable=True, comment='14-day Relative Strength Index'),
+        sa.Column('sma_20', sa.REAL(), nullable=True, comment='20-day Simple Moving Average'),
+
+        # Latest scores
+        sa.Column('price_volatility', sa.Float(), nullable=True, comment='Price volatility (std dev of returns)'),
+        sa.Column('stability_score', sa.Float(), nullable=True, comment='Overall stability score (0-100)'),
+        sa.Column('composite_score', sa.Float(), nullable=True, comment='Overall composite score (0-100)'),
+
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text(utc_now)),
+
+        sa.PrimaryKeyConstraint('stock_id'),
+        sa.ForeignKeyConstraint(['stock_id'], ['stocks.id'], ondelete='CASCADE'),
+    )
+
+    op.create_index('ix_stock_latest_metrics_per_pbr', 'stock_latest_metrics', ['per', 'pbr'])
+    op.create_index('ix_stock_latest_metrics_roe', 'stock_latest_metrics', ['roe'])
+    op.create_index('ix_stock_latest_metrics_composite', 'stock_latest_metrics', ['composite_score'])
+
+    if is_postgresql:
+        # set_updated_at() is defined in 20261018_1230_012
+        op.execute(
+            'CREATE TRIGGER trg_stock_latest_metrics_updated_at BEFORE UPDATE ON stock_latest_metrics '
+            'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+        )
+
+
+def downgrade():
+    """Drop stock_latest_metrics."""
+    op.drop_index('ix_stock_latest_metrics_composite', 'stock_latest_metrics')
+    op.drop_index('ix_stock_latest_metrics_roe', 'stock_latest_metrics')
+    op.drop_index('ix_stock_latest_metrics_per_pbr', 'stock_latest_metrics')
+    op.drop_table('stock_latest_metrics')
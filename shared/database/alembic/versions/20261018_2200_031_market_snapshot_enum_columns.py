@@ -0,0 +1,62 @@
+"""store stock market and watchlist snapshot reason as native enums
+
+Revision ID: 20261018_2200_031
+Revises: 20261018_2130_030
+Create Date: 2026-10-18 22:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_2200_031'
+down_revision = '20261018_2130_030'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) -> (enum type name, allowed values, USING expression, previous VARCHAR length)
+ENUM_COLUMNS = {
+    ('stocks', 'market'): ('stock_market', ('KOSPI', 'KOSDAQ', 'KONEX'), 'upper(market)', 20),
+    ('watchlist_history', 'snapshot_reason'): (
+        'watchlist_snapshot_reason',
+        ('added', 'daily_update', 'manual', 'criteria_check'),
+        'lower(snapshot_reason)',
+        50,
+    ),
+}
+
+
+def upgrade():
+    """Convert stocks.market and watchlist_history.snapshot_reason from VARCHAR to ENUM types."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for (table, column), (type_name, values, using, _length) in ENUM_COLUMNS.items():
+        enum_type = postgresql.ENUM(*values, name=type_name)
+        enum_type.create(op.get_bind(), checkfirst=True)
+        op.alter_column(
+            table,
+            column,
+            type_=enum_type,
+            existing_nullable=True,
+            postgresql_using=f'{using}::{type_name}',
+        )
+
+
+def downgrade():
+    """Convert the enum columns back to VARCHAR and drop the types."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for (table, column), (type_name, values, _using, length) in ENUM_COLUMNS.items():
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length),
+            existing_nullable=True,
+            postgresql_using=f'{column}::text',
+        )
+        postgresql.ENUM(name=type_name).drop(op.get_bind(), checkfirst=True)
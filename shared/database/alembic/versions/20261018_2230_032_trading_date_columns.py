@@ -0,0 +1,183 @@
+"""store trading and calculation dates as DATE
+
+Revision ID: 20261018_2230_032
+Revises: 20261018_2200_031
+Create Date: 2026-10-18 22:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_2230_032'
+down_revision = '20261018_2200_031'
+branch_labels = None
+depends_on = None
+
+
+# Range-partitioned by date (revisions 006, 020 and 024). The partition key
+# type cannot be altered in place, so these are rebuilt.
+PARTITIONED_TABLES = ['stock_prices', 'technical_indicators', 'stability_scores', 'composite_scores']
+
+# Same span as revisions 006, 020 and 024. Years added later by
+# shared/database/partitions.py are not recreated: their rows land in the
+# DEFAULT partition until ensure_future_partitions() moves them out again.
+FIRST_PARTITION_YEAR = 2000
+LAST_PARTITION_YEAR = 2031
+
+# Secondary indexes as of revision 031, recreated on the rebuilt tables.
+# Listed rather than read from the catalog so `alembic upgrade --sql` works.
+SECONDARY_INDEXES = {
+    'stock_prices': [
+        'CREATE INDEX ix_stock_prices_date_brin ON stock_prices '
+        'USING brin (date) WITH (pages_per_range = 32)',
+        'CREATE INDEX ix_stock_prices_date_vol_tv ON stock_prices '
+        '(date, volume, trading_value) INCLUDE (close, stock_id)',
+        'CREATE INDEX ix_stock_prices_id ON stock_prices (id)',
+        'CREATE UNIQUE INDEX ix_stock_prices_stock_date ON stock_prices '
+        '(stock_id, date) INCLUDE (open, high, low, close, volume, adjusted_close)',
+    ],
+    'technical_indicators': [
+        'CREATE INDEX ix_technical_indicators_date_brin ON technical_indicators '
+        'USING brin (date) WITH (pages_per_range = 32)',
+        'CREATE INDEX ix_technical_indicators_id ON technical_indicators (id)',
+        'CREATE UNIQUE INDEX ix_tech_indicators_stock_date ON technical_indicators (stock_id, date)',
+    ],
+    'stability_scores': [
+        'CREATE INDEX ix_stability_scores_date_brin ON stability_scores '
+        'USING brin (date) WITH (pages_per_range = 32)',
+        'CREATE INDEX ix_stability_scores_score ON stability_scores (stability_score)',
+        'CREATE UNIQUE INDEX ix_stability_scores_stock_date ON stability_scores (stock_id, date)',
+    ],
+    'composite_scores': [
+        'CREATE INDEX ix_composite_scores_date_score ON composite_scores (date, composite_score)',
+        'CREATE INDEX ix_composite_scores_score ON composite_scores (composite_score)',
+        'CREATE UNIQUE INDEX ix_composite_scores_stock_date ON composite_scores (stock_id, date)',
+    ],
+}
+
+# Tables with an updated_at trigger (revisions 012, 020 and 024)
+UPDATED_AT_TRIGGER_TABLES = ['stability_scores', 'composite_scores']
+
+# Plain tables whose per-stock date is altered in place
+PLAIN_TABLES = ['fundamental_indicators']
+
+# Dates mirrored into the latest metrics sidecar (revision 030)
+LATEST_METRICS_COLUMNS = ['price_date', 'fundamental_date']
+
+# watchlist_history and portfolio_risk_metrics keep TIMESTAMP: they take
+# several snapshots per day.
+
+
+def _partition_names(table):
+    """Return the yearly and DEFAULT partition names of a table."""
+    years = range(FIRST_PARTITION_YEAR, LAST_PARTITION_YEAR + 1)
+    return [f'{table}_y{year}' for year in years] + [f'{table}_default']
+
+
+def _rebuild_with_date_type(table, date_type, keep_rows):
+    """Rebuild a partitioned table with ``date`` as ``date_type``.
+
+    The foreign key, secondary indexes and updated_at trigger are dropped
+    with the old table, so they are recreated afterwards.
+
+    Args:
+        table: Partitioned table name
+        date_type: New SQL type of the date column
+        keep_rows: WHERE clause selecting the rows to copy
+    """
+    old_table = f'{table}_old'
+    shape_table = f'{table}_shape'
+
+    op.execute(f'ALTER TABLE {table} RENAME TO {old_table}')
+    for name in _partition_names(table):
+        op.execute(f'ALTER TABLE {name} RENAME TO {name}_old')
+
+    # Change the column type on an empty plain copy, then partition a copy of that
+    like = 'INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS'
+    op.execute(f'CREATE TABLE {shape_table} (LIKE {old_table} {like})')
+    op.execute(f'ALTER TABLE {shape_table} ALTER COLUMN date TYPE {date_type}')
+    op.execute(f'CREATE TABLE {table} (LIKE {shape_table} {like}) PARTITION BY RANGE (date)')
+    op.execute(f'DROP TABLE {shape_table}')
+    for year in range(FIRST_PARTITION_YEAR, LAST_PARTITION_YEAR + 1):
+        op.execute(
+            f"CREATE TABLE {table}_y{year} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+    op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old_table} WHERE {keep_rows}')
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+    op.execute(f'DROP TABLE {old_table} CASCADE')
+
+    op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, date)')
+    op.execute(
+        f'ALTER TABLE {table} ADD CONSTRAINT {table}_stock_id_fkey '
+        f'FOREIGN KEY (stock_id) REFERENCES stocks (id) ON DELETE CASCADE'
+    )
+    for definition in SECONDARY_INDEXES[table]:
+        op.execute(definition)
+    if table in UPDATED_AT_TRIGGER_TABLES:
+        # set_updated_at() is defined in revision 012
+        op.execute(
+            f'CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} '
+            f'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+        )
+
+
+def _newest_per_day(table):
+    """WHERE clause keeping the newest row per stock and calendar day."""
+    return f'id IN (SELECT MAX(id) FROM {table} GROUP BY stock_id, CAST(date AS date))'
+
+
+def upgrade():
+    """Convert per-stock trading/calculation dates from TIMESTAMP to DATE.
+
+    Rows that collapse onto the same (stock_id, day) are reduced to the
+    newest one, matching the unique (stock_id, date) indexes.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in PARTITIONED_TABLES:
+        _rebuild_with_date_type(table, 'date', _newest_per_day(f'{table}_old'))
+
+    for table in PLAIN_TABLES:
+        op.execute(f'DELETE FROM {table} WHERE NOT ({_newest_per_day(table)})')
+        op.alter_column(
+            table,
+            'date',
+            type_=sa.Date(),
+            existing_nullable=False,
+            postgresql_using='CAST(date AS date)',
+        )
+
+    for column in LATEST_METRICS_COLUMNS:
+        op.alter_column(
+            'stock_latest_metrics',
+            column,
+            type_=sa.Date(),
+            existing_nullable=True,
+            postgresql_using=f'CAST({column} AS date)',
+        )
+
+
+def downgrade():
+    """Convert the DATE columns back to TIMESTAMP (midnight)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column in LATEST_METRICS_COLUMNS:
+        op.alter_column(
+            'stock_latest_metrics',
+            column,
+            type_=sa.DateTime(),
+            existing_nullable=True,
+        )
+
+    for table in PLAIN_TABLES:
+        op.alter_column(table, 'date', type_=sa.DateTime(), existing_nullable=False)
+
+    for table in reversed(PARTITIONED_TABLES):
+        _rebuild_with_date_type(table, 'timestamp without time zone', 'TRUE')
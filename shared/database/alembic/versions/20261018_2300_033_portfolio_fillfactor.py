@@ -0,0 +1,45 @@
+"""leave free space on portfolio pages for HOT updates
+
+Revision ID: 20261018_2300_033
+Revises: 20261018_2230_032
+Create Date: 2026-10-18 23:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_2300_033'
+down_revision = '20261018_2230_032'
+branch_labels = None
+depends_on = None
+
+
+STORAGE_PARAMS = {
+    'fillfactor': 80,
+    'autovacuum_vacuum_scale_factor': 0.05,
+    'autovacuum_analyze_scale_factor': 0.02,
+}
+
+
+def upgrade():
+    """Set fillfactor and autovacuum thresholds on portfolios.
+
+    None of the repriced columns are indexed, so with free space on the page
+    the position monitor's UPDATEs can be HOT. fillfactor applies to newly
+    written pages; existing pages fill up as rows are updated.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    params = ', '.join(f'{name} = {value}' for name, value in STORAGE_PARAMS.items())
+    op.execute(f'ALTER TABLE portfolios SET ({params})')
+
+
+def downgrade():
+    """Reset the storage parameters to the defaults."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(f"ALTER TABLE portfolios RESET ({', '.join(STORAGE_PARAMS)})")
@@ -0,0 +1,73 @@
+"""move raw stability measurements into a details jsonb column
+
+Revision ID: 20261018_2330_034
+Revises: 20261018_2300_033
+Create Date: 2026-10-18 23:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_2330_034'
+down_revision = '20261018_2300_033'
+branch_labels = None
+depends_on = None
+
+
+# Raw measurements that are only read per row; stability_score,
+# price_volatility and the component *_score columns stay native.
+DETAIL_METRICS = {
+    'returns_mean': (sa.Float(), 'Mean of daily returns'),
+    'returns_std': (sa.Float(), 'Standard deviation of daily returns'),
+    'beta': (sa.Float(), 'Beta coefficient (systematic risk vs market)'),
+    'market_correlation': (sa.Float(), 'Correlation with market index'),
+    'volume_stability': (sa.Float(), 'Volume stability (coefficient of variation)'),
+    'volume_mean': (sa.BigInteger(), 'Mean trading volume'),
+    'volume_std': (sa.BigInteger(), 'Standard deviation of trading volume'),
+    'earnings_consistency': (sa.Float(), 'Earnings consistency (coefficient of variation)'),
+    'earnings_trend': (sa.Float(), 'Earnings trend (slope)'),
+    'debt_stability': (sa.Float(), 'Debt stability (trend analysis)'),
+    'debt_trend': (sa.Float(), 'Debt ratio trend (slope)'),
+    'debt_ratio_current': (sa.Float(), 'Current debt ratio'),
+}
+
+
+def upgrade():
+    """Pack the raw measurement columns into stability_scores.details."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.add_column('stability_scores', sa.Column(
+        'details', postgresql.JSONB(), nullable=True, comment='Raw stability measurements keyed by name'
+    ))
+
+    pairs = ', '.join(f"'{name}', {name}" for name in DETAIL_METRICS)
+    op.execute(
+        "UPDATE stability_scores "
+        f"SET details = NULLIF(jsonb_strip_nulls(jsonb_build_object({pairs})), '{{}}'::jsonb)"
+    )
+
+    for name in DETAIL_METRICS:
+        op.drop_column('stability_scores', name)
+
+
+def downgrade():
+    """Restore the raw measurement columns from details and drop it."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for name, (type_, comment) in DETAIL_METRICS.items():
+        op.add_column('stability_scores', sa.Column(name, type_, nullable=True, comment=comment))
+
+    assignments = ', '.join(
+        f"{name} = round((details ->> '{name}')::numeric)::bigint"
+        if isinstance(type_, sa.BigInteger)
+        else f"{name} = (details ->> '{name}')::double precision"
+        for name, (type_, _comment) in DETAIL_METRICS.items()
+    )
+    op.execute(f"UPDATE stability_scores SET {assignments} WHERE details IS NOT NULL")
+
+    op.drop_column('stability_scores', 'details')
@@ -0,0 +1,38 @@
+"""cover percentile ranking reads with ix_composite_scores_date_score
+
+Revision ID: 20261019_0000_035
+Revises: 20261018_2330_034
+Create Date: 2026-10-19 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0000_035'
+down_revision = '20261018_2330_034'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Rebuild ix_composite_scores_date_score with id as an INCLUDE column.
+
+    The percentile-rank refresh reads (id, composite_score) for one date in
+    score order, which this index can then serve index-only. composite_scores
+    is partitioned, so the index is rebuilt in place.
+    """
+    op.drop_index('ix_composite_scores_date_score', 'composite_scores')
+    op.create_index(
+        'ix_composite_scores_date_score',
+        'composite_scores',
+        ['date', 'composite_score'],
+        postgresql_include=['id'],
+    )
+
+
+def downgrade():
+    """Restore the plain (date, composite_score) index."""
+    op.drop_index('ix_composite_scores_date_score', 'composite_scores')
+    op.create_index('ix_composite_scores_date_score', 'composite_scores', ['date', 'composite_score'])
@@ -0,0 +1,38 @@
+"""drop the stocks.is_active btree and redundant trades prefix indexes
+
+Revision ID: 20261019_0030_036
+Revises: 20261019_0000_035
+Create Date: 2026-10-19 00:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0030_036'
+down_revision = '20261019_0000_035'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, column)
+DROPPED_INDEXES = [
+    # Nearly every listing is active, so is_active = true never uses the index
+    ('ix_stocks_is_active', 'stocks', 'is_active'),
+    # Leading column of ix_trades_status_date / ix_trades_ticker_date
+    ('ix_trades_status', 'trades', 'status'),
+    ('ix_trades_ticker', 'trades', 'ticker'),
+]
+
+
+def upgrade():
+    """Drop single-column indexes that are unselective or covered by a composite index."""
+    for index_name, table, _column in DROPPED_INDEXES:
+        op.drop_index(index_name, table)
+
+
+def downgrade():
+    """Recreate the single-column indexes."""
+    for index_name, table, column in reversed(DROPPED_INDEXES):
+        op.create_index(index_name, table, [column], unique=False)
@@ -0,0 +1,56 @@
+"""store 0-100 scores and weights as real (float4)
+
+Revision ID: 20261019_0100_037
+Revises: 20261019_0030_036
+Create Date: 2026-10-19 01:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0100_037'
+down_revision = '20261019_0030_036'
+branch_labels = None
+depends_on = None
+
+
+# Bounded scores and weights only. Raw measurements (price_volatility, the
+# stability details) and fundamental ratios stay double precision.
+REAL_COLUMNS = {
+    'composite_scores': [
+        'value_score', 'growth_score', 'quality_score', 'momentum_score',
+        'composite_score', 'percentile_rank',
+        'weight_value', 'weight_growth', 'weight_quality', 'weight_momentum',
+        'data_quality_score',
+    ],
+    'stability_scores': [
+        'price_volatility_score', 'beta_score', 'volume_stability_score',
+        'earnings_consistency_score', 'debt_stability_score', 'stability_score',
+        'weight_price', 'weight_beta', 'weight_volume', 'weight_earnings', 'weight_debt',
+    ],
+    # Mirrors of the scores above (revision 030)
+    'stock_latest_metrics': ['stability_score', 'composite_score'],
+}
+
+
+def _alter_columns(sql_type):
+    # One ALTER TABLE per table so each (partitioned) table is rewritten only once
+    for table, columns in REAL_COLUMNS.items():
+        alterations = ', '.join(f'ALTER COLUMN {column} TYPE {sql_type}' for column in columns)
+        op.execute(f'ALTER TABLE {table} {alterations}')
+
+
+def upgrade():
+    """Narrow score and weight columns from double precision to real."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _alter_columns('real')
+
+
+def downgrade():
+    """Widen score and weight columns back to double precision."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _alter_columns('double precision')
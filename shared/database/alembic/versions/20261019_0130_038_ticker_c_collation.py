@@ -0,0 +1,38 @@
+"""byte-wise C collation on ticker columns
+
+Revision ID: 20261019_0130_038
+Revises: 20261019_0100_037
+Create Date: 2026-10-19 01:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0130_038'
+down_revision = '20261019_0100_037'
+branch_labels = None
+depends_on = None
+
+
+TICKER_TABLES = ['stocks', 'trades', 'portfolios', 'watchlist']
+
+
+def upgrade():
+    """Compare tickers byte-wise instead of through the database locale (PostgreSQL only)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Indexes on ticker are rebuilt by the type change
+    for table in TICKER_TABLES:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN ticker TYPE VARCHAR(20) COLLATE "C"')
+
+
+def downgrade():
+    """Restore the database default collation on ticker columns."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in TICKER_TABLES:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN ticker TYPE VARCHAR(20) COLLATE "default"')
@@ -0,0 +1,40 @@
+"""drop the id indexes duplicating primary keys
+
+Revision ID: 20261019_0200_039
+Revises: 20261019_0130_038
+Create Date: 2026-10-19 02:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0200_039'
+down_revision = '20261019_0130_038'
+branch_labels = None
+depends_on = None
+
+
+# Plain btrees on id duplicating the primary key (or its leading column)
+ID_INDEX_TABLES = [
+    'stocks',
+    'stock_prices',
+    'technical_indicators',
+    'fundamental_indicators',
+    'trades',
+    'portfolios',
+    'watchlist',
+]
+
+
+def upgrade():
+    """Drop the id indexes; the primary keys already cover lookups by id."""
+    for table in ID_INDEX_TABLES:
+        op.drop_index(f'ix_{table}_id', table)
+
+
+def downgrade():
+    """Recreate the id indexes."""
+    for table in reversed(ID_INDEX_TABLES):
+        op.create_index(f'ix_{table}_id', table, ['id'], unique=False)
@@ -0,0 +1,31 @@
+"""add technical_date to stock_latest_metrics
+
+Revision ID: 20261019_0230_040
+Revises: 20261019_0200_039
+Create Date: 2026-10-19 02:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261019_0230_040'
+down_revision = '20261019_0200_039'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Record the date of the technical_indicators row each snapshot row was built from."""
+    # Lets refresh_if_stale notice new indicators, which share their date with the price row
+    op.add_column(
+        'stock_latest_metrics',
+        sa.Column('technical_date', sa.Date(), nullable=True,
+                  comment='Date of the latest technical_indicators row'),
+    )
+
+
+def downgrade():
+    """Drop stock_latest_metrics.technical_date."""
+    op.drop_column('stock_latest_metrics', 'technical_date')
@@ -0,0 +1,72 @@
+"""
+Bulk write helpers for wide per-stock daily tables.
+"""
+from typing import Any, Dict, List, Sequence, Tuple, Type
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from shared.database.models import Base
+
+
+def bulk_upsert(
+    session: Session,
+    model: Type[Base],
+    rows: Sequence[Dict[str, Any]],
+    conflict_columns: Sequence[str]
+) -> int:
+    """
+    Insert many rows, updating rows that already exist for the same key.
+
+    Uses INSERT ... ON CONFLICT DO UPDATE. ``conflict_columns`` must match a
+    unique index on the table. Columns present in a row replace the stored
+    values; columns it leaves out are kept. Rows are grouped by their set of
+    keys and each group is written with one executemany. onupdate columns
+    such as updated_at are refreshed.
+
+    Args:
+        session: Database session
+        model: Mapped model class
+        rows: Row dictionaries keyed by column name
+        conflict_columns: Columns of the unique key
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        insert = postgresql.insert
+    elif dialect == 'sqlite':
+        insert = sqlite.insert
+    else:
+        raise NotImplementedError(f"Upsert is not supported for dialect {dialect!r}")
+
+    # An executemany statement is compiled from one key set, so rows with
+    # other keys would lose (or fail on) the columns that differ
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+
+    for columns, group in groups.items():
+        stmt = insert(model)
+        set_ = {
+            column: stmt.excluded[column]
+            for column in columns
+            if column not in conflict_columns
+        }
+        # ORM onupdate values (e.g. updated_at) are not applied to ON CONFLICT
+        # updates; the models only use SQL expressions such as utcnow() here
+        for column in model.__table__.columns:
+            if column.onupdate is not None and column.name not in set_:
+                set_[column.name] = column.onupdate.arg
+
+        stmt = (
+            stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=set_)
+            .execution_options(query_tag=f'bulk_upsert:{model.__tablename__}')
+        )
+        session.execute(stmt, group)
+
+    return len(rows)
@@ -1,36 +1,110 @@
 """
 Database connection management.
 """
+import logging
+import random
+from functools import lru_cache
 from typing import Generator, Optional
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, event, Engine, make_url
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
 from shared.configs.config import get_settings
 
+__all__ = [
+    'get_engine',
+    'get_session',
+    'get_session_factory',
+    'SessionLocal',
+    'get_bulk_session_factory',
+    'BulkSession',
+    'get_db',
+    'get_db_session',
+    'init_db',
+]
+
 settings = get_settings()
 
+logger = logging.getLogger(__name__)
+
 
 def get_engine(database_url: Optional[str] = None) -> Engine:
     """
     Get or create database engine.
 
+    Engines are created on first use and shared per URL, so importing this
+    module does not build a connection pool.
+
     Args:
         database_url: Database URL (uses settings if None)
 
     Returns:
         SQLAlchemy engine
     """
-    url = database_url or settings.database_url
-    return create_engine(
+    return _create_engine(database_url or settings.database_url)
+
+
+# libpq TCP keepalives: dead server connections are detected by the kernel
+# instead of a SELECT 1 round-trip on every pool checkout
+POSTGRES_KEEPALIVE_ARGS = {
+    'keepalives': 1,
+    'keepalives_idle': 30,
+    'keepalives_interval': 10,
+    'keepalives_count': 3,
+}
+
+
+@lru_cache()
+def _create_engine(url: str) -> Engine:
+    """Create the pooled engine for a database URL."""
+    connect_args = {}
+    driver_args = {}
+    database_url = make_url(url)
+    if database_url.get_backend_name() == 'postgresql':
+        connect_args.update(POSTGRES_KEEPALIVE_ARGS)
+        connect_args['application_name'] = settings.db_application_name
+        if database_url.get_driver_name() == 'psycopg2':
+            # INSERTs already batch via insertmanyvalues; also page executemany UPDATE/DELETE
+            driver_args['executemany_mode'] = 'values_plus_batch'
+
+    engine = create_engine(
         url,
         poolclass=QueuePool,
-        pool_size=10,
-        max_overflow=20,
-        pool_pre_ping=True,
-        echo=settings.debug
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=connect_args,
+        **driver_args
     )
 
+    event.listen(engine, "before_cursor_execute", _tag_statement, retval=True)
+
+    # Sampled statement logging instead of echo, which formats every statement
+    if settings.debug and settings.db_log_sample_rate > 0:
+        event.listen(engine, "before_cursor_execute", _log_sampled_statement)
+
+    return engine
+
+
+def _tag_statement(conn, cursor, statement, parameters, context, executemany):
+    """
+    Prefix statements with their ``query_tag`` execution option as a SQL comment.
+
+    The tag shows up in pg_stat_activity and pg_stat_statements, e.g.
+    ``stmt.execution_options(query_tag='score_refresh')``.
+    """
+    tag = context.execution_options.get('query_tag') if context is not None else None
+    if tag:
+        statement = f"/* {tag} */ {statement}"
+    return statement, parameters
+
+
+def _log_sampled_statement(conn, cursor, statement, parameters, context, executemany):
+    """Log a sample of executed SQL statements."""
+    if random.random() < settings.db_log_sample_rate:
+        logger.debug("SQL: %s", statement)
+
 
 def get_session(engine: Engine) -> Session:
     """
@@ -46,11 +120,54 @@ def get_session(engine: Engine) -> Session:
     return SessionFactory()
 
 
-# Default database engine
-engine = get_engine()
+@lru_cache()
+def get_session_factory() -> sessionmaker:
+    """Get the session factory bound to the default engine."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+def SessionLocal() -> Session:
+    """
+    Create a session on the default engine.
+
+    Returns:
+        Database session
+    """
+    return get_session_factory()()
+
+
+@lru_cache()
+def get_bulk_session_factory() -> sessionmaker:
+    """
+    Get the session factory for batch ingest pipelines.
+
+    Loaded objects are not expired on commit, so a loop that commits per
+    batch can keep reading the stocks it loaded up front without one
+    refresh SELECT per object.
+    """
+    return sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=get_engine()
+    )
+
+
+def BulkSession() -> Session:
+    """
+    Create a batch ingest session on the default engine.
+
+    Use for jobs writing StockPrice, TechnicalIndicator, FundamentalIndicator,
+    StabilityScore or CompositeScore rows; request handlers keep SessionLocal.
+
+    Returns:
+        Database session
+    """
+    return get_bulk_session_factory()()
+
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def __getattr__(name: str):
+    """Resolve the default ``engine`` attribute on first access."""
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -84,4 +201,4 @@ def get_db_session() -> Generator[Session, None, None]:
 def init_db() -> None:
     """Initialize database tables."""
     from shared.database.models import Base
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
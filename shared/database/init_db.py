@@ -13,7 +13,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from shared.database.connection import engine, init_db
+from shared.database.connection import get_engine, init_db
 from shared.database.models import Base
 from shared.configs.config import get_settings
 
@@ -21,14 +21,14 @@ from shared.configs.config import get_settings
 def create_tables():
     """Create all database tables using SQLAlchemy."""
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
     print("✓ All tables created successfully!")
 
 
 def drop_tables():
     """Drop all database tables."""
     print("Dropping all database tables...")
-    Base.metadata.drop_all(bind=engine)
+    Base.metadata.drop_all(bind=get_engine())
     print("✓ All tables dropped!")
 
 
@@ -36,7 +36,7 @@ def show_tables():
     """Show all tables in the database."""
     from sqlalchemy import inspect
 
-    inspector = inspect(engine)
+    inspector = inspect(get_engine())
     tables = inspector.get_table_names()
 
     print(f"\nDatabase tables ({len(tables)}):")
@@ -58,17 +58,15 @@ def verify_schema():
         'watchlist'
     ]
 
-    existing_tables = show_tables()
+    existing_tables = set(show_tables())
+    missing_tables = [table for table in expected_tables if table not in existing_tables]
 
     print("\nSchema verification:")
-    all_exist = True
-    for table in expected_tables:
-        exists = table in existing_tables
-        status = "✓" if exists else "✗"
-        print(f"  {status} {table}")
-        if not exists:
-            all_exist = False
+    print("\n".join(
+        f"  {'✓' if table in existing_tables else '✗'} {table}" for table in expected_tables
+    ))
 
+    all_exist = not missing_tables
     if all_exist:
         print("\n✓ All expected tables exist!")
     else:
@@ -0,0 +1,146 @@
+"""
+Refresh of the per-stock latest metrics sidecar table.
+"""
+from sqlalchemy import func, or_, select, true
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from shared.database.models import (
+    CompositeScore,
+    FundamentalIndicator,
+    StabilityScore,
+    Stock,
+    StockLatestMetrics,
+    StockPrice,
+    TechnicalIndicator,
+)
+
+
+def _latest_rows(model, *columns):
+    """Subquery with the newest row per stock_id of a time-series model."""
+    ranked = select(
+        model.stock_id,
+        model.date,
+        *columns,
+        func.row_number().over(
+            partition_by=model.stock_id,
+            order_by=model.date.desc(),
+        ).label('rank'),
+    ).subquery()
+    return select(ranked).where(ranked.c.rank == 1).subquery()
+
+
+def refresh_latest_metrics(session: Session) -> int:
+    """
+    Rebuild stock_latest_metrics from the newest row of each source table.
+
+    Runs as a single INSERT ... SELECT ... ON CONFLICT (stock_id) DO UPDATE,
+    so it is cheap to re-run after every daily load. Stocks without a price
+    row are skipped. The caller commits.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Number of stocks written
+    """
+    price = _latest_rows(StockPrice, StockPrice.close)
+    fundamental = _latest_rows(
+        FundamentalIndicator,
+        FundamentalIndicator.per,
+        FundamentalIndicator.pbr,
+        FundamentalIndicator.roe,
+        FundamentalIndicator.debt_ratio,
+        FundamentalIndicator.dividend_yield,
+    )
+    technical = _latest_rows(TechnicalIndicator, TechnicalIndicator.rsi_14, TechnicalIndicator.sma_20)
+    stability = _latest_rows(StabilityScore, StabilityScore.price_volatility, StabilityScore.stability_score)
+    composite = _latest_rows(CompositeScore, CompositeScore.composite_score)
+
+    columns = {
+        'stock_id': Stock.id,
+        'price_date': price.c.date,
+        'close': price.c.close,
+        'fundamental_date': fundamental.c.date,
+        'per': fundamental.c.per,
+        'pbr': fundamental.c.pbr,
+        'roe': fundamental.c.roe,
+        'debt_ratio': fundamental.c.debt_ratio,
+        'dividend_yield': fundamental.c.dividend_yield,
+        'technical_date': technical.c.date,
+        'rsi_14': technical.c.rsi_14,
+        'sma_20': technical.c.sma_20,
+        'price_volatility': stability.c.price_volatility,
+        'stability_score': stability.c.stability_score,
+        'composite_score': composite.c.composite_score,
+    }
+    latest = (
+        select(*columns.values())
+        .select_from(Stock)
+        .join(price, price.c.stock_id == Stock.id)
+        .outerjoin(fundamental, fundamental.c.stock_id == Stock.id)
+        .outerjoin(technical, technical.c.stock_id == Stock.id)
+        .outerjoin(stability, stability.c.stock_id == Stock.id)
+        .outerjoin(composite, composite.c.stock_id == Stock.id)
+        # SQLite needs an explicit WHERE to parse INSERT ... SELECT ... ON CONFLICT
+        .where(true())
+    )
+
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        stmt = postgresql.insert(StockLatestMetrics)
+    elif dialect == 'sqlite':
+        stmt = sqlite.insert(StockLatestMetrics)
+    else:
+        raise NotImplementedError(f"Upsert is not supported for dialect {dialect!r}")
+
+    stmt = stmt.from_select(list(columns), latest)
+    set_ = {column: stmt.excluded[column] for column in columns if column != 'stock_id'}
+    set_['updated_at'] = StockLatestMetrics.__table__.c.updated_at.onupdate.arg
+    stmt = (
+        stmt.on_conflict_do_update(index_elements=['stock_id'], set_=set_)
+        .execution_options(query_tag='refresh:stock_latest_metrics')
+    )
+
+    return session.execute(stmt).rowcount
+
+
+def _newest_date(model):
+    """Correlated MAX(date) of a time-series model for the enclosing Stock row."""
+    return select(func.max(model.date)).where(model.stock_id == Stock.id).scalar_subquery()
+
+
+def refresh_if_stale(session: Session) -> int:
+    """
+    Refresh stock_latest_metrics when any stock's row is missing or out of date.
+
+    A stock is stale when the newest price, fundamental or technical date
+    differs from the one its snapshot row was built from, or when it has
+    prices but no snapshot row yet. Lets readers of the snapshot work without
+    depending on the orchestrator's indicator job having run since the last
+    load. One EXISTS query (an index probe per stock and source) when the
+    snapshot is current. The caller commits.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Number of stocks written (0 when the snapshot was current)
+    """
+    price_date = _newest_date(StockPrice)
+    stale = (
+        select(Stock.id)
+        .outerjoin(StockLatestMetrics, StockLatestMetrics.stock_id == Stock.id)
+        .where(
+            # Stocks without prices are never in the snapshot
+            price_date.is_not(None),
+            or_(
+                price_date.is_distinct_from(StockLatestMetrics.price_date),
+                _newest_date(FundamentalIndicator).is_distinct_from(StockLatestMetrics.fundamental_date),
+                _newest_date(TechnicalIndicator).is_distinct_from(StockLatestMetrics.technical_date),
+            ),
+        )
+    )
+    if not session.execute(select(stale.exists())).scalar():
+        return 0
+    return refresh_latest_metrics(session)
@@ -1,64 +1,149 @@
 """
 Database models for Korean stock trading system.
 """
-from datetime import datetime
+import math
+from datetime import datetime, time
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text, Index, BigInteger, Numeric
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, REAL, Date, DateTime, Boolean, ForeignKey, Text, Index, BigInteger, Numeric, Enum, Computed, JSON, TypeDecorator, DDL, event, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase, deferred, relationship
+from sqlalchemy.sql import expression
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base for all ORM models."""
+
+
+class utcnow(expression.FunctionElement):
+    """Current UTC time evaluated by the database, naive like datetime.utcnow()."""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, 'postgresql')
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+class TradingDate(TypeDecorator):
+    """DATE for calendar-day columns; loaded as midnight datetimes like the old DateTime values."""
+    impl = Date
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return value.date() if isinstance(value, datetime) else value
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else datetime.combine(value, time.min)
+
+
+class WholeWon(TypeDecorator):
+    """INTEGER amount in KRW; Decimal/float inputs are rounded to the won on bind."""
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else round(value)
+
+
+# Ticker codes compare byte-wise on PostgreSQL; ASCII only, so the "C" order is the natural one
+TICKER_TYPE = String(20).with_variant(String(20, collation='C'), 'postgresql')
+
+
+# Fixed vocabulary for stock listings (native ENUM type on PostgreSQL)
+STOCK_MARKETS = ('KOSPI', 'KOSDAQ', 'KONEX')
 
 
 class Stock(Base):
     """Stock information model."""
     __tablename__ = "stocks"
 
-    id = Column(Integer, primary_key=True, index=True)
-    ticker = Column(String(20), unique=True, index=True, nullable=False, comment="Stock code (e.g., 005930 for Samsung)")
+    id = Column(Integer, primary_key=True)
+    ticker = Column(TICKER_TYPE, unique=True, index=True, nullable=False, comment="Stock code (e.g., 005930 for Samsung)")
     name_kr = Column(String(100), nullable=False, comment="Korean name")
     name_en = Column(String(100), comment="English name")
-    market = Column(String(20), index=True, comment="KOSPI, KOSDAQ, KONEX, etc.")
+    market = Column(Enum(*STOCK_MARKETS, name="stock_market"), index=True, comment="KOSPI, KOSDAQ, KONEX")
     sector = Column(String(50), index=True, comment="Business sector")
     industry = Column(String(100), comment="Industry classification")
     market_cap = Column(BigInteger, comment="Market capitalization in KRW")
     listed_shares = Column(BigInteger, comment="Total number of listed shares")
     listed_date = Column(DateTime, comment="IPO date")
-    is_active = Column(Boolean, default=True, index=True, comment="Whether stock is actively traded")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    is_active = Column(Boolean, default=True, comment="Whether stock is actively traded")
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
+    updated_at = Column(DateTime, nullable=False, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
-    prices = relationship("StockPrice", back_populates="stock", cascade="all, delete-orphan")
-    technical_indicators = relationship("TechnicalIndicator", back_populates="stock", cascade="all, delete-orphan")
-    fundamental_indicators = relationship("FundamentalIndicator", back_populates="stock", cascade="all, delete-orphan")
-    watchlist_entries = relationship("Watchlist", back_populates="stock", cascade="all, delete-orphan")
+    # Time-series collections are never lazy loaded: query them directly or opt in
+    # with selectinload(). Deletes rely on the ON DELETE CASCADE foreign keys.
+    # Every other relationship is raise_on_sql: it resolves from the identity map
+    # or an explicit loader option, and raises instead of emitting a lazy SELECT.
+    prices = relationship(
+        "StockPrice", back_populates="stock", cascade="all, delete-orphan", lazy="raise", passive_deletes=True
+    )
+    technical_indicators = relationship(
+        "TechnicalIndicator", back_populates="stock", cascade="all, delete-orphan", lazy="raise", passive_deletes=True
+    )
+    fundamental_indicators = relationship(
+        "FundamentalIndicator", back_populates="stock", cascade="all, delete-orphan", lazy="raise", passive_deletes=True
+    )
+    stability_scores = relationship(
+        "StabilityScore", back_populates="stock", cascade="all, delete-orphan", lazy="raise", passive_deletes=True
+    )
+    composite_scores = relationship(
+        "CompositeScore", back_populates="stock", cascade="all, delete-orphan", lazy="raise", passive_deletes=True
+    )
+    watchlist_entries = relationship(
+        "Watchlist", back_populates="stock", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
 
 
 class StockPrice(Base):
-    """Stock price data model."""
+    """Stock price data model.
+
+    Multi-row reads that only consume values (history, backtests, API
+    listings) should select columns rather than load StockPrice instances.
+    """
     __tablename__ = "stock_prices"
 
-    id = Column(Integer, primary_key=True, index=True)
-    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False, index=True)
-    date = Column(DateTime, nullable=False, index=True, comment="Trading date")
-    open = Column(Numeric(15, 2), nullable=False, comment="Opening price")
-    high = Column(Numeric(15, 2), nullable=False, comment="Highest price")
-    low = Column(Numeric(15, 2), nullable=False, comment="Lowest price")
-    close = Column(Numeric(15, 2), nullable=False, comment="Closing price")
+    id = Column(Integer, primary_key=True)
+    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False)
+    date = Column(TradingDate, nullable=False, comment="Trading date")
+    # KRX prices are whole won, so OHLC is stored as INTEGER KRW
+    open = Column(WholeWon, nullable=False, comment="Opening price (KRW)")
+    high = Column(WholeWon, nullable=False, comment="Highest price (KRW)")
+    low = Column(WholeWon, nullable=False, comment="Lowest price (KRW)")
+    close = Column(WholeWon, nullable=False, comment="Closing price (KRW)")
     volume = Column(BigInteger, nullable=False, comment="Trading volume")
     adjusted_close = Column(Numeric(15, 2), comment="Adjusted closing price for splits/dividends")
     trading_value = Column(BigInteger, comment="Total trading value in KRW")
     change_pct = Column(Float, comment="Daily change percentage")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
 
     # Relationships
-    stock = relationship("Stock", back_populates="prices")
+    stock = relationship("Stock", back_populates="prices", lazy="raise_on_sql")
 
-    # Composite index for efficient queries
+    # Composite index for efficient queries.
+    # On PostgreSQL the table is range-partitioned by date (migration 006) and the
+    # physical primary key is (id, date); id alone stays unique via its sequence.
     __table_args__ = (
-        Index('ix_stock_prices_stock_date', 'stock_id', 'date'),
-        Index('ix_stock_prices_date_volume', 'date', 'volume'),
+        # Covering index so per-stock price history reads stay index-only;
+        # unique so daily loads can upsert on (stock_id, date)
+        Index(
+            'ix_stock_prices_stock_date', 'stock_id', 'date', unique=True,
+            postgresql_include=['open', 'high', 'low', 'close', 'volume', 'adjusted_close'],
+        ),
+        Index('ix_stock_prices_date_brin', 'date', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        # Covering index so screener volume/trading value scans stay index-only
+        Index(
+            'ix_stock_prices_date_vol_tv', 'date', 'volume', 'trading_value',
+            postgresql_include=['close', 'stock_id'],
+        ),
     )
 
 
@@ -66,79 +151,109 @@ class TechnicalIndicator(Base):
     """Technical indicators model."""
     __tablename__ = "technical_indicators"
 
-    id = Column(Integer, primary_key=True, index=True)
-    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False, index=True)
-    date = Column(DateTime, nullable=False, index=True, comment="Indicator calculation date")
+    id = Column(Integer, primary_key=True)
+    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False)
+    date = Column(TradingDate, nullable=False, comment="Indicator calculation date")
+
+    # Indicator values are REAL (float4): 6-7 significant digits are ample for
+    # oscillators and price-scale averages, and halve the row width.
 
     # Momentum Indicators
-    rsi_14 = Column(Float, comment="14-day Relative Strength Index")
-    rsi_9 = Column(Float, comment="9-day Relative Strength Index")
-    stochastic_k = Column(Float, comment="Stochastic %K")
-    stochastic_d = Column(Float, comment="Stochastic %D")
+    rsi_14 = Column(REAL, comment="14-day Relative Strength Index")
+    rsi_9 = Column(REAL, comment="9-day Relative Strength Index")
+    stochastic_k = Column(REAL, comment="Stochastic %K")
+    stochastic_d = Column(REAL, comment="Stochastic %D")
 
     # Trend Indicators
-    macd = Column(Float, comment="MACD line")
-    macd_signal = Column(Float, comment="MACD signal line")
-    macd_histogram = Column(Float, comment="MACD histogram")
-    adx = Column(Float, comment="Average Directional Index")
+    macd = Column(REAL, comment="MACD line")
+    macd_signal = Column(REAL, comment="MACD signal line")
+    macd_histogram = Column(REAL, comment="MACD histogram")
+    adx = Column(REAL, comment="Average Directional Index")
 
     # Moving Averages
-    sma_5 = Column(Float, comment="5-day Simple Moving Average")
-    sma_20 = Column(Float, comment="20-day Simple Moving Average")
-    sma_50 = Column(Float, comment="50-day Simple Moving Average")
-    sma_120 = Column(Float, comment="120-day Simple Moving Average")
-    sma_200 = Column(Float, comment="200-day Simple Moving Average")
-    ema_12 = Column(Float, comment="12-day Exponential Moving Average")
-    ema_26 = Column(Float, comment="26-day Exponential Moving Average")
+    sma_5 = Column(REAL, comment="5-day Simple Moving Average")
+    sma_20 = Column(REAL, comment="20-day Simple Moving Average")
+    sma_50 = Column(REAL, comment="50-day Simple Moving Average")
+    sma_120 = Column(REAL, comment="120-day Simple Moving Average")
+    sma_200 = Column(REAL, comment="200-day Simple Moving Average")
+    ema_12 = Column(REAL, comment="12-day Exponential Moving Average")
+    ema_26 = Column(REAL, comment="26-day Exponential Moving Average")
 
     # Volatility Indicators
-    bollinger_upper = Column(Float, comment="Bollinger Upper Band")
-    bollinger_middle = Column(Float, comment="Bollinger Middle Band")
-    bollinger_lower = Column(Float, comment="Bollinger Lower Band")
-    atr = Column(Float, comment="Average True Range")
+    bollinger_upper = Column(REAL, comment="Bollinger Upper Band")
+    bollinger_middle = Column(REAL, comment="Bollinger Middle Band")
+    bollinger_lower = Column(REAL, comment="Bollinger Lower Band")
+    atr = Column(REAL, comment="Average True Range")
 
     # Volume Indicators
     obv = Column(BigInteger, comment="On Balance Volume")
     volume_ma_20 = Column(BigInteger, comment="20-day Volume Moving Average")
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
 
     # Relationships
-    stock = relationship("Stock", back_populates="technical_indicators")
+    stock = relationship("Stock", back_populates="technical_indicators", lazy="raise_on_sql")
 
-    # Composite index
+    # Composite index. Range-partitioned by date on PostgreSQL (migration 006).
     __table_args__ = (
-        Index('ix_tech_indicators_stock_date', 'stock_id', 'date'),
+        Index('ix_tech_indicators_stock_date', 'stock_id', 'date', unique=True),
+        Index('ix_technical_indicators_date_brin', 'date', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
     )
 
 
+def _json_number(value) -> Optional[float]:
+    """Float for a JSON column; NaN and infinities (rejected by JSONB) become None."""
+    if value is None:
+        return None
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def _json_metric(name: str, doc: str, column: str = "metrics") -> property:
+    """Expose a key of a model's JSON column (``metrics`` by default) as a plain attribute."""
+    def getter(self):
+        return (getattr(self, column) or {}).get(name)
+
+    def setter(self, value):
+        metrics = dict(getattr(self, column) or {})
+        value = _json_number(value)
+        if value is None:
+            metrics.pop(name, None)
+        else:
+            metrics[name] = value
+        # Reassign so the change is picked up by the unit of work
+        setattr(self, column, metrics or None)
+
+    return property(getter, setter, doc=doc)
+
+
 class FundamentalIndicator(Base):
     """Fundamental indicators and financial metrics model."""
     __tablename__ = "fundamental_indicators"
 
-    id = Column(Integer, primary_key=True, index=True)
-    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False, index=True)
-    date = Column(DateTime, nullable=False, index=True, comment="Reporting date or calculation date")
+    id = Column(Integer, primary_key=True)
+    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False)
+    date = Column(TradingDate, nullable=False, comment="Reporting date or calculation date")
 
     # Valuation Ratios
     per = Column(Float, comment="Price to Earnings Ratio")
     pbr = Column(Float, comment="Price to Book Ratio")
-    pcr = Column(Float, comment="Price to Cashflow Ratio")
+    pcr = _json_metric("pcr", "Price to Cashflow Ratio")
     psr = Column(Float, comment="Price to Sales Ratio")
 
     # Profitability Ratios
     roe = Column(Float, comment="Return on Equity (%)")
-    roa = Column(Float, comment="Return on Assets (%)")
-    roic = Column(Float, comment="Return on Invested Capital (%)")
+    roa = _json_metric("roa", "Return on Assets (%)")
+    roic = _json_metric("roic", "Return on Invested Capital (%)")
     operating_margin = Column(Float, comment="Operating Profit Margin (%)")
     net_margin = Column(Float, comment="Net Profit Margin (%)")
 
     # Financial Health Ratios
     debt_ratio = Column(Float, comment="Total Debt to Total Assets (%)")
-    debt_to_equity = Column(Float, comment="Debt to Equity Ratio")
+    debt_to_equity = _json_metric("debt_to_equity", "Debt to Equity Ratio")
     current_ratio = Column(Float, comment="Current Assets to Current Liabilities")
-    quick_ratio = Column(Float, comment="Quick Ratio (Acid Test)")
-    interest_coverage = Column(Float, comment="Interest Coverage Ratio")
+    quick_ratio = _json_metric("quick_ratio", "Quick Ratio (Acid Test)")
+    interest_coverage = _json_metric("interest_coverage", "Interest Coverage Ratio")
 
     # Growth Metrics
     revenue_growth = Column(Float, comment="YoY Revenue Growth (%)")
@@ -147,13 +262,13 @@ class FundamentalIndicator(Base):
 
     # Dividend Metrics
     dividend_yield = Column(Float, comment="Dividend Yield (%)")
-    dividend_payout_ratio = Column(Float, comment="Dividend Payout Ratio (%)")
+    dividend_payout_ratio = _json_metric("dividend_payout_ratio", "Dividend Payout Ratio (%)")
 
     # Per Share Metrics
     eps = Column(Float, comment="Earnings Per Share")
     bps = Column(Float, comment="Book value Per Share")
-    cps = Column(Float, comment="Cashflow Per Share")
-    sps = Column(Float, comment="Sales Per Share")
+    cps = _json_metric("cps", "Cashflow Per Share")
+    sps = _json_metric("sps", "Sales Per Share")
     dps = Column(Float, comment="Dividend Per Share")
 
     # Absolute Values (in KRW millions)
@@ -164,15 +279,19 @@ class FundamentalIndicator(Base):
     total_equity = Column(BigInteger, comment="Total Equity")
     total_debt = Column(BigInteger, comment="Total Debt")
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Sparse, never-filtered ratios (properties above) stored as one JSON(B) document
+    metrics = Column(JSON().with_variant(JSONB, 'postgresql'), comment="Rarely queried ratios keyed by name")
+
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
+    updated_at = Column(DateTime, nullable=False, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
-    stock = relationship("Stock", back_populates="fundamental_indicators")
+    stock = relationship("Stock", back_populates="fundamental_indicators", lazy="raise_on_sql")
 
     # Composite indexes
     __table_args__ = (
-        Index('ix_fund_indicators_stock_date', 'stock_id', 'date'),
+        Index('ix_fund_indicators_stock_date', 'stock_id', 'date', unique=True),
+        Index('ix_fundamental_indicators_date_brin', 'date', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
         Index('ix_fund_indicators_per_pbr', 'per', 'pbr'),
         Index('ix_fund_indicators_roe', 'roe'),
     )
@@ -182,90 +301,131 @@ class StabilityScore(Base):
     """Stability score and risk metrics model."""
     __tablename__ = "stability_scores"
 
-    id = Column(Integer, primary_key=True, index=True)
-    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False, index=True)
-    date = Column(DateTime, nullable=False, index=True, comment="Calculation date")
+    id = Column(Integer, primary_key=True)
+    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False)
+    date = Column(TradingDate, nullable=False, comment="Calculation date")
+
+    # Raw measurements behind the component scores are only read per row, so
+    # they live in one JSON column; the component scores stay native
+    details = Column(JSON().with_variant(JSONB, 'postgresql'), comment="Raw stability measurements keyed by name")
+    DETAIL_METRICS = (
+        'returns_mean',
+        'returns_std',
+        'beta',
+        'market_correlation',
+        'volume_stability',
+        'volume_mean',
+        'volume_std',
+        'earnings_consistency',
+        'earnings_trend',
+        'debt_stability',
+        'debt_trend',
+        'debt_ratio_current',
+    )
+
+    # Scores and weights are REAL (float4); raw measurements stay double precision
 
     # Price Volatility Metrics
     price_volatility = Column(Float, comment="Price volatility (std dev of returns)")
-    price_volatility_score = Column(Float, comment="Price volatility score (0-100, higher is more stable)")
-    returns_mean = Column(Float, comment="Mean of daily returns")
-    returns_std = Column(Float, comment="Standard deviation of daily returns")
+    price_volatility_score = Column(REAL, comment="Price volatility score (0-100, higher is more stable)")
+    returns_mean = _json_metric("returns_mean", "Mean of daily returns", "details")
+    returns_std = _json_metric("returns_std", "Standard deviation of daily returns", "details")
 
     # Beta Coefficient (Market Risk)
-    beta = Column(Float, comment="Beta coefficient (systematic risk vs market)")
-    beta_score = Column(Float, comment="Beta score (0-100, closer to 1.0 is more stable)")
-    market_correlation = Column(Float, comment="Correlation with market index")
+    beta = _json_metric("beta", "Beta coefficient (systematic risk vs market)", "details")
+    beta_score = Column(REAL, comment="Beta score (0-100, closer to 1.0 is more stable)")
+    market_correlation = _json_metric("market_correlation", "Correlation with market index", "details")
 
     # Volume Stability Metrics
-    volume_stability = Column(Float, comment="Volume stability (coefficient of variation)")
-    volume_stability_score = Column(Float, comment="Volume stability score (0-100)")
-    volume_mean = Column(BigInteger, comment="Mean trading volume")
-    volume_std = Column(BigInteger, comment="Standard deviation of trading volume")
+    volume_stability = _json_metric("volume_stability", "Volume stability (coefficient of variation)", "details")
+    volume_stability_score = Column(REAL, comment="Volume stability score (0-100)")
+    volume_mean = _json_metric("volume_mean", "Mean trading volume", "details")
+    volume_std = _json_metric("volume_std", "Standard deviation of trading volume", "details")
 
     # Earnings Consistency Metrics
-    earnings_consistency = Column(Float, comment="Earnings consistency (coefficient of variation)")
-    earnings_consistency_score = Column(Float, comment="Earnings consistency score (0-100)")
-    earnings_trend = Column(Float, comment="Earnings trend (slope)")
+    earnings_consistency = _json_metric("earnings_consistency", "Earnings consistency (coefficient of variation)", "details")
+    earnings_consistency_score = Column(REAL, comment="Earnings consistency score (0-100)")
+    earnings_trend = _json_metric("earnings_trend", "Earnings trend (slope)", "details")
 
     # Debt Stability Metrics
-    debt_stability = Column(Float, comment="Debt stability (trend analysis)")
-    debt_stability_score = Column(Float, comment="Debt stability score (0-100)")
-    debt_trend = Column(Float, comment="Debt ratio trend (slope)")
-    debt_ratio_current = Column(Float, comment="Current debt ratio")
+    debt_stability = _json_metric("debt_stability", "Debt stability (trend analysis)", "details")
+    debt_stability_score = Column(REAL, comment="Debt stability score (0-100)")
+    debt_trend = _json_metric("debt_trend", "Debt ratio trend (slope)", "details")
+    debt_ratio_current = _json_metric("debt_ratio_current", "Current debt ratio", "details")
 
     # Overall Stability Score
-    stability_score = Column(Float, nullable=False, index=True, comment="Overall stability score (0-100)")
+    stability_score = Column(REAL, nullable=False, index=True, comment="Overall stability score (0-100)")
 
     # Component Weights (for transparency)
-    weight_price = Column(Float, default=0.25, comment="Weight of price volatility component")
-    weight_beta = Column(Float, default=0.20, comment="Weight of beta component")
-    weight_volume = Column(Float, default=0.15, comment="Weight of volume stability component")
-    weight_earnings = Column(Float, default=0.25, comment="Weight of earnings consistency component")
-    weight_debt = Column(Float, default=0.15, comment="Weight of debt stability component")
+    weight_price = Column(REAL, default=0.25, comment="Weight of price volatility component")
+    weight_beta = Column(REAL, default=0.20, comment="Weight of beta component")
+    weight_volume = Column(REAL, default=0.15, comment="Weight of volume stability component")
+    weight_earnings = Column(REAL, default=0.25, comment="Weight of earnings consistency component")
+    weight_debt = Column(REAL, default=0.15, comment="Weight of debt stability component")
 
     # Data Quality Indicators
-    data_points_price = Column(Integer, comment="Number of price data points used")
-    data_points_earnings = Column(Integer, comment="Number of earnings data points used")
-    data_points_debt = Column(Integer, comment="Number of debt data points used")
-    calculation_period_days = Column(Integer, comment="Period used for calculation in days")
+    data_points_price = Column(SmallInteger, comment="Number of price data points used (SMALLINT: bounded by trading days)")
+    data_points_earnings = Column(SmallInteger, comment="Number of earnings data points used (SMALLINT)")
+    data_points_debt = Column(SmallInteger, comment="Number of debt data points used (SMALLINT)")
+    calculation_period_days = Column(SmallInteger, comment="Period used for calculation in days (SMALLINT)")
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
+    updated_at = Column(DateTime, nullable=False, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
-    stock = relationship("Stock", backref="stability_scores")
-
-    # Composite indexes
+    stock = relationship("Stock", back_populates="stability_scores", lazy="raise_on_sql")
+
+    @classmethod
+    def pack_details(cls, row: dict) -> dict:
+        """Return a copy of a column-keyed row with raw measurements moved into ``details``."""
+        row = dict(row)
+        details = dict(row.pop('details', None) or {})
+        for name in cls.DETAIL_METRICS:
+            value = _json_number(row.pop(name, None))
+            if value is not None:
+                details[name] = value
+        row['details'] = details or None
+        return row
+
+    # Composite indexes. Range-partitioned by date on PostgreSQL (migration 024),
+    # with (id, date) as the physical primary key.
     __table_args__ = (
-        Index('ix_stability_scores_stock_date', 'stock_id', 'date'),
+        Index('ix_stability_scores_stock_date', 'stock_id', 'date', unique=True),
+        Index('ix_stability_scores_date_brin', 'date', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
         Index('ix_stability_scores_score', 'stability_score'),
     )
 
 
+# Fixed vocabularies for trade columns (native ENUM types on PostgreSQL)
+TRADE_ACTIONS = ('BUY', 'SELL')
+TRADE_ORDER_TYPES = ('MARKET', 'LIMIT', 'STOP_LOSS', 'STOP_LIMIT')
+TRADE_STATUSES = ('PENDING', 'EXECUTED', 'PARTIALLY_FILLED', 'CANCELLED', 'FAILED')
+
+
 class Trade(Base):
     """Trade execution model (trade_history)."""
     __tablename__ = "trades"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     order_id = Column(String(50), unique=True, nullable=False, index=True, comment="Unique order identifier")
-    ticker = Column(String(20), nullable=False, index=True, comment="Stock code")
-    action = Column(String(10), nullable=False, index=True, comment="BUY, SELL")
-    order_type = Column(String(20), nullable=False, comment="MARKET, LIMIT, STOP_LOSS")
+    ticker = Column(TICKER_TYPE, nullable=False, comment="Stock code")
+    action = Column(Enum(*TRADE_ACTIONS, name="trade_action"), nullable=False, index=True, comment="BUY, SELL")
+    order_type = Column(Enum(*TRADE_ORDER_TYPES, name="trade_order_type"), nullable=False, comment="MARKET, LIMIT, STOP_LOSS, STOP_LIMIT")
     quantity = Column(Integer, nullable=False, comment="Number of shares")
     price = Column(Numeric(15, 2), comment="Order price (limit/stop price)")
     executed_price = Column(Numeric(15, 2), comment="Actual execution price")
     executed_quantity = Column(Integer, comment="Actual executed quantity")
     total_amount = Column(BigInteger, comment="Total transaction amount in KRW")
-    commission = Column(Integer, comment="Commission fees in KRW")
-    tax = Column(Integer, comment="Tax amount in KRW")
-    status = Column(String(20), nullable=False, index=True, comment="PENDING, EXECUTED, PARTIALLY_FILLED, CANCELLED, FAILED")
-    reason = Column(Text, comment="Reason for trade or failure reason")
+    commission = Column(Integer, comment="Commission fees in KRW (INTEGER: per-order fees stay far below 2^31)")
+    tax = Column(Integer, comment="Tax amount in KRW (INTEGER: per-order tax stays far below 2^31)")
+    status = Column(Enum(*TRADE_STATUSES, name="trade_status"), nullable=False, comment="PENDING, EXECUTED, PARTIALLY_FILLED, CANCELLED, FAILED")
+    # Free text, read only by the CSV export; loaded on access (undefer for bulk reads)
+    reason = deferred(Column(Text, comment="Reason for trade or failure reason"))
     strategy = Column(String(50), comment="Trading strategy that generated this order")
-    created_at = Column(DateTime, default=datetime.utcnow, index=True, comment="Order creation timestamp")
+    created_at = Column(DateTime, nullable=False, server_default=utcnow(), index=True, comment="Order creation timestamp")
     executed_at = Column(DateTime, index=True, comment="Execution timestamp")
     cancelled_at = Column(DateTime, comment="Cancellation timestamp")
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, server_default=utcnow(), onupdate=utcnow())
 
     # Composite indexes
     __table_args__ = (
@@ -278,19 +438,20 @@ class Portfolio(Base):
     """Portfolio holdings model."""
     __tablename__ = "portfolios"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(String(50), nullable=False, index=True, comment="User identifier")
-    ticker = Column(String(20), nullable=False, index=True, comment="Stock code")
+    id = Column(Integer, primary_key=True)
+    user_id = Column(String(50), nullable=False, comment="User identifier")
+    ticker = Column(TICKER_TYPE, nullable=False, index=True, comment="Stock code")
     quantity = Column(Integer, nullable=False, comment="Number of shares held")
     avg_price = Column(Numeric(15, 2), nullable=False, comment="Average purchase price per share")
     current_price = Column(Numeric(15, 2), comment="Current market price per share")
-    current_value = Column(BigInteger, comment="Current total value (quantity * current_price)")
-    invested_amount = Column(BigInteger, comment="Total invested amount (quantity * avg_price)")
-    unrealized_pnl = Column(BigInteger, comment="Unrealized profit/loss in KRW")
-    unrealized_pnl_pct = Column(Float, comment="Unrealized profit/loss percentage")
+    # Derived values are generated by the database and must not be assigned
+    current_value = Column(BigInteger, Computed("quantity * current_price", persisted=True), comment="Current total value (quantity * current_price)")
+    invested_amount = Column(BigInteger, Computed("quantity * avg_price", persisted=True), comment="Total invested amount (quantity * avg_price)")
+    unrealized_pnl = Column(BigInteger, Computed("quantity * (current_price - avg_price)", persisted=True), comment="Unrealized profit/loss in KRW")
+    unrealized_pnl_pct = Column(Float, Computed("(current_price - avg_price) * 100.0 / NULLIF(avg_price, 0)", persisted=True), comment="Unrealized profit/loss percentage")
     realized_pnl = Column(BigInteger, comment="Realized profit/loss in KRW")
-    total_commission = Column(Integer, comment="Total commission paid")
-    total_tax = Column(Integer, comment="Total tax paid")
+    total_commission = Column(Integer, comment="Total commission paid (INTEGER: ~2.1B KRW per position; widen to BIGINT if exceeded)")
+    total_tax = Column(Integer, comment="Total tax paid (INTEGER: ~2.1B KRW per position; widen to BIGINT if exceeded)")
     first_purchase_date = Column(DateTime, comment="Date of first purchase")
     last_transaction_date = Column(DateTime, comment="Date of last transaction")
 
@@ -305,8 +466,8 @@ class Portfolio(Base):
     take_profit_pct = Column(Float, default=20.0, comment="Take-profit percentage from avg price (default +20%)")
     take_profit_use_technical = Column(Boolean, default=False, comment="Use technical signals for take-profit")
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
+    updated_at = Column(DateTime, nullable=False, server_default=utcnow(), onupdate=utcnow())
 
     # Composite indexes
     __table_args__ = (
@@ -314,74 +475,167 @@ class Portfolio(Base):
     )
 
 
+# Positions are repriced in place many times a day. Leave 20% of each page free
+# so those UPDATEs stay HOT, and vacuum/analyze the small table sooner.
+# Storage parameters cannot be declared on Table, so create_all() applies them
+# here (migration 033 does the same for existing databases).
+PORTFOLIO_STORAGE_PARAMS = 'fillfactor = 80, autovacuum_vacuum_scale_factor = 0.05, autovacuum_analyze_scale_factor = 0.02'
+
+event.listen(
+    Portfolio.__table__,
+    'after_create',
+    DDL(f'ALTER TABLE portfolios SET ({PORTFOLIO_STORAGE_PARAMS})').execute_if(dialect='postgresql'),
+)
+
+
 class CompositeScore(Base):
     """Composite investment score model combining value, growth, quality, and momentum scores."""
     __tablename__ = "composite_scores"
 
-    id = Column(Integer, primary_key=True, index=True)
-    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False, index=True)
-    date = Column(DateTime, nullable=False, index=True, comment="Calculation date")
+    id = Column(Integer, primary_key=True)
+    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False)
+    date = Column(TradingDate, nullable=False, comment="Calculation date")
+
+    # Scores and weights are REAL (float4), like the technical indicators
 
     # Component Scores (0-100 scale)
-    value_score = Column(Float, comment="Value score based on PER, PBR, dividend yield (0-100)")
-    growth_score = Column(Float, comment="Growth score based on earnings/revenue growth (0-100)")
-    quality_score = Column(Float, comment="Quality score based on ROE, margins, debt (0-100)")
-    momentum_score = Column(Float, comment="Momentum score based on price trend, RSI (0-100)")
+    value_score = Column(REAL, comment="Value score based on PER, PBR, dividend yield (0-100)")
+    growth_score = Column(REAL, comment="Growth score based on earnings/revenue growth (0-100)")
+    quality_score = Column(REAL, comment="Quality score based on ROE, margins, debt (0-100)")
+    momentum_score = Column(REAL, comment="Momentum score based on price trend, RSI (0-100)")
 
     # Overall Composite Score
-    composite_score = Column(Float, nullable=False, index=True, comment="Overall composite score (0-100)")
-    percentile_rank = Column(Float, comment="Percentile rank among all stocks (0-100)")
+    composite_score = Column(REAL, nullable=False, index=True, comment="Overall composite score (0-100)")
+    percentile_rank = Column(REAL, comment="Percentile rank among all stocks (0-100)")
 
     # Component Weights (for transparency and customization)
-    weight_value = Column(Float, default=0.25, comment="Weight of value component")
-    weight_growth = Column(Float, default=0.25, comment="Weight of growth component")
-    weight_quality = Column(Float, default=0.25, comment="Weight of quality component")
-    weight_momentum = Column(Float, default=0.25, comment="Weight of momentum component")
+    weight_value = Column(REAL, default=0.25, comment="Weight of value component")
+    weight_growth = Column(REAL, default=0.25, comment="Weight of growth component")
+    weight_quality = Column(REAL, default=0.25, comment="Weight of quality component")
+    weight_momentum = Column(REAL, default=0.25, comment="Weight of momentum component")
+
+    # Component breakdowns are only read per row, so they live in one JSON
+    # column; the component scores above stay native for filtering and sorting
+    details = Column(JSON().with_variant(JSONB, 'postgresql'), comment="Component score breakdown keyed by name")
+    DETAIL_SCORES = (
+        'per_score',
+        'pbr_score',
+        'dividend_yield_score',
+        'psr_score',
+        'revenue_growth_score',
+        'earnings_growth_score',
+        'equity_growth_score',
+        'roe_score',
+        'operating_margin_score',
+        'net_margin_score',
+        'debt_ratio_score',
+        'current_ratio_score',
+        'rsi_score',
+        'price_trend_score',
+        'macd_score',
+        'volume_trend_score',
+    )
 
     # Value Score Components
-    per_score = Column(Float, comment="PER score component (0-100)")
-    pbr_score = Column(Float, comment="PBR score component (0-100)")
-    dividend_yield_score = Column(Float, comment="Dividend yield score component (0-100)")
-    psr_score = Column(Float, comment="PSR score component (0-100)")
+    per_score = _json_metric("per_score", "PER score component (0-100)", "details")
+    pbr_score = _json_metric("pbr_score", "PBR score component (0-100)", "details")
+    dividend_yield_score = _json_metric("dividend_yield_score", "Dividend yield score component (0-100)", "details")
+    psr_score = _json_metric("psr_score", "PSR score component (0-100)", "details")
 
     # Growth Score Components
-    revenue_growth_score = Column(Float, comment="Revenue growth score component (0-100)")
-    earnings_growth_score = Column(Float, comment="Earnings growth score component (0-100)")
-    equity_growth_score = Column(Float, comment="Equity growth score component (0-100)")
+    revenue_growth_score = _json_metric("revenue_growth_score", "Revenue growth score component (0-100)", "details")
+    earnings_growth_score = _json_metric("earnings_growth_score", "Earnings growth score component (0-100)", "details")
+    equity_growth_score = _json_metric("equity_growth_score", "Equity growth score component (0-100)", "details")
 
     # Quality Score Components
-    roe_score = Column(Float, comment="ROE score component (0-100)")
-    operating_margin_score = Column(Float, comment="Operating margin score component (0-100)")
-    net_margin_score = Column(Float, comment="Net margin score component (0-100)")
-    debt_ratio_score = Column(Float, comment="Debt ratio score component (0-100)")
-    current_ratio_score = Column(Float, comment="Current ratio score component (0-100)")
+    roe_score = _json_metric("roe_score", "ROE score component (0-100)", "details")
+    operating_margin_score = _json_metric("operating_margin_score", "Operating margin score component (0-100)", "details")
+    net_margin_score = _json_metric("net_margin_score", "Net margin score component (0-100)", "details")
+    debt_ratio_score = _json_metric("debt_ratio_score", "Debt ratio score component (0-100)", "details")
+    current_ratio_score = _json_metric("current_ratio_score", "Current ratio score component (0-100)", "details")
 
     # Momentum Score Components
-    rsi_score = Column(Float, comment="RSI score component (0-100)")
-    price_trend_score = Column(Float, comment="Price trend score component (0-100)")
-    macd_score = Column(Float, comment="MACD score component (0-100)")
-    volume_trend_score = Column(Float, comment="Volume trend score component (0-100)")
+    rsi_score = _json_metric("rsi_score", "RSI score component (0-100)", "details")
+    price_trend_score = _json_metric("price_trend_score", "Price trend score component (0-100)", "details")
+    macd_score = _json_metric("macd_score", "MACD score component (0-100)", "details")
+    volume_trend_score = _json_metric("volume_trend_score", "Volume trend score component (0-100)", "details")
 
     # Data Quality Indicators
-    data_quality_score = Column(Float, comment="Data completeness score (0-100)")
-    missing_value_count = Column(Integer, comment="Number of missing values in calculation")
-    total_metric_count = Column(Integer, comment="Total number of metrics evaluated")
+    data_quality_score = Column(REAL, comment="Data completeness score (0-100)")
+    missing_value_count = Column(SmallInteger, comment="Number of missing values in calculation (SMALLINT: bounded by metric count)")
+    total_metric_count = Column(SmallInteger, comment="Total number of metrics evaluated (SMALLINT)")
 
     # Metadata
     calculation_method = Column(String(50), default="standard", comment="Calculation method version")
     notes = Column(Text, comment="Additional notes or warnings")
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
+    updated_at = Column(DateTime, nullable=False, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
-    stock = relationship("Stock", backref="composite_scores")
-
-    # Composite indexes
+    stock = relationship("Stock", back_populates="composite_scores", lazy="raise_on_sql")
+
+    @classmethod
+    def pack_details(cls, row: dict) -> dict:
+        """Return a copy of a column-keyed row with breakdown scores moved into ``details``."""
+        row = dict(row)
+        details = dict(row.pop('details', None) or {})
+        for name in cls.DETAIL_SCORES:
+            value = _json_number(row.pop(name, None))
+            if value is not None:
+                details[name] = value
+        row['details'] = details or None
+        return row
+
+    # Composite indexes. Range-partitioned by date on PostgreSQL (migration 020),
+    # with the same (id, date) physical primary key as stock_prices.
     __table_args__ = (
-        Index('ix_composite_scores_stock_date', 'stock_id', 'date'),
+        Index('ix_composite_scores_stock_date', 'stock_id', 'date', unique=True),
         Index('ix_composite_scores_score', 'composite_score'),
-        Index('ix_composite_scores_date_score', 'date', 'composite_score'),
+        # Covering index so the per-date percentile ranking stays index-only
+        Index('ix_composite_scores_date_score', 'date', 'composite_score', postgresql_include=['id']),
+    )
+
+
+class StockLatestMetrics(Base):
+    """Latest screening metrics per stock, one row per stock.
+
+    Derived from the time-series tables by
+    shared.database.latest_metrics.refresh_latest_metrics so screeners can
+    filter stocks without a latest-row lookup per table.
+    """
+    __tablename__ = "stock_latest_metrics"
+
+    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), primary_key=True)
+
+    # Latest price
+    price_date = Column(TradingDate, comment="Date of the latest stock_prices row")
+    close = Column(Integer, comment="Latest closing price (KRW)")
+
+    # Latest fundamentals
+    fundamental_date = Column(TradingDate, comment="Date of the latest fundamental_indicators row")
+    per = Column(Float, comment="Price to Earnings Ratio")
+    pbr = Column(Float, comment="Price to Book Ratio")
+    roe = Column(Float, comment="Return on Equity (%)")
+    debt_ratio = Column(Float, comment="Total Debt to Total Assets (%)")
+    dividend_yield = Column(Float, comment="Dividend Yield (%)")
+
+    # Latest technicals
+    technical_date = Column(TradingDate, comment="Date of the latest technical_indicators row")
+    rsi_14 = Column(REAL, comment="14-day Relative Strength Index")
+    sma_20 = Column(REAL, comment="20-day Simple Moving Average")
+
+    # Latest scores
+    price_volatility = Column(Float, comment="Price volatility (std dev of returns)")
+    stability_score = Column(REAL, comment="Overall stability score (0-100)")
+    composite_score = Column(REAL, comment="Overall composite score (0-100)")
+
+    updated_at = Column(DateTime, nullable=False, server_default=utcnow(), onupdate=utcnow())
+
+    __table_args__ = (
+        Index('ix_stock_latest_metrics_per_pbr', 'per', 'pbr'),
+        Index('ix_stock_latest_metrics_roe', 'roe'),
+        Index('ix_stock_latest_metrics_composite', 'composite_score'),
     )
 
 
@@ -389,10 +643,10 @@ class Watchlist(Base):
     """Watchlist model for tracking stocks of interest."""
     __tablename__ = "watchlist"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False, index=True)
-    user_id = Column(String(50), nullable=False, index=True, comment="User identifier")
-    ticker = Column(String(20), nullable=False, index=True, comment="Stock code (denormalized for quick access)")
+    user_id = Column(String(50), nullable=False, comment="User identifier")
+    ticker = Column(TICKER_TYPE, nullable=False, index=True, comment="Stock code (denormalized for quick access)")
     reason = Column(Text, comment="Reason for adding to watchlist")
     score = Column(Float, comment="Custom score or rating (0-100)")
     target_price = Column(Numeric(15, 2), comment="Target buy/sell price")
@@ -401,31 +655,41 @@ class Watchlist(Base):
     alert_enabled = Column(Boolean, default=False, comment="Whether price alerts are enabled")
     alert_price_upper = Column(Numeric(15, 2), comment="Alert if price goes above this")
     alert_price_lower = Column(Numeric(15, 2), comment="Alert if price goes below this")
-    is_active = Column(Boolean, default=True, index=True, comment="Whether watchlist entry is active")
-    added_date = Column(DateTime, default=datetime.utcnow, index=True, comment="Date added to watchlist")
+    is_active = Column(Boolean, default=True, comment="Whether watchlist entry is active")
+    added_date = Column(DateTime, server_default=utcnow(), index=True, comment="Date added to watchlist")
     last_viewed = Column(DateTime, comment="Last time user viewed this stock")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
+    updated_at = Column(DateTime, nullable=False, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
-    stock = relationship("Stock", back_populates="watchlist_entries")
-    history = relationship("WatchlistHistory", back_populates="watchlist", cascade="all, delete-orphan")
+    stock = relationship("Stock", back_populates="watchlist_entries", lazy="raise_on_sql")
+    history = relationship(
+        "WatchlistHistory", back_populates="watchlist", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
 
     # Composite indexes
     __table_args__ = (
         Index('ix_watchlist_user_ticker', 'user_id', 'ticker'),
-        Index('ix_watchlist_user_score', 'user_id', 'score'),
-        Index('ix_watchlist_user_added', 'user_id', 'added_date'),
+        # Ranked reads of a user's active entries (partial + covering on PostgreSQL)
+        Index(
+            'ix_watchlist_user_active', 'user_id', 'score',
+            postgresql_include=['ticker', 'added_date'],
+            postgresql_where=text('is_active'),
+        ),
     )
 
 
+# Fixed vocabulary for watchlist snapshot reasons (native ENUM type on PostgreSQL)
+SNAPSHOT_REASONS = ('added', 'daily_update', 'manual', 'criteria_check')
+
+
 class WatchlistHistory(Base):
     """Historical tracking of watchlist stocks' performance and scores."""
     __tablename__ = "watchlist_history"
 
-    id = Column(Integer, primary_key=True, index=True)
-    watchlist_id = Column(Integer, ForeignKey("watchlist.id", ondelete="CASCADE"), nullable=False, index=True)
-    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    watchlist_id = Column(Integer, ForeignKey("watchlist.id", ondelete="CASCADE"), nullable=False)
+    stock_id = Column(Integer, ForeignKey("stocks.id", ondelete="CASCADE"), nullable=False)
     date = Column(DateTime, nullable=False, comment="Snapshot date")
 
     # Price Information
@@ -473,28 +737,33 @@ class WatchlistHistory(Base):
 
     # Criteria Met Status
     meets_criteria = Column(Boolean, comment="Whether stock still meets watchlist criteria")
-    criteria_violations = Column(Text, comment="List of criteria violations if any")
+    # Rarely read annotations are deferred as one group so history scans skip them
+    criteria_violations = deferred(
+        Column(JSON().with_variant(JSONB, 'postgresql'), comment="List of criteria violations if any"),
+        group="annotations",
+    )
 
     # Performance Metrics
-    days_on_watchlist = Column(Integer, comment="Number of days on watchlist")
+    days_on_watchlist = Column(SmallInteger, comment="Number of days on watchlist (SMALLINT: up to ~89 years)")
     total_return_pct = Column(Float, comment="Total return % since added")
     annualized_return_pct = Column(Float, comment="Annualized return %")
 
     # Metadata
-    snapshot_reason = Column(String(50), comment="Reason for snapshot: daily_update, manual, criteria_check")
-    notes = Column(Text, comment="Additional notes for this snapshot")
+    snapshot_reason = Column(Enum(*SNAPSHOT_REASONS, name="watchlist_snapshot_reason"), comment="Reason for snapshot: added, daily_update, manual, criteria_check")
+    notes = deferred(Column(Text, comment="Additional notes for this snapshot"), group="annotations")
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
 
     # Relationships
-    watchlist = relationship("Watchlist", back_populates="history")
-    stock = relationship("Stock")
+    watchlist = relationship("Watchlist", back_populates="history", lazy="raise_on_sql")
+    stock = relationship("Stock", lazy="raise_on_sql")
 
-    # Composite indexes for efficient queries
+    # Composite indexes for efficient queries. Range-partitioned by date on
+    # PostgreSQL (migration 024), with (id, date) as the physical primary key.
     __table_args__ = (
-        Index('ix_watchlist_history_watchlist_date', 'watchlist_id', 'date'),
+        Index('ix_watchlist_history_watchlist_date', 'watchlist_id', 'date', unique=True),
         Index('ix_watchlist_history_stock_date', 'stock_id', 'date'),
-        Index('ix_watchlist_history_date', 'date'),
+        Index('ix_watchlist_history_date_brin', 'date', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
         Index('ix_watchlist_history_performance', 'total_return_pct', 'annualized_return_pct'),
     )
 
@@ -503,9 +772,9 @@ class PortfolioRiskMetrics(Base):
     """Portfolio-level risk metrics and tracking model."""
     __tablename__ = "portfolio_risk_metrics"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(String(50), nullable=False, index=True, comment="User identifier")
-    date = Column(DateTime, nullable=False, index=True, comment="Calculation date")
+    date = Column(DateTime, nullable=False, comment="Calculation date")
 
     # Portfolio Value Metrics
     total_value = Column(BigInteger, nullable=False, comment="Total portfolio value in KRW")
@@ -525,11 +794,11 @@ class PortfolioRiskMetrics(Base):
     # Drawdown Metrics
     current_drawdown = Column(Float, nullable=False, index=True, comment="Current drawdown from peak (%)")
     max_drawdown = Column(Float, comment="Maximum drawdown experienced (%)")
-    drawdown_duration_days = Column(Integer, comment="Days since peak value")
+    drawdown_duration_days = Column(SmallInteger, comment="Days since peak value (SMALLINT)")
     is_at_peak = Column(Boolean, default=False, comment="Whether portfolio is at all-time high")
 
     # Position Metrics
-    position_count = Column(Integer, comment="Number of open positions")
+    position_count = Column(SmallInteger, comment="Number of open positions (SMALLINT)")
     largest_position_pct = Column(Float, comment="Largest single position as % of portfolio")
     largest_position_ticker = Column(String(20), comment="Ticker of largest position")
     total_exposure_pct = Column(Float, comment="Total market exposure as % (invested/total value)")
@@ -543,12 +812,12 @@ class PortfolioRiskMetrics(Base):
     # Risk Limits Status
     max_position_size_limit = Column(Float, default=10.0, comment="Max position size limit (%)")
     max_loss_limit = Column(Float, default=30.0, comment="Max total loss limit (%)")
-    is_trading_halted = Column(Boolean, default=False, index=True, comment="Whether trading is halted due to loss limit")
+    is_trading_halted = Column(Boolean, default=False, comment="Whether trading is halted due to loss limit")
     trading_halt_reason = Column(Text, comment="Reason for trading halt")
     trading_halt_timestamp = Column(DateTime, comment="When trading was halted")
 
     # Violation Tracking
-    position_size_violations = Column(Integer, default=0, comment="Count of position size limit violations")
+    position_size_violations = Column(SmallInteger, default=0, comment="Count of position size limit violations (SMALLINT)")
     risk_warnings = Column(Text, comment="Active risk warnings")
 
     # Performance Metrics
@@ -556,13 +825,16 @@ class PortfolioRiskMetrics(Base):
     win_rate = Column(Float, comment="Win rate % (winning trades / total trades)")
     profit_factor = Column(Float, comment="Profit factor (gross profit / gross loss)")
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=utcnow())
+    updated_at = Column(DateTime, nullable=False, server_default=utcnow(), onupdate=utcnow())
 
     # Composite indexes
     __table_args__ = (
         Index('ix_portfolio_risk_user_date', 'user_id', 'date'),
+        Index('ix_portfolio_risk_metrics_date_brin', 'date', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
         Index('ix_portfolio_risk_drawdown', 'current_drawdown'),
         Index('ix_portfolio_risk_loss', 'total_loss_from_initial_pct'),
-        Index('ix_portfolio_risk_halted', 'is_trading_halted', 'user_id'),
+        # Dashboard lookups touch only the few halted / deep-drawdown rows
+        Index('ix_portfolio_risk_halted', 'user_id', postgresql_where=text('is_trading_halted')),
+        Index('ix_portfolio_risk_deep_drawdown', 'user_id', 'date', postgresql_where=text('current_drawdown > 10')),
     )
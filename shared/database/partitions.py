@@ -0,0 +1,90 @@
+"""
+Maintenance of the yearly RANGE (date) partitions on time-series tables.
+"""
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+# Tables partitioned by year in revisions 006, 020 and 024
+PARTITIONED_TABLES = (
+    'stock_prices',
+    'technical_indicators',
+    'stability_scores',
+    'composite_scores',
+    'watchlist_history',
+)
+
+# How many years past the current one should already have a partition
+FUTURE_PARTITION_YEARS = 2
+
+
+def _existing_partitions(session: Session, table: str) -> set:
+    """Names of all partitions currently attached to a table."""
+    rows = session.execute(text(
+        "SELECT c.relname "
+        "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = CAST(:table AS regclass)"
+    ), {'table': table})
+    return set(rows.scalars())
+
+
+def _create_year_partition(session: Session, table: str, year: int) -> str:
+    """
+    Create and attach the partition for one year.
+
+    Rows for that year may already sit in the DEFAULT partition, which would
+    make a plain CREATE ... PARTITION OF fail, so they are moved into the new
+    table before it is attached.
+    """
+    name = f'{table}_y{year}'
+    start, end = f'{year}-01-01', f'{year + 1}-01-01'
+
+    session.execute(text(
+        f'CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+    ))
+    session.execute(text(
+        f'WITH moved AS ('
+        f"DELETE FROM {table}_default WHERE date >= '{start}' AND date < '{end}' RETURNING *"
+        f') INSERT INTO {name} SELECT * FROM moved'
+    ))
+    # Indexes, foreign keys and triggers of the parent are cloned on attach
+    session.execute(text(
+        f"ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')"
+    ))
+    return name
+
+
+def ensure_future_partitions(session: Session, years_ahead: Optional[int] = None) -> List[str]:
+    """
+    Make sure every partitioned table has a partition up to ``years_ahead`` years out.
+
+    The migrations only create yearly partitions up to a fixed year (2031);
+    after that new rows would silently pile up in the DEFAULT partition and
+    lose pruning. Cheap to run daily: it only reads the catalog unless a year
+    is missing. No-op on databases other than PostgreSQL. The caller commits.
+
+    Args:
+        session: Database session
+        years_ahead: Years past the current one to cover (default: FUTURE_PARTITION_YEARS)
+
+    Returns:
+        Names of the partitions created
+    """
+    if session.get_bind().dialect.name != 'postgresql':
+        return []
+
+    if years_ahead is None:
+        years_ahead = FUTURE_PARTITION_YEARS
+
+    this_year = datetime.utcnow().year
+    created = []
+    for table in PARTITIONED_TABLES:
+        existing = _existing_partitions(session, table)
+        for year in range(this_year, this_year + years_ahead + 1):
+            if f'{table}_y{year}' not in existing:
+                created.append(_create_year_partition(session, table, year))
+
+    return created
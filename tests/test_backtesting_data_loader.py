@@ -0,0 +1,110 @@
+"""
+Unit tests for the backtesting data loader.
+
+Tests the Parquet export and loading prices and indicators back from it.
+"""
+import os
+from datetime import timedelta
+
+import pytest
+
+from services.backtesting import data_loader
+from services.backtesting.data_loader import BacktestDataLoader, export_to_parquet
+from shared.database.models import TechnicalIndicator
+
+
+@pytest.fixture
+def sample_indicators(test_db_session, sample_stock, sample_stock_prices):
+    """Indicators for every price day; RSI is only warmed up for the last ten."""
+    indicators = []
+    for i, price in enumerate(sample_stock_prices):
+        indicator = TechnicalIndicator(
+            stock_id=sample_stock.id,
+            date=price.date,
+            rsi_14=55.0 + i if i >= 20 else None,
+            sma_20=70000.0 + i * 100,
+            obv=1000000 + i if i >= 20 else None,
+        )
+        indicators.append(indicator)
+        test_db_session.add(indicator)
+
+    test_db_session.commit()
+    return indicators
+
+
+class TestParquetExport:
+    """Test suite for export_to_parquet and the Parquet-backed loader."""
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        """Write several chunks so the first ones have all-NULL columns."""
+        monkeypatch.setattr(data_loader, "EXPORT_CHUNK_SIZE", 10)
+
+    def test_export_counts_rows(self, test_db_session, sample_indicators, tmp_path):
+        """Test that every row of both datasets is exported."""
+        counts = export_to_parquet(test_db_session, str(tmp_path))
+
+        assert counts == {
+            data_loader.PRICE_DATASET: 30,
+            data_loader.TECHNICAL_DATASET: 30,
+        }
+        assert not os.path.exists(tmp_path / f"{data_loader.PRICE_DATASET}.tmp")
+
+    def test_round_trip_prices(
+        self, test_db_session, sample_stock, sample_stock_prices, tmp_path
+    ):
+        """Test that prices loaded from Parquet match the database."""
+        export_to_parquet(test_db_session, str(tmp_path))
+        start = sample_stock_prices[0].date
+        end = sample_stock_prices[-1].date
+
+        from_db = BacktestDataLoader(test_db_session).load_price_data(
+            [sample_stock.ticker], start, end, cache=False
+        )
+        from_parquet = BacktestDataLoader(
+            test_db_session, parquet_path=str(tmp_path)
+        ).load_price_data([sample_stock.ticker], start, end, cache=False)
+
+        assert len(from_parquet) == 30
+        assert list(from_parquet["close"]) == list(from_db["close"])
+
+    def test_round_trip_all_null_chunk(
+        self, test_db_session, sample_stock, sample_indicators, tmp_path
+    ):
+        """Test that a column that is all NULL in some chunks still loads."""
+        export_to_parquet(test_db_session, str(tmp_path))
+        start = sample_indicators[0].date
+        end = sample_indicators[-1].date
+
+        df = BacktestDataLoader(
+            test_db_session, parquet_path=str(tmp_path)
+        ).load_technical_indicators(
+            [sample_stock.ticker], start, end, cache=False, indicators=["rsi_14", "obv"]
+        )
+
+        assert len(df) == 30
+        assert df["rsi_14"].isna().sum() == 20
+        assert df["rsi_14"].iloc[-1] == pytest.approx(84.0)
+        assert df["obv"].iloc[-1] == 1000029
+
+    def test_failed_export_keeps_previous_dataset(
+        self, test_db_session, sample_stock, sample_stock_prices, tmp_path, monkeypatch
+    ):
+        """Test that an interrupted export leaves the last good dataset in place."""
+        export_to_parquet(test_db_session, str(tmp_path))
+
+        def fail(*args, **kwargs):
+            raise IOError("disk full")
+
+        monkeypatch.setattr(data_loader.pd.DataFrame, "to_parquet", fail)
+        with pytest.raises(IOError):
+            export_to_parquet(test_db_session, str(tmp_path))
+
+        start = sample_stock_prices[0].date
+        end = sample_stock_prices[-1].date + timedelta(days=1)
+        df = BacktestDataLoader(
+            test_db_session, parquet_path=str(tmp_path)
+        ).load_price_data([sample_stock.ticker], start, end, cache=False)
+
+        assert len(df) == 30
+        assert not os.path.exists(tmp_path / f"{data_loader.PRICE_DATASET}.tmp")
@@ -0,0 +1,96 @@
+"""
+Unit tests for the bulk upsert helper.
+"""
+from datetime import datetime
+
+from shared.database.bulk import bulk_upsert
+from shared.database.models import StabilityScore, TechnicalIndicator
+
+
+def _indicators(session):
+    """All technical indicator rows ordered by date."""
+    session.expire_all()
+    return session.query(TechnicalIndicator).order_by(TechnicalIndicator.date).all()
+
+
+class TestBulkUpsert:
+    """Test suite for bulk_upsert."""
+
+    def test_inserts_and_updates(self, test_db_session, sample_stock):
+        """Test new keys are inserted and existing keys are updated in place."""
+        day = datetime(2024, 1, 2)
+        bulk_upsert(
+            test_db_session, TechnicalIndicator,
+            [{'stock_id': sample_stock.id, 'date': day, 'rsi_14': 50.0}],
+            conflict_columns=('stock_id', 'date'),
+        )
+        written = bulk_upsert(
+            test_db_session, TechnicalIndicator,
+            [
+                {'stock_id': sample_stock.id, 'date': day, 'rsi_14': 60.0},
+                {'stock_id': sample_stock.id, 'date': datetime(2024, 1, 3), 'rsi_14': 61.0},
+            ],
+            conflict_columns=('stock_id', 'date'),
+        )
+        test_db_session.commit()
+
+        assert written == 2
+        assert [row.rsi_14 for row in _indicators(test_db_session)] == [60.0, 61.0]
+
+    def test_rows_with_different_keys(self, test_db_session, sample_stock):
+        """Test every row's own columns are written when key sets differ."""
+        first, second = datetime(2024, 1, 2), datetime(2024, 1, 3)
+        bulk_upsert(
+            test_db_session, TechnicalIndicator,
+            [
+                {'stock_id': sample_stock.id, 'date': first, 'rsi_14': 50.0, 'sma_20': 1.0},
+                {'stock_id': sample_stock.id, 'date': second, 'rsi_14': 51.0, 'sma_20': 2.0},
+            ],
+            conflict_columns=('stock_id', 'date'),
+        )
+        bulk_upsert(
+            test_db_session, TechnicalIndicator,
+            [
+                {'stock_id': sample_stock.id, 'date': first, 'rsi_14': 60.0},
+                {'stock_id': sample_stock.id, 'date': second, 'rsi_14': 61.0, 'sma_20': 8.0},
+                {'stock_id': sample_stock.id, 'date': datetime(2024, 1, 4), 'sma_20': 9.0},
+            ],
+            conflict_columns=('stock_id', 'date'),
+        )
+        test_db_session.commit()
+
+        rows = _indicators(test_db_session)
+        assert [(row.rsi_14, row.sma_20) for row in rows] == [
+            (60.0, 1.0),  # sma_20 left out, so the stored value is kept
+            (61.0, 8.0),
+            (None, 9.0),
+        ]
+
+    def test_refreshes_onupdate_columns(self, test_db_session, sample_stock):
+        """Test updated_at is refreshed on conflict even though rows do not set it."""
+        day = datetime(2024, 1, 2)
+        test_db_session.add(StabilityScore(
+            stock_id=sample_stock.id,
+            date=day,
+            stability_score=50.0,
+            updated_at=datetime(2020, 1, 1),
+        ))
+        test_db_session.commit()
+
+        bulk_upsert(
+            test_db_session, StabilityScore,
+            [{'stock_id': sample_stock.id, 'date': day, 'stability_score': 60.0}],
+            conflict_columns=('stock_id', 'date'),
+        )
+        test_db_session.commit()
+
+        test_db_session.expire_all()
+        row = test_db_session.query(StabilityScore).one()
+        assert row.stability_score == 60.0
+        assert row.updated_at > datetime(2020, 1, 1)
+
+    def test_empty_rows(self, test_db_session):
+        """Test an empty batch writes nothing."""
+        assert bulk_upsert(
+            test_db_session, TechnicalIndicator, [], conflict_columns=('stock_id', 'date')
+        ) == 0
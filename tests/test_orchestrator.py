@@ -0,0 +1,67 @@
+"""
+Unit tests for the orchestrator configuration and scheduled jobs.
+"""
+from unittest.mock import MagicMock
+
+from services.backtesting import data_loader
+from services.data_collector import main as data_collector_main
+from services.orchestrator import scheduler
+from services.orchestrator.config import OrchestratorConfig
+from services.orchestrator.scheduler import TradingOrchestrator
+from shared.database import partitions
+
+
+class TestOrchestratorConfig:
+    """Test suite for OrchestratorConfig."""
+
+    def test_reads_prefixed_environment(self, monkeypatch):
+        """Test ORCHESTRATOR_* variables override the defaults."""
+        monkeypatch.setenv('ORCHESTRATOR_PARQUET_EXPORT_PATH', '/data/backtest')
+
+        assert OrchestratorConfig().parquet_export_path == '/data/backtest'
+
+    def test_export_disabled_by_default(self, monkeypatch):
+        """Test the Parquet export is off when the variable is unset."""
+        monkeypatch.delenv('ORCHESTRATOR_PARQUET_EXPORT_PATH', raising=False)
+
+        assert OrchestratorConfig().parquet_export_path is None
+
+
+class TestBacktestExport:
+    """Test suite for the Parquet export step of the indicator job."""
+
+    def test_export_failure_is_logged(self, monkeypatch, caplog):
+        """Test a failed export is logged instead of raised."""
+        def fail(session, path):
+            raise IOError("disk full")
+
+        monkeypatch.setattr(data_loader, 'export_to_parquet', fail)
+        monkeypatch.setattr(scheduler, 'SessionLocal', MagicMock())
+        orchestrator = TradingOrchestrator(OrchestratorConfig(parquet_export_path='/data/backtest'))
+
+        orchestrator._export_backtest_datasets()
+
+        assert 'Error exporting backtest datasets: disk full' in caplog.text
+
+
+class TestDataCollectionJob:
+    """Test suite for the daily data collection job."""
+
+    def test_partition_failure_does_not_stop_collection(self, monkeypatch, caplog):
+        """Test prices are still collected when creating partitions fails."""
+        def fail(session):
+            raise RuntimeError("lock timeout")
+
+        service = MagicMock()
+        service.collect_prices_for_all_stocks.return_value = {
+            'successful': 1, 'total_stocks': 1, 'total_records': 1
+        }
+        service.collect_fundamentals_for_all_stocks.return_value = {'successful': 1, 'total_stocks': 1}
+        monkeypatch.setattr(partitions, 'ensure_future_partitions', fail)
+        monkeypatch.setattr(data_collector_main, 'DataCollectorService', lambda enable_scheduler: service)
+        monkeypatch.setattr(scheduler, 'SessionLocal', MagicMock())
+
+        TradingOrchestrator(OrchestratorConfig())._run_data_collection()
+
+        assert 'Error creating future partitions: lock timeout' in caplog.text
+        service.collect_prices_for_all_stocks.assert_called_once()
@@ -100,9 +100,6 @@ class TestOrderExecutor:
             quantity=100,
             avg_price=Decimal('70000'),
             current_price=Decimal('75000'),
-            invested_amount=7000000,
-            unrealized_pnl=500000,
-            unrealized_pnl_pct=7.14,
             realized_pnl=0,
             total_commission=1050,
             total_tax=16100,
@@ -9,6 +9,7 @@ from services.stability_calculator.stability_calculator import (
     StabilityCalculator,
     StabilityMetrics
 )
+from shared.database.models import StabilityScore
 
 
 class TestStabilityCalculator:
@@ -323,3 +324,28 @@ class TestStabilityCalculator:
         assert volatility is not None
         assert volatility == 0.0  # No volatility
         assert score == 100.0  # Perfect stability
+
+    def test_flat_stock_correlation_not_stored(self, calculator):
+        """Test that the NaN correlation of a constant price series is not packed into details."""
+        np.random.seed(42)
+        market_prices = [100 + i * 0.1 + np.random.normal(0, 0.5) for i in range(100)]
+        stock_prices = [100.0] * 100
+
+        beta, score, correlation = calculator.calculate_beta(stock_prices, market_prices)
+
+        assert np.isnan(correlation)
+
+        row = StabilityScore.pack_details({
+            'stock_id': 1,
+            'stability_score': 80.0,
+            'beta': beta,
+            'market_correlation': correlation,
+            'returns_std': float('inf'),
+        })
+
+        assert row['details'] == {'beta': beta}
+
+        stability = StabilityScore(stock_id=1)
+        stability.market_correlation = correlation
+        assert stability.market_correlation is None
+        assert stability.details is None
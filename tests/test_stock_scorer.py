@@ -8,6 +8,9 @@ import numpy as np
 from datetime import datetime
 
 from services.stock_scorer.stock_scorer import StockScorer, ScoreMetrics
+from services.stock_scorer.score_repository import ScoreDataRepository
+from services.stock_scorer.score_service import ScoreService
+from shared.database.models import CompositeScore, Stock, Watchlist
 
 
 class TestStockScorer:
@@ -509,5 +512,135 @@ class TestScoreMetrics:
         assert metrics.weight_momentum == 0.25
 
 
+class TestScoreDataRepository:
+    """Test score persistence."""
+
+    def test_save_composite_scores_replaces_same_date(self, test_db_session, sample_stock):
+        """Test bulk save inserts new rows and replaces rows for the same stock and date."""
+        repository = ScoreDataRepository(test_db_session)
+        first_date = datetime(2024, 1, 2)
+        second_date = datetime(2024, 1, 3)
+
+        assert repository.save_composite_scores([
+            {'stock_id': sample_stock.id, 'date': first_date, 'composite_score': 50.0},
+            {'stock_id': sample_stock.id, 'date': second_date, 'composite_score': 60.0},
+        ])
+        assert repository.save_composite_scores([
+            {'stock_id': sample_stock.id, 'date': second_date, 'composite_score': 70.0},
+        ])
+
+        scores = (
+            test_db_session.query(CompositeScore)
+            .order_by(CompositeScore.date)
+            .all()
+        )
+        assert [score.composite_score for score in scores] == [50.0, 70.0]
+
+    def test_save_composite_scores_drops_non_finite_details(self, test_db_session, sample_stock):
+        """Test NaN and infinite breakdown scores are left out of details."""
+        repository = ScoreDataRepository(test_db_session)
+
+        assert repository.save_composite_scores([{
+            'stock_id': sample_stock.id,
+            'date': datetime(2024, 1, 2),
+            'composite_score': 50.0,
+            'per_score': 40.0,
+            'rsi_score': float('nan'),
+            'macd_score': float('inf'),
+        }])
+
+        score = test_db_session.query(CompositeScore).one()
+        assert score.details == {'per_score': 40.0}
+        assert score.rsi_score is None
+
+    def test_calculate_percentile_ranks(self, test_db_session):
+        """Test percentile ranks are computed per date and ties share a rank."""
+        stocks = [Stock(ticker=f'00000{i}', name_kr=f'종목{i}', market='KOSPI') for i in range(4)]
+        test_db_session.add_all(stocks)
+        test_db_session.commit()
+
+        repository = ScoreDataRepository(test_db_session)
+        rank_date = datetime(2024, 1, 3)
+        assert repository.save_composite_scores([
+            {'stock_id': stock.id, 'date': rank_date, 'composite_score': value}
+            for stock, value in zip(stocks, [10.0, 30.0, 30.0, 50.0])
+        ])
+        assert repository.save_composite_scores([
+            {'stock_id': stocks[0].id, 'date': datetime(2024, 1, 2), 'composite_score': 90.0},
+        ])
+
+        assert repository.calculate_percentile_ranks(rank_date)
+
+        test_db_session.expire_all()
+        scores = (
+            test_db_session.query(CompositeScore)
+            .order_by(CompositeScore.date, CompositeScore.composite_score)
+            .all()
+        )
+        assert [score.percentile_rank for score in scores] == [None, 25.0, 75.0, 75.0, 100.0]
+
+
+class TestScoreService:
+    """Test score service workflows over the database."""
+
+    def test_add_top_stocks_to_watchlist_batch(self, test_db_session):
+        """Test the batch adds new entries, updates active ones and tolerates missing ranks."""
+        stocks = [Stock(ticker=f'00000{i}', name_kr=f'종목{i}', market='KOSPI') for i in range(2)]
+        test_db_session.add_all(stocks)
+        test_db_session.commit()
+
+        score_date = datetime(2024, 1, 2)
+        test_db_session.add_all([
+            CompositeScore(stock_id=stocks[0].id, date=score_date, composite_score=80.0, percentile_rank=100.0),
+            # Not ranked yet
+            CompositeScore(stock_id=stocks[1].id, date=score_date, composite_score=70.0),
+        ])
+        existing = Watchlist(
+            stock_id=stocks[0].id,
+            user_id='user1',
+            ticker=stocks[0].ticker,
+            score=50.0,
+            is_active=True,
+            updated_at=datetime(2020, 1, 1),
+        )
+        test_db_session.add(existing)
+        test_db_session.commit()
+
+        service = ScoreService(test_db_session)
+        results = service.add_top_stocks_to_watchlist('user1', limit=10, min_score=None)
+
+        assert results['added'] == 2
+        assert results['failed'] == 0
+
+        test_db_session.expire_all()
+        entries = (
+            test_db_session.query(Watchlist)
+            .filter(Watchlist.user_id == 'user1')
+            .order_by(Watchlist.stock_id)
+            .all()
+        )
+        assert [entry.score for entry in entries] == [80.0, 70.0]
+        assert entries[0].id == existing.id
+        assert entries[0].updated_at > datetime(2020, 1, 1)
+        assert 'Percentile: 100%' in entries[0].reason
+        assert 'Percentile: n/a' in entries[1].reason
+
+    def test_failed_save_counts_stocks_as_failed(self, test_db_session, sample_stock, monkeypatch):
+        """Test scores that could not be saved are reported as failures and not ranked."""
+        service = ScoreService(test_db_session)
+        monkeypatch.setattr(service, 'calculate_score_for_stock', lambda stock_id, save: ScoreMetrics())
+        monkeypatch.setattr(service.repository, 'save_composite_scores', lambda rows: False)
+        ranked = []
+        monkeypatch.setattr(service.repository, 'calculate_percentile_ranks', lambda: ranked.append(True))
+
+        results = service.calculate_scores_for_all_stocks()
+
+        assert results['successful'] == 0
+        assert results['failed'] == 1
+        assert results['scores'] == []
+        assert results['errors'][0]['ticker'] == sample_stock.ticker
+        assert ranked == []
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -8,9 +8,10 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from shared.database.models import (
-    Base, Stock, StockPrice, FundamentalIndicator, StabilityScore
+    Base, Stock, StockPrice, FundamentalIndicator, StabilityScore, StockLatestMetrics
 )
 from shared.configs.config import Settings
+from shared.database.latest_metrics import refresh_if_stale, refresh_latest_metrics
 from services.stock_screener.screening_engine import (
     StockScreeningEngine,
     ScreeningCriteria,
@@ -413,6 +414,13 @@ def undervalued_stock(db_session):
     return stock
 
 
+def _screening_engine(db_session, settings):
+    """Refresh stock_latest_metrics and create an engine over it."""
+    refresh_latest_metrics(db_session)
+    db_session.commit()
+    return StockScreeningEngine(db_session, settings)
+
+
 class TestStockScreeningEngine:
     """Test cases for StockScreeningEngine."""
 
@@ -426,7 +434,7 @@ class TestStockScreeningEngine:
         self, db_session, settings, sample_stock_with_data
     ):
         """Test screening with default criteria."""
-        engine = StockScreeningEngine(db_session, settings)
+        engine = _screening_engine(db_session, settings)
         results = engine.screen_stocks()
 
         assert isinstance(results, list)
@@ -437,7 +445,7 @@ class TestStockScreeningEngine:
         self, db_session, settings, sample_stock_with_data, high_volatility_stock
     ):
         """Test filtering out high volatility stocks."""
-        engine = StockScreeningEngine(db_session, settings)
+        engine = _screening_engine(db_session, settings)
         criteria = ScreeningCriteria(max_volatility_pct=40.0)
         results = engine.screen_stocks(criteria)
 
@@ -450,7 +458,7 @@ class TestStockScreeningEngine:
         self, db_session, settings, sample_stock_with_data, overvalued_stock
     ):
         """Test filtering out overvalued stocks."""
-        engine = StockScreeningEngine(db_session, settings)
+        engine = _screening_engine(db_session, settings)
         criteria = ScreeningCriteria(max_per=50.0, max_pbr=5.0)
         results = engine.screen_stocks(criteria)
 
@@ -463,7 +471,7 @@ class TestStockScreeningEngine:
         self, db_session, settings, sample_stock_with_data, unstable_company
     ):
         """Test filtering out unstable companies."""
-        engine = StockScreeningEngine(db_session, settings)
+        engine = _screening_engine(db_session, settings)
         criteria = ScreeningCriteria(max_debt_ratio_pct=200.0)
         results = engine.screen_stocks(criteria)
 
@@ -476,7 +484,7 @@ class TestStockScreeningEngine:
         self, db_session, settings, sample_stock_with_data, low_liquidity_stock
     ):
         """Test filtering out low liquidity stocks."""
-        engine = StockScreeningEngine(db_session, settings)
+        engine = _screening_engine(db_session, settings)
         criteria = ScreeningCriteria(
             min_avg_volume=100000,
             min_trading_value=100000000.0
@@ -492,7 +500,7 @@ class TestStockScreeningEngine:
         self, db_session, settings, sample_stock_with_data, undervalued_stock
     ):
         """Test identifying undervalued stocks."""
-        engine = StockScreeningEngine(db_session, settings)
+        engine = _screening_engine(db_session, settings)
         results = engine.identify_undervalued_stocks()
 
         # Find undervalued stock
@@ -514,7 +522,7 @@ class TestStockScreeningEngine:
         low_liquidity_stock
     ):
         """Test applying all filters together."""
-        engine = StockScreeningEngine(db_session, settings)
+        engine = _screening_engine(db_session, settings)
         criteria = ScreeningCriteria(
             max_volatility_pct=40.0,
             max_per=50.0,
@@ -531,7 +539,7 @@ class TestStockScreeningEngine:
 
     def test_market_filter(self, db_session, settings, sample_stock_with_data):
         """Test filtering by market."""
-        engine = StockScreeningEngine(db_session, settings)
+        engine = _screening_engine(db_session, settings)
 
         # Filter for KOSPI only
         criteria = ScreeningCriteria(markets=['KOSPI'])
@@ -547,7 +555,7 @@ class TestStockScreeningEngine:
         self, db_session, settings, sample_stock_with_data
     ):
         """Test that screening result has correct structure."""
-        engine = StockScreeningEngine(db_session, settings)
+        engine = _screening_engine(db_session, settings)
         results = engine.screen_stocks()
 
         assert len(results) > 0
@@ -573,7 +581,7 @@ class TestStockScreeningEngine:
         undervalued_stock
     ):
         """Test screening summary generation."""
-        engine = StockScreeningEngine(db_session, settings)
+        engine = _screening_engine(db_session, settings)
         results = engine.screen_stocks()
         summary = engine.get_screening_summary(results)
 
@@ -583,9 +591,102 @@ class TestStockScreeningEngine:
         assert 'sectors' in summary
         assert summary['total_stocks'] > 0
 
+    def test_screens_on_latest_fundamentals(
+        self, db_session, settings, sample_stock_with_data
+    ):
+        """Test that a newer fundamental row replaces the screened values."""
+        db_session.add(FundamentalIndicator(
+            stock_id=sample_stock_with_data.id,
+            date=datetime.now() + timedelta(days=1),
+            per=80.0,
+            pbr=1.2,
+            roe=10.0,
+            debt_ratio=50.0
+        ))
+        db_session.commit()
+
+        engine = _screening_engine(db_session, settings)
+        results = engine.screen_stocks(ScreeningCriteria(max_per=50.0))
+
+        assert len(results) == 0
+
+    def test_refreshes_empty_snapshot(
+        self, db_session, settings, sample_stock_with_data
+    ):
+        """Test that screening builds the latest metrics snapshot when it is empty."""
+        engine = StockScreeningEngine(db_session, settings)
+        results = engine.screen_stocks()
+
+        assert [r.ticker for r in results] == ['005930']
+
+    def test_refreshes_snapshot_behind_prices(
+        self, db_session, settings, sample_stock_with_data
+    ):
+        """Test that a snapshot older than the newest price row is refreshed."""
+        engine = _screening_engine(db_session, settings)
+        new_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        db_session.add(StockPrice(
+            stock_id=sample_stock_with_data.id,
+            date=new_date,
+            open=80000,
+            high=81000,
+            low=79000,
+            close=80500,
+            volume=10000000,
+            trading_value=800000000000
+        ))
+        db_session.commit()
+
+        results = engine.screen_stocks()
+
+        metrics = db_session.query(StockLatestMetrics).one()
+        assert metrics.price_date == new_date
+        assert metrics.close == 80500
+        assert len(results) == 1
+
+    def test_current_snapshot_is_not_refreshed(
+        self, db_session, settings, sample_stock_with_data
+    ):
+        """Test that an up-to-date snapshot is left alone."""
+        _screening_engine(db_session, settings)
+
+        assert refresh_if_stale(db_session) == 0
+
+    def test_refreshes_snapshot_behind_fundamentals(
+        self, db_session, settings, sample_stock_with_data
+    ):
+        """Test that new fundamentals refresh the snapshot even without new prices."""
+        engine = _screening_engine(db_session, settings)
+        db_session.add(FundamentalIndicator(
+            stock_id=sample_stock_with_data.id,
+            date=datetime.now() + timedelta(days=1),
+            per=9.0,
+            pbr=1.0,
+            roe=15.0,
+            debt_ratio=50.0,
+            current_ratio=2.0
+        ))
+        db_session.commit()
+
+        engine.screen_stocks()
+
+        assert db_session.query(StockLatestMetrics).one().per == 9.0
+
+    def test_refreshes_snapshot_for_new_stock(
+        self, db_session, settings, sample_stock_with_data, request
+    ):
+        """Test that a stock whose prices predate the snapshot still gets a row."""
+        engine = _screening_engine(db_session, settings)
+        new_stock = request.getfixturevalue('high_volatility_stock')
+
+        engine.screen_stocks()
+
+        stock_ids = {m.stock_id for m in db_session.query(StockLatestMetrics)}
+        assert stock_ids == {sample_stock_with_data.id, new_stock.id}
+
     def test_no_data_filtering(self, db_session, settings, sample_stock):
         """Test that stocks without data are filtered out."""
-        engine = StockScreeningEngine(db_session, settings)
+        engine = _screening_engine(db_session, settings)
         results = engine.screen_stocks()
 
         # Stock without price/fundamental data should not appear
@@ -610,7 +711,7 @@ class TestStockScreeningEngine:
             db_session.add(price)
         db_session.commit()
 
-        engine = StockScreeningEngine(db_session, settings)
+        engine = _screening_engine(db_session, settings)
         criteria = ScreeningCriteria(min_price_history_days=60)
         results = engine.screen_stocks(criteria)
 
@@ -19,6 +19,9 @@ from services.indicator_calculator.technical_calculator import (
     TechnicalIndicatorCalculator,
     TechnicalIndicatorData
 )
+from services.indicator_calculator.technical_repository import TechnicalDataRepository
+from services.indicator_calculator.technical_service import TechnicalIndicatorService
+from shared.database.models import TechnicalIndicator
 
 
 @pytest.fixture
@@ -500,3 +503,45 @@ class TestHelperMethods:
         """Test safe int conversion with NaN."""
         result = calculator._safe_int(np.nan)
         assert result is None
+
+
+class TestTechnicalIndicatorService:
+    """Test suite for the batch indicator service."""
+
+    def test_failed_save_counts_stocks_as_failed(
+        self, test_db_session, sample_stock, sample_stock_prices, monkeypatch
+    ):
+        """Test indicators that could not be saved are reported as failures."""
+        service = TechnicalIndicatorService(test_db_session)
+        monkeypatch.setattr(
+            service, 'calculate_indicators_for_stock',
+            lambda stock_id, days_history, calculation_date, save_to_db: TechnicalIndicatorData()
+        )
+        monkeypatch.setattr(TechnicalDataRepository, 'save_technical_indicators_batch', lambda self, rows: False)
+
+        summary = service.calculate_indicators_for_all_stocks()
+
+        assert summary['successful'] == 0
+        assert summary['failed'] == 1
+        assert summary['errors'] == [
+            {'ticker': sample_stock.ticker, 'error': 'Failed to save technical indicators'}
+        ]
+
+
+class TestTechnicalDataRepository:
+    """Test suite for saving technical indicators."""
+
+    def test_save_twice_on_same_day_keeps_one_row(self, test_db_session, sample_stock):
+        """Test a second save on the same day updates the row instead of adding one."""
+        repository = TechnicalDataRepository(test_db_session)
+
+        assert repository.save_technical_indicators(
+            sample_stock.id, {'rsi_14': 50.0}, datetime(2024, 1, 2, 9, 30)
+        )
+        assert repository.save_technical_indicators(
+            sample_stock.id, {'rsi_14': 60.0}, datetime(2024, 1, 2, 15, 45)
+        )
+
+        test_db_session.expire_all()
+        rows = test_db_session.query(TechnicalIndicator).all()
+        assert [(row.date, row.rsi_14) for row in rows] == [(datetime(2024, 1, 2), 60.0)]